@@ -7,6 +7,7 @@ import re
 import traceback
 
 import aoc
+from aoclib import memo
 
 
 class Bag_:
@@ -178,27 +179,6 @@ class Bag:
             bag = BAGS[inner_bag.name]
             bag.add_parent(self)
 
-    def check_for_shiny_gold(self, BAGS):
-        if self.contains_shiny_gold:
-            return True
-        for inner_bag in self.inner_bags:
-            bag = BAGS[inner_bag.name]
-            if bag.check_for_shiny_gold(BAGS):
-                self.contains_shiny_gold = True
-                return True
-
-        return False
-
-    def sum_bags(self, BAGS):
-        total = 0
-        for inner_bag in self.inner_bags:
-            sum1 = inner_bag.quantity
-            bag = BAGS[inner_bag.name]
-            sum2 = bag.sum_bags(BAGS)
-            sum2 *= inner_bag.quantity
-            total += (sum1 + sum2)
-        return total
-
 
 class InnerBag:
     def __init__(self, name, quantity):
@@ -206,43 +186,86 @@ class InnerBag:
         self.quantity = quantity
 
 
-def main():
-    lines = aoc.loadfile('07.txt')
+def load_data():
+    with open('07.txt', mode='r+') as fp:
+        data = [line.strip() for line in fp.readlines()]
+    return data
 
-    #rules = [Rule_(line) for line in lines]
 
-    # The "database" of bags, a dict keyed on bag name.
-    parsed_lines = [parse_line(line) for line in lines]
+def parse(data):
+    # The regexes are the slow part, the parsed rules are plain dicts.
+    return ([parse_line(line) for line in data if line],)
 
+
+def build_bags(parsed_lines):
+    # The "database" of bags, a dict keyed on bag name.
     bags = [Bag(data) for data in parsed_lines]
     BAGS = {bag.name: bag for bag in bags}
-
-    print(f'Bag count: {len(bags)}')
-
-    lines = []
     for bag in bags:
         bag.build(BAGS)
+    return BAGS
 
-    for bag in bags:
-        lines.extend(bag.print_tree(BAGS))
-    with open('debug.txt', mode='w+') as fp:
-        for row in lines:
-            fp.write(f'{row}\n')
-    print('wrote debug.txt')
+
+def part_1(parsed_lines):
+    BAGS = build_bags(parsed_lines)
+    print(f'Bag count: {len(BAGS)}')
+
+    # Memoized: every bag is asked once per bag that holds it, directly or
+    # not.  The memo lives as long as this part.
+    @memo.memoize
+    def holds_shiny_gold(name):
+        bag = BAGS[name]
+        return bag.contains_shiny_gold or any(
+            holds_shiny_gold(inner_bag.name) for inner_bag in bag.inner_bags
+        )
 
     count = 0
-    for bag in bags:
-        if bag.check_for_shiny_gold(BAGS):
+    for name in BAGS:
+        if holds_shiny_gold(name):
             count += 1
 
     print(f'Bags containing gold: {count}')
+    return count
 
+
+def part_2(parsed_lines):
+    BAGS = build_bags(parsed_lines)
     shiny_gold = BAGS['shiny gold']
 
     lines = shiny_gold.print_tree(BAGS)
     print('\n'.join(lines))
 
-    print(f'{shiny_gold.name} contains {shiny_gold.sum_bags(BAGS)} bags.')
+    # Bags inside a bag, counting each level's own; memoized for this part.
+    @memo.memoize
+    def bags_inside(name):
+        return sum(
+            inner_bag.quantity * (1 + bags_inside(inner_bag.name))
+            for inner_bag in BAGS[name].inner_bags
+        )
+
+    total = bags_inside(shiny_gold.name)
+    print(f'{shiny_gold.name} contains {total} bags.')
+    return total
+
+
+def main():
+    data = load_data()
+
+    #rules = [Rule_(line) for line in lines]
+
+    parsed_lines, = parse(data)
+    BAGS = build_bags(parsed_lines)
+
+    lines = []
+    for bag in BAGS.values():
+        lines.extend(bag.print_tree(BAGS))
+    with open('debug.txt', mode='w+') as fp:
+        for row in lines:
+            fp.write(f'{row}\n')
+    print('wrote debug.txt')
+
+    part_1(parsed_lines)
+    part_2(parsed_lines)
 
 
 if __name__ == '__main__':
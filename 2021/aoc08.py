@@ -196,13 +196,25 @@ def get_number(line):
     return int(number_string)
 
 
+Input = collections.namedtuple('Input', ['signals', 'output'])
+
+
+def parse(lines):
+    input_lines = []
+    for line in lines:
+        signals, output = line.split(' | ')
+        signals = signals.split()
+        output = output.split()
+        input_lines.append((Input(signals, output)))
+    return (input_lines,)
+
+
 def main(lines):
     part_2(lines)
 
 
 if __name__ == '__main__':
     lines = aoc.loadfile('08.txt')
-    input_lines = []
     _lines = [
         'be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe',
         'edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc',
@@ -215,11 +227,5 @@ if __name__ == '__main__':
         'egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb',
         'gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce',
     ]
-    Input = collections.namedtuple('Input', ['signals', 'output'])
-
-    for line in lines:
-        signals, output = line.split(' | ')
-        signals = signals.split()
-        output = output.split()
-        input_lines.append((Input(signals, output)))
+    input_lines, = parse(lines)
     main(input_lines)
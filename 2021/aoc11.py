@@ -8,146 +8,92 @@ import re
 import traceback
 
 import aoc
+from aoclib import automaton, grid
 
 
 # https://adventofcode.com/2021/day/11
 
 
-class Cell:
-    def __init__(self, row=None, col=None, value=None):
-        self.row = row
-        self.col = col
-        self.value = value
-
-    def __str__(self):
-        return f'({self.row}, {self.col}): {self.value}'
-
-    def __repr__(self):
-        return self.__str__()
-
-    @property
-    def id(self):
-        return (self.row, self.col)
-
-    def format_cell(self):
-        s = f'{self.value:>2}'
-        if self.value == 0:
-            return aoc.format(s, "red")
-        else:
-            return s
+def format_value(value):
+    s = f'{value:>2}'
+    if value == 0:
+        return aoc.format(s, "red")
+    else:
+        return s
 
 
 class Grid:
 
     def __init__(self, lines):
         self.lines = lines
-        self.cells = []
-        # Lookup cells by id.
-        self.cell_db = {}
-        for row, line in enumerate(lines):
-            cell_row = []
-            for col, value in enumerate(line):
-                cell = Cell(row=row, col=col, value=int(value))
-                cell_row.append(cell)
-                self.cell_db[cell.id] = cell
-            self.cells.append(cell_row)
-
-        self.MAX_ROWS = len(self.cells)
-        self.MAX_COLS = len(self.cells[0])
-
-        self.populate_neighbors()
+        # Energy levels, one byte per octopus.
+        self.cells = grid.Grid.from_lines(lines, digits=True)
+
+        self.MAX_ROWS = self.cells.height
+        self.MAX_COLS = self.cells.width
 
     def print_grid(self):
         rows = []
-        for i, row in enumerate(self.cells):
-            values = []
-            for cell in row:
-                values.append(cell.format_cell())
-            col = ' '.join(values)
+        for i, row in enumerate(self.cells.rows()):
+            col = ' '.join(format_value(value) for value in row)
             rows.append(f'{i:>02}: {col}')
         print('\n'.join(rows))
 
-    def iterate_cells(self):
-        # Loop over rows, cells as a generator.
-        for row in self.cells:
-            for cell in row:
-                yield cell
-
-    def populate_neighbors(self):
-        # Append a list of neighbors to each cell.
-        for cell in self.iterate_cells():
-            row, col = cell.id
-            moves = [
-                (-1, -1), (-1, 0), (-1, 1),
-                (0, -1), (0, 1),
-                (1, -1), (1, 0), (1, 1),
-            ]
-            neighbors = []
-            for row_delta, col_delta in moves:
-                neighbor_id = (row + row_delta, col + col_delta)
-                neighbor_cell = self.cell_db.get(neighbor_id)
-                if neighbor_cell:
-                    neighbors.append(neighbor_cell)
-
-            cell.neighbors = neighbors
-
     def run(self):
-        # Run the grid.
+        # Run the grid, return the number of flashes this step.
+        if automaton.numpy is not None:
+            return self.run_waves()
+
+        energy = self.cells.cells
+        neighbors = self.cells.neighbors
         # keep track of what we've flashed.
-        marked = {}
-        # keep track of what needs to be flashed.
-        flash_cells = {}
-        # keep track of what the flash count is.
+        flashed = bytearray(len(energy))
         flash_count = 0
 
         # Step one.
-        for cell in self.iterate_cells():
-            cell.value += 1
-
-        # flash a cell.
-        def flash(cell):
-            # Mark the cell so we don't visit it again.
-            marked[cell.id] = cell
-            # Reset the value to 0.
-            cell.value = 0
-            # for every neighbor...
-            for neighbor in cell.neighbors:
-                # skip it if it's marked
-                if neighbor.id in marked:
-                    continue
-
-                # absorb energy.
-                neighbor.value += 1
-
-                # Just crossed the flash threshold, add to the flash list.
-                if neighbor.value == 10:
-                    flash_cells[neighbor.id] = neighbor
+        for index in range(len(energy)):
+            energy[index] += 1
 
         # Queue up all cells that need to flash.
-        for cell in self.iterate_cells():
-            if cell.value >= 10:
-                flash_cells[cell.id] = cell
+        flash_cells = [index for index, value in enumerate(energy) if value >= 10]
 
         # keep flashing cells until we've no more to flash.
         while flash_cells:
-            # FIFO
-            first_key = list(flash_cells.keys())[0]
-            cell = flash_cells.pop(first_key)
+            index = flash_cells.pop()
+            # Mark the cell so we don't visit it again, reset it to 0.
+            flashed[index] = 1
+            energy[index] = 0
             flash_count += 1
-            flash(cell)
-
-        # special case, if all neighbors flashed then i need to flash.
-        unflashed_cells = [c for c in self.iterate_cells() if cell.value > 0]
-        for cell in unflashed_cells:
-            values = [n.value for n in cell.neighbors]
-            # if all my neighbor values sum to 0...
-            if sum(values) == 0:
-                # then i need to flash too.
-                flash_count += 1
-                cell.value = 0
+            # for every neighbor...
+            for neighbor in neighbors(index):
+                # skip it if it's flashed
+                if flashed[neighbor]:
+                    continue
+
+                # absorb energy.
+                energy[neighbor] += 1
+
+                # Just crossed the flash threshold, add to the flash list.
+                if energy[neighbor] == 10:
+                    flash_cells.append(neighbor)
 
         return flash_count
 
+    def run_waves(self):
+        # Same step, but every octopus over the threshold flashes at once and
+        # the whole board absorbs that wave in one shifted sum.
+        energy = self.cells.to_numpy()
+        energy += 1
+        flashed = automaton.numpy.zeros(energy.shape, dtype=bool)
+        while True:
+            flashing = (energy >= 10) & ~flashed
+            if not flashing.any():
+                break
+            flashed |= flashing
+            energy += automaton.shifted_sum(flashing)
+        energy[flashed] = 0
+        return int(flashed.sum())
+
 
 def part_1(input_lines):
     grid = Grid(input_lines)
@@ -166,6 +112,7 @@ def part_1(input_lines):
             print()
 
     print('flash count', flash_count)
+    return flash_count
 
 
 def part_2(input_lines):
@@ -182,7 +129,7 @@ def part_2(input_lines):
             print()
         if flashes == 100:
             print(f'flashes == 100 in round {round}')
-            break
+            return round
 
 
 def main(input_lines):
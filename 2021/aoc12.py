@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
 import collections
+import itertools
 import math
 import pathlib
 import pprint
 import re
+import string
 import traceback
 
 import aoc
+from aoclib import counters
 
 
 # https://adventofcode.com/2021/day/12
@@ -74,6 +77,8 @@ class Graph:
         paths = []
 
         def depth_first(node, current_path, visited, depth=0):
+            if counters.ENABLED:
+                counters.add('depth_first.calls')
             # We're here, add us to the path.
             current_path.append(node)
 
@@ -81,6 +86,8 @@ class Graph:
             if node.end:
                 # Copy the current path out to our global.
                 paths.append(list(current_path))
+                if counters.ENABLED:
+                    counters.observe('path.length', len(current_path))
                 current_path.pop()
                 return
 
@@ -117,7 +124,7 @@ class Graph:
 
 
 def part_1(input_lines):
-    graph = Graph.from_input(lines)
+    graph = Graph.from_input(input_lines)
     print('## Graph')
     print('-' * 79)
     print(str(graph))
@@ -128,7 +135,7 @@ def part_1(input_lines):
 
 
 def part_2(input_lines):
-    graph = Graph.from_input(lines)
+    graph = Graph.from_input(input_lines)
     print('## Graph')
     print('-' * 79)
     print(str(graph))
@@ -138,6 +145,39 @@ def part_2(input_lines):
     print('-' * 79)
 
 
+# Sizes for `doit scale`, in small caves.
+SCALE_SIZES = (4, 5, 6, 7, 8)
+
+
+def generate(size, rng):
+    """A cave system with size small caves and a third as many big ones.
+
+    Big caves never connect to each other, or there would be no end of paths.
+    """
+    names = [''.join(pair) for pair in itertools.product(string.ascii_lowercase, repeat=2)]
+    small = rng.sample(names, size)
+    big = [name.upper() for name in rng.sample(names, max(1, size // 3))]
+
+    edges = set()
+
+    def link(a, b):
+        if a != b:
+            edges.add(tuple(sorted((a, b))))
+
+    for cave in small:
+        for other in rng.sample(small + big, 2):
+            link(cave, other)
+    for cave in big:
+        for other in rng.sample(small, min(3, len(small))):
+            link(cave, other)
+    for other in rng.sample(small + big, 2):
+        link('start', other)
+    for other in rng.sample(small + big, 2):
+        link(other, 'end')
+
+    return [f'{a}-{b}' for a, b in sorted(edges)]
+
+
 def main(input_lines):
     #print('Part 1')
     #print('=' * 79)
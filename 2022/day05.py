@@ -86,6 +86,7 @@ def part_1(warehouse, program):
         warehouse.move_9000(instr)
 
     print(f'Part 1: {warehouse.tops()}')
+    return warehouse.tops()
 
 
 def part_2(warehouse, program):
@@ -94,26 +95,35 @@ def part_2(warehouse, program):
         warehouse.move_9001(instr)
 
     print(f'Part 2: {warehouse.tops()}')
+    return warehouse.tops()
+
+
+def load_data():
+    stem = pathlib.Path(__file__).stem
+    # Name your input file after this file.
+    # E.g., day00input.txt
+    with open(f'{stem}input.txt', mode='r+') as fp:
+        # DON'T Strip this data!
+        data = [line for line in fp.readlines()]
+    return data
+
+
+def parse(data):
+    # Each part munges the warehouse, so build a fresh one per call.
+    return Warehouse(data[:8]), Program(data[10:])
 
 
 def main(data):
-    warehouse = Warehouse(data[:8])
-    program = Program(data[10:])
+    warehouse, program = parse(data)
 
     part_1(warehouse, program)
 
     # Need the clean data, not the munged data from part 1.
-    warehouse = Warehouse(data[:8])
+    warehouse, _ = parse(data)
     part_2(warehouse, program)
 
 
 if __name__ == '__main__':
-    stem = pathlib.Path(__file__).stem
-    # Name your input file after this file.
-    # E.g., day00input.txt
-    with open(f'{stem}input.txt', mode='r+') as fp:
-        # DON'T Strip this data!
-        data = [line for line in fp.readlines()]
-
+    data = load_data()
     main(data)
 
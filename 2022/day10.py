@@ -2,12 +2,15 @@
 
 import pathlib
 
+from aoclib import stream, trace
+
 
 class CPU:
     def __init__(self):
         self.cycle = 1
         self.x = 1
-        self.x_values = [1]
+        # Running sum of cycle * x at cycles 20, 60, 100, ...
+        self.signal_total = 0
 
         self.crt = ['.'] * 240
 
@@ -95,27 +98,32 @@ class CPU:
 
     def tick(self):
         self.cycle += 1
-        self.x_values.append(self.x)
+        # x is now the value during the new cycle.
+        if self.cycle % 40 == 20:
+            trace.debug('x during cycle {}: {}', self.cycle, self.x)
+            self.signal_total += self.cycle * self.x
 
     def answer(self):
         print(f'Total Cycles: {self.cycle}')
 
-        #for i, x in enumerate(self.x_values):
-        #    print(f'{i:03d}: {x}')
+        total_value = self.signal_total
+        print(f'Total Value: {total_value}')
+        return total_value
 
-        total_value = 0
-        for i in range(19, len(self.x_values), 40):
-            print(f'self.x_values[{i+1}]: {self.x_values[i]}')
-            total_value += (i+1) * self.x_values[i]
 
-        print(f'Total Value: {total_value}')
+def load_data():
+    stem = pathlib.Path(__file__).stem
+    # Name your input file after this file.
+    # E.g., day00input.txt
+    # Part 1 only keeps a running total, so read the program lazily.
+    return stream.Lines(f'{stem}input.txt')
 
 
 def part_1(data):
     cpu = CPU()
     print('Part 1')
     cpu.part_1(data)
-    cpu.answer()
+    return cpu.answer()
 
 
 def part_2(data):
@@ -147,11 +155,6 @@ def main(data):
 
 
 if __name__ == '__main__':
-    stem = pathlib.Path(__file__).stem
-    # Name your input file after this file.
-    # E.g., day00input.txt
-    with open(f'{stem}input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
-
+    data = load_data()
     main(data)
 
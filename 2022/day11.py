@@ -115,6 +115,13 @@ class Monkey:
     def __str__(self):
         return f'{self.monkey_id}: {self.item_list}'
 
+    def __setstate__(self, state):
+        # Coming back from the parse cache.  Setting attributes one at a time
+        # keeps the compact instance layout that pickle's __dict__.update()
+        # gives up, and attribute lookups are most of the 10,000 round loop.
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def inspect_item(self, worry_level, reduce_worry=lambda x: x, count=True):
         if count:
             self.inspection_count += 1
@@ -177,21 +184,34 @@ class Monkey:
         #print()
 
 
-def part_1(data):
-    compiler = Compiler(data)
-    compiler.compile()
+def part_1(compiler):
     monkey_business = compiler.run(rounds=20, reduce_worry=lambda x: x // 3)
 
     print(f'Part 1: {monkey_business}')
+    return monkey_business
 
 
-def part_2(data):
-    compiler = Compiler(data)
-    compiler.compile()
+def part_2(compiler):
     common_modulus = compiler.common_modulus
     monkey_business = compiler.run(rounds=10000, reduce_worry=lambda x: x % common_modulus)
 
     print(f'Part 2: {monkey_business}')
+    return monkey_business
+
+
+def parse(data):
+    compiler = Compiler(data)
+    compiler.compile()
+    return (compiler,)
+
+
+def load_data():
+    stem = pathlib.Path(__file__).stem
+    # Name your input file after this file.
+    # E.g., day00input.txt
+    with open(f'{stem}input.txt', mode='r+') as fp:
+        data = [line for line in fp.readlines()]
+    return data
 
 
 def main(data):
@@ -224,19 +244,16 @@ def main(data):
         '    If true: throw to monkey 0',
         '    If false: throw to monkey 1',
     ]
-    part_1(data)
+    compiler, = parse(data)
+    part_1(compiler)
     #print()
     #print('='*79)
     #print()
-    part_2(data)
+    compiler, = parse(data)
+    part_2(compiler)
 
 
 if __name__ == '__main__':
-    stem = pathlib.Path(__file__).stem
-    # Name your input file after this file.
-    # E.g., day00input.txt
-    with open(f'{stem}input.txt', mode='r+') as fp:
-        data = [line for line in fp.readlines()]
-
+    data = load_data()
     main(data)
 
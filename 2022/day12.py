@@ -1,187 +1,112 @@
 #!/usr/bin/env python3
 
+import array
 import collections
-import heapq as heap
 import pathlib
 
+from aoclib import counters, grid
+from aoclib.grid import ORTHOGONAL
 
-class Cell:
-    def __init__(self, row, col, height, grid):
-        self.row = row
-        self.col = col
-        self.height = height
-        self.grid = grid
 
-    def __str__(self):
-        return f'({self.row},{self.col}) {self.height}'
+# S is below a, E is above z: S=0, a..z=1..26, E=27.
+HEIGHTS = bytes.maketrans(
+    b'S' + bytes(range(ord('a'), ord('z') + 1)) + b'E',
+    bytes(range(28)),
+)
 
-    @property
-    def node(self):
-        return (self.row, self.col)
+# Distance map value for cells the search never reached.
+UNREACHED = -1
 
 
 class Grid:
-    def __init__(self, data, custom_start=None):
-        self.grid = []
-        self.start = None
-        self.end = None
-        self.path = []
-        self.path_set = set()
-        self.found_paths = []
-
-        for row_i, row in enumerate(data):
-            grid_row = []
-            for col_j, letter in enumerate(row):
-                height = ord(letter) - 96
-                if letter == 'S':
-                    height = 0
-                elif letter == 'E':
-                    height = 27
-
-                cell = Cell(row_i, col_j, height, self)
-
-                if letter == 'S':
-                    self.start = cell
-                elif letter == 'E':
-                    self.end = cell
-                
-                grid_row.append(cell)
-            self.grid.append(grid_row)
-
-        if custom_start:
-            self.start = self.grid[custom_start[0]][custom_start[1]]
-
-        self.row_count = len(self.grid)
-        self.col_count = len(self.grid[0])
-        self.shortest_path_length = self.row_count * self.col_count
-
-        self.visited_count = 0
+    def __init__(self, data):
+        lines = [line for line in data if line]
+        raw = ''.join(lines).encode('ascii').translate(HEIGHTS)
+        self.heights = grid.Grid(len(lines[0]), len(lines), raw)
+
+        self.start = self.heights.find(0)
+        self.end = self.heights.find(27)
+
+        self.row_count = self.heights.height
+        self.col_count = self.heights.width
 
     def __str__(self):
         rows = []
-        for row in self.grid:
-            rows.append(' '.join(f'{cell.height:02}' for cell in row))
+        for row in self.heights.rows():
+            rows.append(' '.join(f'{height:02}' for height in row))
 
         return '\n'.join(rows)
 
     def __repr__(self):
         return f'{self.row_count}x{self.col_count} Grid'
 
-    def neighbors(self, node):
-        row, col = node
-        cell = self.grid[row][col]
-
-        neighbors = []
-
-        up = row - 1
-        down = row + 1
-        left = col - 1
-        right = col + 1
-
-        if 0 <= up <= self.row_count-1:
-            neighbor = self.grid[up][col]
-            if neighbor.height - cell.height <= 1:
-                neighbors.append(neighbor)
-
-        if 0 <= down <= self.row_count-1:
-            neighbor = self.grid[down][col]
-            if neighbor.height - cell.height <= 1:
-                neighbors.append(neighbor)
-
-        if 0 <= left <= self.col_count-1:
-            neighbor = self.grid[row][left]
-            if neighbor.height - cell.height <= 1:
-                neighbors.append(neighbor)
-
-        if 0 <= right <= self.col_count-1:
-            neighbor = self.grid[row][right]
-            if neighbor.height - cell.height <= 1:
-                neighbors.append(neighbor)
-
-        return neighbors
-
-    def print_visited(self, costs):
-        for row_i in range(self.row_count):
-            c = []
-            for col_j in range(self.col_count):
-                if (row_i, col_j) in costs:
-                    c.append('v')
-                else:
-                    c.append('.')
-            print(''.join(c))
-
-    def lowest(self):
-        found = []
+    def print_visited(self, distances):
         for row in range(self.row_count):
-            for col in range(self.col_count):
-                cell = self.grid[row][col]
-                if cell.height == 1:
-                    found.append(cell)
-        return found
+            start = row * self.col_count
+            visited = distances[start:start + self.col_count]
+            print(''.join('.' if d == UNREACHED else 'v' for d in visited))
 
+    def lowest(self):
+        return self.heights.find_all(1)
 
-def dijkstra_search(grid, cell):
-    # Dijkstra Algorithm
-    # Breadth first search, weighting each node as we visit them.
-
-    # We hold a set of nodes we've visited, so we don't walk backwords.
-    visited = set()
 
-    # Parents map will contain:
-    # child_node: parent_node
-    # So given any node, we can ask this dict for it's parent.
-    # That will let us walk back to our Starting Cell, which is *NOT* in this map.
-    parents_map = dict()
+def bfs(grid, sources, reverse=False):
+    """Fewest steps from any of the sources to every cell.
 
-    # Here we keep track of every node's cost from the Starting Cell.
-    node_costs = collections.defaultdict(lambda: 1_000_000)
+    Every step costs 1, so a plain breadth-first queue already visits cells in
+    order of distance; no heap.  Cells that can't be reached are UNREACHED.
 
-    # Staring node costs 0.
-    node_costs[cell.node] = 0
+    With reverse the climb rule is flipped, so the search walks back downhill
+    and the map holds each cell's distance *to* the sources.
+    """
+    heights = grid.heights.cells
+    neighbors = grid.heights.neighbors
+    distances = array.array('l', [UNREACHED]) * len(heights)
 
-    # Push this cost onto the heap.
-    queue = []
-    heap.heappush(queue, (0, cell.node))
+    queue = collections.deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
 
-    # Every edge costs 1.
-    WEIGHT = 1
     while queue:
-        # We always visit the lowest cost node next.
-        _, node = heap.heappop(queue)
-        visited.add(node)
-
-        for neighbor in grid.neighbors(node):
-            if neighbor.node in visited:
+        index = queue.popleft()
+        step = distances[index] + 1
+        height = heights[index]
+        for neighbor in neighbors(index, ORTHOGONAL):
+            if distances[neighbor] != UNREACHED:
                 continue
+            if reverse:
+                climb = height - heights[neighbor]
+            else:
+                climb = heights[neighbor] - height
+            if climb <= 1:
+                distances[neighbor] = step
+                queue.append(neighbor)
 
-            new_cost = node_costs[node] + WEIGHT
-            if node_costs[neighbor.node] > new_cost:
-                parents_map[neighbor.node] = node
-                node_costs[neighbor.node] = new_cost
-                heap.heappush(queue, (new_cost, neighbor.node))
-
-    return parents_map, node_costs
+    if counters.ENABLED:
+        # Every reached cell is pushed and popped exactly once.
+        counters.add('bfs.pops', len(distances) - distances.count(UNREACHED))
+    return distances
 
 
 def part_1(data):
     grid = Grid(data)
     #print(grid)
-    parents, costs = dijkstra_search(grid, grid.start)
-    print(f'Part 1: from {grid.start.node} to {grid.end.node}: {costs[grid.end.node]}')
+    distances = bfs(grid, [grid.start])
+    cost = distances[grid.end]
+    print(f'Part 1: from {grid.heights.coord(grid.start)} to {grid.heights.coord(grid.end)}: {cost}')
+    return cost
 
 
 def part_2(data):
     grid = Grid(data)
-    best = None
-    for cell in grid.lowest():
-        parents, costs = dijkstra_search(grid, cell)
-        cell_cost = costs[grid.end.node]
-        if best is None:
-            best = (cell, cell_cost)
-        elif cell_cost < best[1]:
-            best = (cell, cell_cost)
-
-    print(f'Part 2: from {best[0].node} to {grid.end.node}: {best[1]}')
+    # One search back from the end gives the distance from every start at once.
+    distances = bfs(grid, [grid.end], reverse=True)
+    reachable = [cell for cell in grid.lowest() if distances[cell] != UNREACHED]
+    best = min(reachable, key=lambda cell: distances[cell])
+
+    print(f'Part 2: from {grid.heights.coord(best)} to {grid.heights.coord(grid.end)}: {distances[best]}')
+    return distances[best]
 
 
 def main(data):
@@ -87,19 +87,10 @@ def compare(left, right, indent=0):
     return 0
 
 
-def part_1(data):
+def part_1(packets):
     pairs = []
-    for i in range(0, len(data), 2):
-        debug(f'lines: {len(data)}')
-        debug(f'indexes: {i}, {i+1}')
-        try:
-            pair = Pair(eval(data[i]), eval(data[i+1]))
-            pairs.append(pair)
-        except:
-            traceback.print_exc()
-            print(f'data {i}: {data[i]}')
-            print(f'data {i+1}: {data[i+1]}')
-            raise
+    for i in range(0, len(packets), 2):
+        pairs.append(Pair(packets[i], packets[i+1]))
 
     indexes = []
     for i, pair in enumerate(pairs, start=1):
@@ -112,12 +103,12 @@ def part_1(data):
 
     print(f'Indexes: {indexes}')
     print(f'Part 1: {sum(indexes)}')
+    return sum(indexes)
 
 
-def part_2(data):
-    eval_data = []
-    for i in range(len(data)):
-        eval_data.append(eval(data[i]))
+def part_2(packets):
+    # Divider packets.
+    eval_data = packets + [[[2]], [[6]]]
 
     import functools
     eval_data.sort(key=functools.cmp_to_key(compare))
@@ -130,6 +121,21 @@ def part_2(data):
 
     print(f'Indexes: {indexes}')
     print(f'Part 2: {math.prod(indexes)}')
+    return math.prod(indexes)
+
+
+def parse(data):
+    packets = []
+    for i, row in enumerate(data):
+        if not row:
+            continue
+        try:
+            packets.append(eval(row))
+        except:
+            traceback.print_exc()
+            print(f'data {i}: {row}')
+            raise
+    return (packets,)
 
 
 def main(data):
@@ -158,11 +164,9 @@ def main(data):
         '[1,[2,[3,[4,[5,6,7]]]],8,9]',
         '[1,[2,[3,[4,[5,6,0]]]],8,9]',
     ]
-    data = [row for row in data if row]
-    part_1(data)
-    data.append('[[2]]')
-    data.append('[[6]]')
-    part_2(data)
+    packets, = parse(data)
+    part_1(packets)
+    part_2(packets)
 
 
 if __name__ == '__main__':
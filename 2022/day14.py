@@ -8,6 +8,8 @@ import logging
 import pathlib
 import time
 
+from aoclib import counters
+
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 def debug(message):
@@ -178,6 +180,9 @@ class Map:
                 continue
 
             self.sand_count += 1
+            if counters.ENABLED:
+                counters.add('grains')
+                counters.observe('fall', sand.y)
             if sand.x == 500 and sand.y == 0:
                 print('Sand can no longer fall.')
                 return False
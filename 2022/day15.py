@@ -6,6 +6,8 @@ import logging
 import pathlib
 import re
 
+from aoclib.intervals import IntervalSet
+
 logging.basicConfig(level=logging.ERROR, format='%(message)s')
 
 class Sensor:
@@ -76,7 +78,7 @@ def debug(message):
     log.debug(message)
 
 
-def part_1(data, y):
+def part_1(data, y=2_000_000):
     debug('== Part 1 ==')
     sensors = [Sensor.from_input(row) for row in data]
     for sensor in sensors:
@@ -96,115 +98,87 @@ def part_1(data, y):
     #left = sensor.sensor_x - dy
     #right = sensor.sensor_x + dy
 
-    sensor_ranges_at_y = []
-    print(f'CALCULATING X ranges at y={y}')
-    print('='*79)
-    for sensor in sensors:
-        print(f'Sensor: {sensor}')
-        min_y = sensor.sensor_y - sensor.distance
-        max_y = sensor.sensor_y + sensor.distance
-        print(f'    min, max y: {min_y}, {max_y}')
-        if min_y > y or max_y < y:
-            # max_y is above y, min_y is below y.
-            print(f'    skipping {sensor}, {min_y} and {max_y} ')
-            # skip, our y level is further away than our distance can rea
-            continue
-
-        # We can get to our y level, let's calculate how far we can move left and right.
-        d = sensor.distance
-        dy = abs(sensor.sensor_y - y)
-        remaining_d = sensor.distance - dy
-        print(f'    dy: {dy}')
-        print(f'    remaining_d: {remaining_d}')
-        left = sensor.sensor_x - remaining_d
-        right = sensor.sensor_x + remaining_d
-        print(f'    left: {left}')
-        print(f'    right: {right}')
-        sensor_ranges_at_y.append((left, right, sensor))
-
-    sensor_ranges_at_y.sort(key=lambda t: (t[0], t[1]))
-    print(f'Sorted segments:')
-    for left, right, sensor in sensor_ranges_at_y:
-        print(f'({left}, {right})  {sensor}')
-
-    segments = []
-    current_segment = (sensor_ranges_at_y[0][0], sensor_ranges_at_y[0][1]) 
-    for seg_left, seg_right, sensor in sensor_ranges_at_y[1:]:
-        #print(f'Comparing ({seg_left}, {seg_right}) left to {current_segment}s right')
-        if seg_left <= current_segment[1]:
-            # New segment starts within current segment, make the right side the max of the two.
-            old_segment = current_segment
-            current_segment = (current_segment[0], max(current_segment[1], seg_right))
-            #print(f'   extending {old_segment} to {current_segment}')
-            continue
+    covered = sensor_ranges(sensors, y)
+    print(f'Covered at y={y}: {covered}')
 
-        if seg_left > current_segment[1]:
-            segments.append(current_segment)
-            current_segment = (seg_left, seg_right)
-    
-    print(f'Final segments: {current_segment}, {segments}')
-    range_count = abs(current_segment[0] - current_segment[1]) + 1
-    print(range_count)
+    range_count = covered.size
     for thing in all_things:
-        print('thing', thing)
-        if (thing[1] == y) and (current_segment[0] <= thing[0] <= current_segment[1]):
+        if thing[1] == y and thing[0] in covered:
+            # A beacon or sensor sits here, so it isn't a "no beacon" spot.
             range_count -= 1
 
     print(range_count)
+    return range_count
+
+
+def sensor_ranges(sensors, y):
+    """The x values the sensors cover at row y, as an IntervalSet.
+    """
+    covered = IntervalSet()
+    for sensor in sensors:
+        if sensor.top <= y <= sensor.bottom:
+            # We can get to our y level, calculate how far we can move left and right.
+            dy = abs(sensor.sensor_y - y)
+            covered.add(sensor.left + dy, sensor.right - dy + 1)
+    return covered
+
+
+def boundary_lines(sensors):
+    """The diagonals running just outside each sensor's range.
+
+    Turned 45 degrees, u = x + y and v = x - y, every sensor's diamond is an
+    axis-aligned square.  The distress beacon is the only uncovered spot, so its
+    covered neighbor (x+1, y) sits in some square whose u or v edge is one step
+    away.  That puts the beacon on one of these lines.
+    """
+    rising = set()  # x - y = c
+    falling = set()  # x + y = c
+    for s in sensors:
+        for offset in (-s.distance - 1, s.distance + 1):
+            rising.add(s.sensor_x - s.sensor_y + offset)
+            falling.add(s.sensor_x + s.sensor_y + offset)
+    return sorted(rising), sorted(falling)
+
+
+def uncovered_on_diagonal(sensors, size, c, rising):
+    """x values on one diagonal, inside the search square, that no sensor covers.
+
+    rising is the line x - y = c, otherwise x + y = c.  Along a diagonal each
+    sensor covers a single run of x, so this is an interval problem.
+    """
+    if rising:
+        low, high = max(0, c), min(size, size + c)
+    else:
+        low, high = max(0, c - size), min(size, c)
+    if low > high:
+        return IntervalSet()
+
+    covered = IntervalSet()
+    for s in sensors:
+        # |x - p| + |x - q| <= distance, with q where the line crosses the sensor's row.
+        p = s.sensor_x
+        q = c + s.sensor_y if rising else c - s.sensor_y
+        if abs(p - q) > s.distance:
+            continue
+        covered.add(-((s.distance - p - q) // 2), (p + q + s.distance) // 2 + 1)
+    return covered.complement(low, high + 1)
 
 
-def part_2(data, size):
+def part_2(data, size=4_000_000):
     debug('== Part 2 ==')
-    # Courtesy of:  https://www.youtube.com/watch?v=DtnvoqZZqJ0
     sensors = [Sensor.from_input(row) for row in data]
     #for s in sensors:
     #    print(f'{s.top:2d}, {s.bottom:2d}, {s.left:2d}, {s.right:2d}')
 
-    for Y_LEVEL in range(0, size+1):
-        if (Y_LEVEL % 500000) == 0:
-            print(Y_LEVEL)
-
-        ranges = []
-        for s in sensors:
-            # Test if this sensor is covering this y level.
-            if s.top <= Y_LEVEL and s.bottom >= Y_LEVEL:
-                dy = abs(Y_LEVEL - s.sensor_y)
-                # it is, so add the range it covers at this y level.
-                ranges.append([s.left + dy, s.right - dy])
-
-        #print(f'For {Y_LEVEL}:')
-        #print(f'Ranges: {ranges}')
-        left = 0
-        right = 0
-        # collapse the ranges.
-        while left < len(ranges):
-            while right < len(ranges):
-                if left == right:
-                    continue  # skip self compare
-
-                Lleft, Lright = ranges[left]  # left segment left and right
-                Rleft, Rright = ranges[right]  # right segment left and right
-                # check for overlap
-                #print(f'Comparing {ranges[left]} and {ranges[right]}')
-                # if the rhs of the left segment is bigger than the lhs of the right segment
-                #   read: the left segment sticks into the right
-                # or the rhs of the right segment is bigger than the lhs of the left segment
-                #   read: the right segment sticks into the left
-                if (Lright >= Rleft) and (Rright >= Lleft):
-                    merged = [min(Lleft, Rleft), max(Lright, Rright)]
-                    #print(f'    merged {merged}')
-                    del ranges[max(left, right)]
-                    del ranges[min(left, right)]
-                    ranges.append(merged)
-                    # Reset comparisons to 0
-                    left = 0
-                    right = -1
-                right += 1
-                #print(f'Ranges: {ranges}  Left: {left}  Right {right}')
-            left += 1
-
-        if len(ranges) == 2:
-            print(Y_LEVEL, ranges)
+    # A few hundred diagonals instead of size rows.
+    rising, falling = boundary_lines(sensors)
+    lines = [(c, True) for c in rising] + [(c, False) for c in falling]
+    for c, is_rising in lines:
+        for left, right in uncovered_on_diagonal(sensors, size, c, is_rising):
+            x = left
+            y = x - c if is_rising else c - x
+            print(x, y)
+            return x * 4_000_000 + y
 
 
 def main(data):
@@ -224,9 +198,9 @@ def main(data):
         'Sensor at x=14, y=3: closest beacon is at x=15, y=3',
         'Sensor at x=20, y=1: closest beacon is at x=15, y=3',
     ]
-    #part_1(INPUT, 10)
+    #assert part_1(INPUT, 10) == 26
     #part_1(data, 2_000_000)
-    #part_2(INPUT, 20)
+    #assert part_2(INPUT, 20) == 56000011
     part_2(data, 4000000)
 
 
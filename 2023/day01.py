@@ -7,9 +7,19 @@ import pathlib
 import re
 import string
 
+from aoclib import stream, trace
+
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
 
+def load_data():
+    stem = pathlib.Path(__file__).stem
+    # Name your input file after this file.
+    # E.g., day00-input.txt
+    # One line at a time, the parts only ever keep a running total.
+    return stream.Lines(f'{stem}-input.txt')
+
+
 def debug(message):
     log = logging.getLogger('aoc')
     log.debug(message)
@@ -17,17 +27,19 @@ def debug(message):
 
 def part_1(data):
     debug('== Part 1 ==')
-    numbers = []
+    total = 0
     for line in data:
         digits = [c for c in line if c in string.digits]
         number = int(f'{digits[0]}{digits[-1]}')
-        numbers.append(number)
+        total += number
 
-    print('Answer: ', sum(numbers))
+    print('Answer: ', total)
+    return total
 
 
 def part_2(data):
-    fp = open('output.txt', mode='w')
+    # The line by line walkthrough is only written when debugging.
+    fp = open('output.txt', mode='w') if trace.DEBUG else None
 
     word_map = {
         'oneight': '1 8    ',
@@ -51,7 +63,7 @@ def part_2(data):
     pattern = re.compile('|'.join(word_map.keys()))
 
     debug('== Part 2 ==')
-    numbers = []
+    total = 0
 
     danger = [
         'oneight',
@@ -89,15 +101,18 @@ def part_2(data):
 
         if show:
             print(f'          number:  {number}')
-        numbers.append(number)
-        fp.write(f'{original_line}\n{line} => {number}\n\n')
+        total += number
+        if fp:
+            fp.write(f'{original_line}\n{line} => {number}\n\n')
 
-    print('Answer: ', sum(numbers))
+    if fp:
+        fp.close()
+    print('Answer: ', total)
+    return total
 
 
 def part_2_alternate(data):
     # Be clever with string replacement due to the unclear compound word requirements.
-    fp = open('output.txt', mode='w')
 
     word_map = {
         'one': 'o1e',
@@ -113,7 +128,7 @@ def part_2_alternate(data):
     pattern = re.compile('|'.join(word_map.keys()))
 
     debug('== Part 2 Alternate ==')
-    numbers = []
+    total = 0
 
     for line in data:
         original_line = line
@@ -123,9 +138,10 @@ def part_2_alternate(data):
         digits = [c for c in line if c in string.digits]
         number = int(f'{digits[0]}{digits[-1]}')
 
-        numbers.append(number)
+        total += number
 
-    print('Answer: ', sum(numbers))
+    print('Answer: ', total)
+    return total
 
 
 def main(data):
@@ -149,10 +165,5 @@ def main(data):
 
 
 if __name__ == '__main__':
-    stem = pathlib.Path(__file__).stem
-    # Name your input file after this file.
-    # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
-
+    data = load_data()
     main(data)
@@ -7,6 +7,7 @@ import pathlib
 import re
 
 import utils
+from aoclib import grid, trace
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -17,20 +18,21 @@ def debug(message):
     log.debug(message)
 
 
+NOT_SYMBOLS = frozenset(b'0123456789.')
+GEAR = ord('*')
+
+
 class Schematic:
     def __init__(self, data):
         self.data = data
-        self.width = len(data[0])
-        self.height = len(data)
+        self.grid = grid.Grid.from_lines(data)
+        self.width = self.grid.width
+        self.height = self.grid.height
 
         part_pattern = re.compile('\d+')
         self.matches = [(i, list(part_pattern.finditer(row))) for i, row in enumerate(data)]
 
-        self.gears = []
-        for row, line in enumerate(data):
-            for col, char in enumerate(line):
-                if char == '*':
-                    self.gears.append((row, col))
+        self.gears = [self.grid.coord(index) for index in self.grid.find_all(GEAR)]
 
     def print(self):
         for row in self.matches:
@@ -49,7 +51,9 @@ class Schematic:
 
         cells = []
         left_right_range = list(range(max(0, left-1), min(self.width-1, right+1)))
-        print(f'match: {match.group()}, row number: {row_number}, ({left}, {right}), range {left_right_range}')
+        if trace.TRACE:
+            trace.trace('match: {}, row number: {}, ({}, {}), range {}',
+                        match.group(), row_number, left, right, left_right_range)
         # Above
         if row_number > 0:
             cells.extend(
@@ -76,21 +80,23 @@ class Schematic:
         return cells
 
     def part1(self):
-        self.print()
+        if trace.DEBUG:
+            self.print()
         parts = []
         for row_number, matches in self.matches:
             for match in matches:
                 neighbors = self.neighbors(row_number, match)
                 for row, col in neighbors:
-                    cell = self.data[row][col]
+                    cell = self.grid[row, col]
                     #print(f'match: {match.group()}, row number: {row_number}, ({row}, {col}), cell: {cell}')
-                    if cell not in '0123456789.':
+                    if cell not in NOT_SYMBOLS:
                         parts.append(match)
                         break
 
         #print(parts)
         total = sum([int(m.group()) for m in parts])
         print('Answer', total)
+        return total
 
     def part2(self):
         #print(self.gears)
@@ -101,18 +107,19 @@ class Schematic:
             for match in matches:
                 neighbors = self.neighbors(row_number, match)
                 for row, col in neighbors:
-                    cell = self.data[row][col]
+                    cell = self.grid[row, col]
                     # If the part is next to a gear, add it to the gear's list.
-                    if cell == '*':
+                    if cell == GEAR:
                         gears[(row, col)].append(match)
 
         total = 0
-        print(gears)
+        trace.debug('{}', gears)
         for gear, parts in gears.items():
             if len(parts) == 2:
                 total += (int(parts[0].group()) * int(parts[1].group()))
 
         print('Answer:', total)
+        return total
 
 
 def part_1(data):
@@ -130,7 +137,7 @@ def part_1(data):
         '.664.598..',
     ]
     schematic = Schematic(data)
-    schematic.part1()
+    return schematic.part1()
 
 
 def part_2(data):
@@ -149,7 +156,7 @@ def part_2(data):
     debug('== Part 2 ==')
 
     schematic = Schematic(data)
-    schematic.part2()
+    return schematic.part2()
 
 
 def main(data):
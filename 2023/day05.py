@@ -5,6 +5,9 @@ import math
 import logging
 import pathlib
 
+from aoclib import trace
+from aoclib.intervals import IntervalSet
+
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
 class Map:
@@ -48,9 +51,9 @@ class Almanac:
                 section = []
                 sections.append(section)
 
-        for section in sections:
-            print(section)
-            print()
+        if trace.DEBUG:
+            for section in sections:
+                trace.debug('{}\n', section)
 
         seeds_section = sections[0]
         self.seeds = [int(seed) for seed in seeds_section[0][7:].split()]
@@ -88,7 +91,7 @@ class Almanac:
             hum = self.temp_hum_map.lookup(temp)
             loc = self.hum_loc_map.lookup(hum)
             locations.append(loc)
-            print(f'seed:{seed} => location:{loc}')
+            trace.debug('seed:{} => location:{}', seed, loc)
 
         return min(locations)
 
@@ -112,129 +115,69 @@ def part_1(data):
     book = Almanac(data)
     location = book.part1()
     print('Answer:', location)
+    return location
 
 
 def part_2(data):
     p('== Part 2 ==')
     # https://www.youtube.com/watch?v=NmxHw_bHhGM
-
-    stem = pathlib.Path(__file__).stem
-    # Name your input file after this file.
-    # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        inputs, *sections = fp.read().split('\n\n')
+    inputs, *sections = '\n'.join(data).split('\n\n')
 
     # seeds: 79 14 55 13
     inputs = list(map(int, inputs.split(':')[1].split()))
-    # numbers (start, range) tuples.
-    # [79, 14, 55, 13]
-    seeds = []
-    # Pair up the left and size to get full range.
-    for index in range(0, len(inputs), 2):
-        # Create the ranges, (left, right).
-        left = inputs[index]
-        size = inputs[index+1]
-        right = left + size
-        seeds.append((left, right))
+    # Pair up the left and size to get full range, (left, right) half-open.
     # (79, 93), (55, 68)
-
-    print(f'{len(seeds)} Seed ranges need transforming.')
-    for seed in seeds:
-        print(f'  {seed}')
+    seeds = IntervalSet(
+        (inputs[index], inputs[index] + inputs[index + 1])
+        for index in range(0, len(inputs), 2)
+    )
+
+    trace.info('{} Seed ranges need transforming.', len(seeds))
+    if trace.DEBUG:
+        for seed in seeds:
+            trace.debug('  {}', seed)
     # Blocks are all the sections of mappings.
     for section in sections:
-        section_rules = []
         # each block is a set of map rules from the file.
         #   seed-to-soil-map:
         #   50 98 2
-        # drop the first line (section name), then map each line to a list of ints.
         lines = section.splitlines()
-        print('='*79)
-        print(f'= SECTION {lines[0]}')
-        print('-'*79)
-        for line in lines[1:]:
-            section_rules.append(list(map(int, line.split())))
-        # [[50, 98, 2], [52, 50, 48]]
-
-        # "seeds" is the source ranges we need to transform.
-        # build a new range list from that source.
-        transformed_ranges = []
-        while seeds:
-            # we will pop one range every loop.
-            # we will add to seeds as we run through the blocks.
-            start, end = seeds.pop()
-            print(f'=== SEED {start} {end}')
-
-            for dest, source, size in section_rules:
-                # The position tranform the mapping defines.
-                # E.g., 52 50 means +2, 50 98 means -48
-                transform = dest - source
-                print(f'Section Rule: ({source}, {source+size}) {transform} / {dest} {source} {size}')
-
-                # Given a seed range, and a mapping rule,
-                # Determine if there is an overlap.
-                # E.g.,
-                #                [55 56 57 58 59 60 61 62 63 64 65 66 67 68]  seed range
-                # [50 51 52 53 54 55 56 57 58 59 60 61 62 63 64 65 66 67 68 ... 98]  52 50 48 transform
-                #
-                # Given the overlap, we need to generate a new transformed range in the soil values.
-                # [55+transform ... 68+transform]
-                # [57 58 59 60 61 62 63 64 65 66 67 68 69 70]
-                # 
-                # if we had seed range that wasn't mapped (left of overlap start or right of overlap end)
-                # we would add them back to seeds in case they get transformed by a subsequent mapping rule.
-
-                overlap_start = max(start, source)
-                overlap_end = min(end, source + size)
-                if overlap_start < overlap_end:
-                    print(f'  Seed / Rule Overlap: {overlap_start} {overlap_end}')
-                    # Place the overlap range into new_ranges.
-                    #new_ranges.append((overlap_start + transform, overlap_end + transform))
-                    transformed_range = (overlap_start + transform, overlap_end + transform)
-                    print(f'  Transformed Seed Range: {transformed_range}')
-                    transformed_ranges.append(transformed_range)
-                    # any seed range not transformed goes back into seeds list, as later transforms
-                    # may apply to them.
-                    if overlap_start > start:
-                        print(f'  Adding untransformed ({start}, {overlap_start}) back to seeds list.')
-                        seeds.append((start, overlap_start))
-                    if end > overlap_end:
-                        print(f'  Adding untransformed ({overlap_end}, {end}) back to seeds list.')
-                        seeds.append((overlap_end, end))
-
-                    # Done transforming ranges and adding back un-transformed.
-                    # Back to the top of the loop.
-                    print('  Seed range transformed, move to next seed.')
-                    print('.'*79)
-                    break
-
-                else:
-                    print('...no overlap, skipping.')
-
-            else:
-                # probably don't need this as "else".
-                print(f'No rules apply, adding ({start}, {end}) to transformed ranges.')
-                transformed_ranges.append((start, end))
-
-        seeds = transformed_ranges
-        print(f'= SECTION {lines[0]} complete.')
-        print('Seed values are now:')
-        for r in sorted(seeds):
-            print(f'  {r}')
-        print('-'*79)
-
+        trace.debug('=' * 79)
+        trace.debug('= SECTION {}', lines[0])
+        trace.debug('-' * 79)
 
-    seeds.sort()
-    #print(seeds)
-    answer = min(seeds)[0]
+        transformed = IntervalSet()
+        # Seed values no rule covers keep their value.
+        untouched = seeds.copy()
+        for line in lines[1:]:
+            dest, source, size = map(int, line.split())
+            # The position tranform the mapping defines.
+            # E.g., 52 50 means +2, 50 98 means -48
+            transform = dest - source
+            if trace.TRACE:
+                trace.trace('Section Rule: ({}, {}) {} / {} {} {}', source, source + size, transform, dest, source, size)
+
+            # Whatever part of the seed ranges overlaps the rule moves by the
+            # transform; the rest waits for the other rules.
+            rule = IntervalSet([(source, source + size)])
+            for start, end in seeds & rule:
+                trace.debug('  Seed / Rule Overlap: {} {}', start, end)
+                transformed.add(start + transform, end + transform)
+            untouched.remove(source, source + size)
+
+        seeds = transformed | untouched
+        if trace.DEBUG:
+            trace.debug('= SECTION {} complete.', lines[0])
+            trace.debug('Seed values are now:')
+            for r in seeds:
+                trace.debug('  {}', r)
+            trace.debug('-' * 79)
+
+    answer = seeds.starts[0]
     print('Answer', answer)
     if answer != 52210644:
         print('WRONG!')
-
-
-
-
-
+    return answer
 
 
 def main(data):
@@ -5,6 +5,8 @@ import math
 import logging
 import pathlib
 
+from aoclib.graph import Graph
+
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
 
@@ -54,6 +56,13 @@ class Map:
             node = Node(row)
             self.nodes[node.name] = node
 
+        # The same nodes as int ids; each one's left is its first edge and
+        # its right the second.
+        self.graph = Graph.from_adjacency({
+            node.name: [node.left, node.right]
+            for node in self.nodes.values()
+        })
+
     def part1(self):
         """Follow the instructions, navigate the tree, until we arrive.
         """
@@ -91,19 +100,22 @@ class Map:
 
         found = []
 
+        # Walk node ids: following a rule is one array lookup, not a string
+        # compare and a dict lookup.
+        graph = self.graph
+        offsets, targets = graph.offsets, graph.targets
+        z_nodes = bytearray(node.is_z_node for node in map(self.nodes.get, graph.names))
+        turns = [0 if rule == 'L' else 1 for rule in self.instructions]
+        current = [graph.id(node.name) for node in current_nodes]
 
-        rules = Instructions(self.instructions)
-        for rule in rules:
+        for turn in Instructions(turns):
             steps += 1
-            #print(f'  Step {steps}: {len(current_nodes)} current nodes.')
-            next_nodes = [
-                self.nodes[node.follow(rule)]  # follow gets me the next name, dict gets me the next node
-                for node in current_nodes
-            ]
+            #print(f'  Step {steps}: {len(current)} current nodes.')
             next_round = []
-            for node in next_nodes:
-                if node.is_z_node:
-                    found.append((node, steps))
+            for node in current:
+                node = targets[offsets[node] + turn]
+                if z_nodes[node]:
+                    found.append((self.nodes[graph.name(node)], steps))
                 else:
                     next_round.append(node)
 
@@ -116,7 +128,7 @@ class Map:
                 lcm = math.lcm(*[answer[1] for answer in found])
                 print(f'Least Common Multiple: {lcm}')
                 return lcm
-            current_nodes = next_round
+            current = next_round
 
 
 def load_data():
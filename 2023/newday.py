@@ -19,8 +19,10 @@ def load_data():
     stem = pathlib.Path(__file__).stem
     # Name your input file after this file.
     # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
+    # Solutions that only walk the input line by line can return
+    # aoclib.stream.Lines(f'{stem}-input.txt') instead and read it lazily.
+    with open(f'{stem}-input.txt') as fp:
+        data = [line.strip() for line in fp]
     return data
 
 
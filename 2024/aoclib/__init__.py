@@ -0,0 +1,33 @@
+"""Shared runtime for the Advent of Code solutions.
+
+The year directories are plain scripts, so this package is what lets `doit`
+find every day, load its input and call its parts without a fresh Python
+process per day.
+
+A solution module takes part when it defines `part_1` and/or `part_2` at module
+level.  Two optional hooks shape how it is called:
+
+    load_data()     Return the input lines.  Called with the year directory as
+                    the working directory, same as running the script.
+    parse(data)     Return a tuple of arguments for the parts.  Without it the
+                    parts are called with the raw lines.
+
+`generate(size, rng)` is a third, for `doit scale`: it returns synthetic input
+lines of a given size (see aoclib.scaling).
+
+Parts return their answer; a part that only prints reports no answer.
+"""
+from aoclib.catalog import ROOT, Solution, discover, find
+from aoclib.parallel import run_catalog
+from aoclib.runner import PartResult, run_parts
+
+
+__all__ = [
+    'ROOT',
+    'PartResult',
+    'Solution',
+    'discover',
+    'find',
+    'run_catalog',
+    'run_parts',
+]
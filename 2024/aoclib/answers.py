@@ -0,0 +1,100 @@
+"""Remember each part's answer so unchanged days don't run again.
+
+Every clean run of a part is stored with a stamp: a hash of the solution
+module, its year's helper modules, the aoclib sources and the input file.
+`doit run-all` hands back the stored answer for any part whose stamp still
+matches instead of running it; `--force` runs everything regardless.
+
+Days without an input file the catalog can find (a load_data() that reads
+something else) are never skipped, since their input can't be stamped.
+"""
+import hashlib
+import pickle
+import sqlite3
+import time
+
+from aoclib.cache import library_digest
+from aoclib.catalog import STATE_DIR
+from aoclib.runner import MISSING, OK, PartResult
+
+
+ANSWERS_PATH = STATE_DIR / 'answers.sqlite3'
+
+
+def stamp(solution):
+    """Hash of everything a day's answers depend on, or None if it can't tell.
+    """
+    input_path = solution.input_path
+    if input_path is None:
+        return None
+    digest = hashlib.blake2b(solution.code_digest, digest_size=16)
+    digest.update(library_digest())
+    digest.update(input_path.read_bytes())
+    return digest.hexdigest()
+
+
+class AnswerStore:
+    """SQLite table of the latest clean result per part.
+    """
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS answers (
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            stamp TEXT NOT NULL,
+            status TEXT NOT NULL,
+            answer BLOB,
+            seconds REAL NOT NULL,
+            parse_seconds REAL NOT NULL,
+            created REAL NOT NULL,
+            PRIMARY KEY (year, day, part)
+        )
+    '''
+
+    def __init__(self, path=ANSWERS_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(self.SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def lookup(self, year, day, stamp):
+        """Return {part: PartResult} for the parts stored under this stamp.
+        """
+        rows = self.connection.execute(
+            'SELECT * FROM answers WHERE year = ? AND day = ? AND stamp = ?',
+            (year, day, stamp),
+        ).fetchall()
+        found = {}
+        for row in rows:
+            answer = None if row['answer'] is None else pickle.loads(row['answer'])
+            found[row['part']] = PartResult(
+                year, day, row['part'], status=row['status'], answer=answer,
+                seconds=row['seconds'], parse_seconds=row['parse_seconds'], cached=True,
+            )
+        return found
+
+    def record(self, results, stamp):
+        """Store the clean results of one day; errors are left out so they run again.
+        """
+        rows = []
+        for result in results:
+            if result.cached or result.status not in (OK, MISSING):
+                continue
+            try:
+                answer = None if result.answer is None else pickle.dumps(result.answer)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                continue
+            rows.append((
+                result.year, result.day, result.part, stamp, result.status, answer,
+                result.seconds, result.parse_seconds, time.time(),
+            ))
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO answers'
+                ' (year, day, part, stamp, status, answer, seconds, parse_seconds, created)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows,
+            )
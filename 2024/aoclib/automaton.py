@@ -0,0 +1,209 @@
+"""Neighbor counts and cellular-automaton stepping over an aoclib.grid.Grid.
+
+Seating, octopus flashes and paper rolls are all the same loop: count each
+cell's live neighbors, apply a rule, repeat until nothing changes.  Doing that
+per cell in Python, with a fresh neighbor list each time, is what made those
+days slow.
+
+With NumPy the counts for the whole board come from eight shifted slices of a
+padded mask, and the rule is a table lookup over the board.  Without it the
+stepper keeps the counts between generations and only re-evaluates the
+frontier: cells that changed last generation and their neighbors.
+
+    automaton = Automaton(grid, rule, alive=b'#')
+    generations = automaton.run()
+
+rule(value, count) returns the cell's next value.  It is called once per
+(value, count) pair up front to build a lookup table, so it must not depend on
+anything but its arguments.
+"""
+import array
+import unittest
+
+from aoclib import lazy
+from aoclib.grid import ALL, Grid
+
+try:
+    # Imported on first use; the pure Python paths never pay for it.
+    numpy = lazy.module('numpy')
+except ImportError:
+    numpy = None
+
+
+class TestAutomaton(unittest.TestCase):
+    BLINKER = ['.....', '..#..', '..#..', '..#..', '.....']
+
+    @staticmethod
+    def life(value, count):
+        if value == ord('#'):
+            return value if count in (2, 3) else ord('.')
+        return ord('#') if count == 3 else value
+
+    def test_neighbor_counts(self):
+        grid = Grid.from_lines(self.BLINKER)
+        for vectorized in (True, False):
+            if vectorized and numpy is None:
+                continue
+            counts = neighbor_counts(grid, b'#', vectorized=vectorized)
+            self.assertEqual(list(counts.column(1)), [1, 2, 3, 2, 1])
+            self.assertEqual(list(counts.column(2)), [1, 1, 2, 1, 1])
+            self.assertEqual(list(counts.row(2)), [0, 3, 2, 3, 0])
+
+    def test_blinker(self):
+        for incremental in (False, True):
+            if not incremental and numpy is None:
+                continue
+            grid = Grid.from_lines(self.BLINKER)
+            automaton = Automaton(grid, self.life, b'#', incremental=incremental)
+            self.assertEqual(automaton.step(), 4)
+            self.assertEqual(str(grid).splitlines()[2], '.###.')
+            automaton.step()
+            self.assertEqual(grid, Grid.from_lines(self.BLINKER))
+            # A blinker never settles.
+            self.assertEqual(automaton.run(limit=10), 10)
+
+    def test_fixpoint(self):
+        # Cells with fewer than two neighbors die until nothing changes.
+        def erode(value, count):
+            return ord('.') if value == ord('#') and count < 2 else value
+
+        for incremental in (False, True):
+            if not incremental and numpy is None:
+                continue
+            grid = Grid.from_lines(['##..', '##..', '...#'])
+            automaton = Automaton(grid, erode, b'#', incremental=incremental)
+            self.assertEqual(automaton.run(), 1)
+            self.assertEqual(str(grid), '##..\n##..\n....')
+            self.assertEqual(automaton.run(), 0)
+
+
+def shifted_sum(mask, deltas=ALL):
+    """Per-cell count of true neighbors in a 2D boolean array.
+
+    NumPy only.  Cells off the edge count as false.
+    """
+    height, width = mask.shape
+    padded = numpy.zeros((height + 2, width + 2), dtype=numpy.uint8)
+    padded[1:-1, 1:-1] = mask
+    counts = numpy.zeros((height, width), dtype=numpy.uint8)
+    for row_delta, col_delta in deltas:
+        counts += padded[1 + row_delta:1 + row_delta + height, 1 + col_delta:1 + col_delta + width]
+    return counts
+
+
+def neighbor_counts(grid, alive, deltas=ALL, vectorized=None):
+    """Grid holding, for every cell, how many of its neighbors have a value in alive.
+
+    vectorized defaults to whether NumPy is installed.
+    """
+    if vectorized is None:
+        vectorized = numpy is not None
+    if vectorized:
+        mask = numpy.isin(grid.to_numpy(), list(alive))
+        return Grid(grid.width, grid.height, array.array('B', shifted_sum(mask, deltas).tobytes()))
+
+    counts = Grid(grid.width, grid.height)
+    live = set(alive)
+    tally = counts.cells
+    for index, value in enumerate(grid.cells):
+        if value in live:
+            for neighbor in grid.neighbors(index, deltas):
+                tally[neighbor] += 1
+    return counts
+
+
+class Automaton:
+    """Synchronous rule over a Grid, updated in place.
+
+    alive is the set of values counted as a live neighbor.  incremental picks
+    the pure-Python frontier stepper; it defaults to True only when NumPy is
+    missing.
+    """
+    def __init__(self, grid, rule, alive, deltas=ALL, incremental=None):
+        if incremental is None:
+            incremental = numpy is None
+        if not incremental and numpy is None:
+            raise RuntimeError('Vectorized stepping needs NumPy, use incremental=True')
+
+        self.grid = grid
+        self.alive = bytes(alive)
+        self.deltas = deltas
+        self.incremental = incremental
+        self.generation = 0
+
+        # table[value * stride + count] is the next value.
+        self.stride = len(deltas) + 1
+        self.table = bytes(
+            rule(value, count)
+            for value in range(256)
+            for count in range(self.stride)
+        )
+
+        if incremental:
+            self.live = bytes(value in self.alive for value in range(256))
+            self.counts = neighbor_counts(grid, self.alive, deltas, vectorized=False).cells
+            self.frontier = range(grid.size)
+        else:
+            self.lookup = numpy.frombuffer(self.table, dtype=numpy.uint8).reshape(256, self.stride)
+
+    def step(self):
+        """Advance one generation, return how many cells changed.
+        """
+        self.generation += 1
+        if self.incremental:
+            return self._step_frontier()
+        return self._step_vectorized()
+
+    def run(self, limit=None):
+        """Step until a generation changes nothing, or limit generations.
+
+        Returns the number of generations that changed something.
+        """
+        generations = 0
+        while limit is None or generations < limit:
+            if not self.step():
+                break
+            generations += 1
+        return generations
+
+    def _step_vectorized(self):
+        board = self.grid.to_numpy()
+        counts = shifted_sum(numpy.isin(board, list(self.alive)), self.deltas)
+        following = self.lookup[board, counts]
+        changed = int(numpy.count_nonzero(following != board))
+        if changed:
+            board[...] = following
+        return changed
+
+    def _step_frontier(self):
+        cells = self.grid.cells
+        counts = self.counts
+        table = self.table
+        stride = self.stride
+
+        changes = []
+        for index in self.frontier:
+            value = cells[index]
+            following = table[value * stride + counts[index]]
+            if following != value:
+                changes.append((index, following))
+
+        # Apply after evaluating so the update is synchronous.
+        live = self.live
+        neighbors = self.grid.neighbors
+        frontier = set()
+        for index, following in changes:
+            was_live = live[cells[index]]
+            cells[index] = following
+            frontier.add(index)
+            if was_live != live[following]:
+                delta = 1 if live[following] else -1
+                for neighbor in neighbors(index, self.deltas):
+                    counts[neighbor] += delta
+                    frontier.add(neighbor)
+        self.frontier = sorted(frontier)
+        return len(changes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Run one day over a directory of inputs: other accounts, generated stress files.
+
+Each worker process imports the solution once and then takes input files off
+the pool's queue, so the import is paid per worker, not per input.  Inputs are
+loaded the way the day loads its own (see Solution.load_data) and never go
+through the parse cache.
+"""
+import concurrent.futures
+import dataclasses
+import os
+import pathlib
+import traceback
+
+from aoclib.catalog import find
+from aoclib.runner import ERROR, MISSING, PartResult, run_parts
+
+
+# The worker's solution, loaded once by _start_worker.
+_solution = None
+
+
+@dataclasses.dataclass
+class BatchResult:
+    path: pathlib.Path
+    # PartResults in part order.
+    results: list
+
+    @property
+    def ok(self):
+        return all(result.ok or result.status == MISSING for result in self.results)
+
+
+def input_files(directory, pattern='*.txt'):
+    return sorted(path for path in pathlib.Path(directory).glob(pattern) if path.is_file())
+
+
+def _start_worker(year, day):
+    global _solution
+    _solution = find(year, day)
+    # Import now, not while the first input is on the clock.
+    _solution.module
+
+
+def _run_input(path, parts):
+    return BatchResult(path, run_parts(_solution, parts, quiet=True, input_path=path))
+
+
+def run_batch(solution, paths, parts=None, jobs=1):
+    """Yield a BatchResult per input path as each one finishes.
+
+    jobs=1 runs in this process, jobs=0 uses every core.
+    """
+    jobs = jobs or os.cpu_count()
+    if jobs == 1:
+        _start_worker(solution.year, solution.day)
+        for path in paths:
+            yield _run_input(path, parts)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(jobs, len(paths)) or 1,
+        initializer=_start_worker, initargs=(solution.year, solution.day),
+    ) as executor:
+        futures = {executor.submit(_run_input, path, parts): path for path in paths}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                # The worker itself died on this input.
+                error = traceback.format_exc()
+                yield BatchResult(futures[future], [
+                    PartResult(solution.year, solution.day, part, status=ERROR, error=error)
+                    for part in parts or (1, 2)
+                ])
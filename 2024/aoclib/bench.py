@@ -0,0 +1,205 @@
+"""Repeatable timings per part, kept in a history so regressions show up.
+
+Each part is benchmarked in its own fresh worker process so its peak RSS is
+its own and not whatever the previous day left behind.
+
+A run is checked against the median of the last BASELINE_RUNS saved medians,
+so one noisy run can't move the baseline much, and `doit bench` doesn't save
+a run that regressed: it would only make the next check go easy on it.
+"""
+import concurrent.futures
+import contextlib
+import dataclasses
+import io
+import resource
+import sqlite3
+import statistics
+import time
+import unittest
+
+from aoclib import counters, memo
+from aoclib.catalog import STATE_DIR, find, year_context
+
+
+HISTORY_PATH = STATE_DIR / 'history.sqlite3'
+
+# Saved runs per part that make up the baseline.
+BASELINE_RUNS = 5
+
+
+@dataclasses.dataclass
+class BenchResult:
+    year: int
+    day: int
+    part: int
+    samples: list
+    peak_rss_kb: int
+
+    @property
+    def min(self):
+        return min(self.samples)
+
+    @property
+    def median(self):
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self):
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method='inclusive')[-1]
+
+
+class TestHistory(unittest.TestCase):
+    def test_baseline(self):
+        import pathlib
+        import tempfile
+        directory = tempfile.TemporaryDirectory()
+        history = History(pathlib.Path(directory.name) / 'history.sqlite3')
+        try:
+            self.assertIsNone(history.baseline(2022, 12, 1))
+            for median in (1.0, 1.1, 0.9, 5.0):
+                history.record(BenchResult(2022, 12, 1, [median], 0))
+            # One outlier doesn't move the median of the saved runs.
+            self.assertEqual(history.baseline(2022, 12, 1), 1.05)
+            self.assertIsNone(regression(BenchResult(2022, 12, 1, [1.2], 0), 1.05, 0.2))
+            self.assertAlmostEqual(regression(BenchResult(2022, 12, 1, [2.1], 0), 1.05, 0.2), 2.0)
+
+            # Accepting a slower run makes it the whole baseline.
+            history.accept(BenchResult(2022, 12, 1, [2.1], 0))
+            self.assertEqual(history.baseline(2022, 12, 1), 2.1)
+            history.record(BenchResult(2022, 12, 1, [2.3], 0))
+            self.assertEqual(history.baseline(2022, 12, 1), 2.2)
+            self.assertIsNone(history.baseline(2022, 12, 2))
+        finally:
+            history.close()
+            directory.cleanup()
+
+
+def bench_part(year, day, part, repeat=5, warmup=1):
+    """Time one part `repeat` times after `warmup` untimed calls.
+
+    Only the part call is timed; parse() runs before each call since parts may
+    mutate their arguments.  Whatever the solution prints is discarded.
+    """
+    solution = find(year, day)
+    function = solution.parts()[part]
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = solution.load_data()
+        samples = []
+        with year_context(year):
+            for i in range(warmup + repeat):
+                arguments = solution.arguments(data)
+                # As the runner does, so a memoized part is timed cold each time.
+                memo.reset()
+                counters.reset()
+                start = time.perf_counter()
+                function(*arguments)
+                elapsed = time.perf_counter() - start
+                if i >= warmup:
+                    samples.append(elapsed)
+
+    # Linux reports kilobytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return BenchResult(year, day, part, samples, peak)
+
+
+def bench_isolated(year, day, part, repeat=5, warmup=1):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        future = executor.submit(bench_part, year, day, part, repeat, warmup)
+        return future.result()
+
+
+class History:
+    """SQLite log of every benchmark run.
+    """
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS bench (
+            id INTEGER PRIMARY KEY,
+            created REAL NOT NULL,
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            runs INTEGER NOT NULL,
+            min REAL NOT NULL,
+            median REAL NOT NULL,
+            p95 REAL NOT NULL,
+            peak_rss_kb INTEGER NOT NULL
+        );
+        -- The run each part's baseline starts from, set by accept().
+        CREATE TABLE IF NOT EXISTS accepted (
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            bench_id INTEGER NOT NULL,
+            PRIMARY KEY (year, day, part)
+        );
+    '''
+
+    def __init__(self, path=HISTORY_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def baseline(self, year, day, part, runs=BASELINE_RUNS):
+        """Median of the last `runs` saved medians for this part, or None.
+
+        Runs from before the part's last accepted run don't count.
+        """
+        rows = self.connection.execute(
+            'SELECT median FROM bench WHERE year = ? AND day = ? AND part = ?'
+            ' AND id >= COALESCE((SELECT bench_id FROM accepted WHERE year = ? AND day = ? AND part = ?), 0)'
+            ' ORDER BY id DESC LIMIT ?',
+            (year, day, part, year, day, part, runs),
+        ).fetchall()
+        if not rows:
+            return None
+        return statistics.median(row['median'] for row in rows)
+
+    def record(self, result):
+        """Save a run; returns its id."""
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO bench (created, year, day, part, runs, min, median, p95, peak_rss_kb)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    time.time(), result.year, result.day, result.part, len(result.samples),
+                    result.min, result.median, result.p95, result.peak_rss_kb,
+                ),
+            )
+        return cursor.lastrowid
+
+    def accept(self, result):
+        """Save a run and start the part's baseline over from it.
+
+        For intended slowdowns, such as a more correct algorithm or a new
+        input, which would otherwise fail the check until the history is gone.
+        """
+        bench_id = self.record(result)
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO accepted (year, day, part, bench_id) VALUES (?, ?, ?, ?)',
+                (result.year, result.day, result.part, bench_id),
+            )
+
+
+def regression(result, baseline, threshold):
+    """Return the slowdown ratio if the median regressed past threshold, else None.
+
+    baseline is History.baseline()'s median; threshold=0.2 tolerates a median
+    up to 20% slower than it.
+    """
+    if baseline is None or baseline <= 0:
+        return None
+    ratio = result.median / baseline
+    if ratio > 1 + threshold:
+        return ratio
+    return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Keep parse() results between runs.
+
+A module's parse() output is pickled under .doit/parsed/, stamped with a hash
+of the input lines and of the code that parsed them: the solution module, its
+year's helper modules and the aoclib sources, since parse() may hand back
+aoclib objects (a Grid, an IntervalSet) that an aoclib change could reshape.
+Changing the input or editing any of that code makes the stamp miss and the
+input is parsed again.
+
+Parts may mutate their arguments, so every call gets a fresh unpickled copy.
+Results that can't be pickled (a lambda, a generator) are simply not cached;
+a module can also opt out with `PARSE_CACHE = False`.  Set AOC_PARSE_CACHE=0
+to turn the cache off entirely.
+"""
+import hashlib
+import os
+import pathlib
+import pickle
+import shutil
+import tempfile
+import unittest
+
+
+ENABLED = os.environ.get('AOC_PARSE_CACHE', '1') != '0'
+
+# {path: (stamp, payload)}, so repeated calls in one process skip the disk too.
+_memory = {}
+
+_library_digest = None
+
+
+class TestCache(unittest.TestCase):
+    def test_stamp(self):
+        global _library_digest
+        key = stamp(b'code', ['1', '2'])
+        self.assertEqual(stamp(b'code', ['1', '2']), key)
+        self.assertNotEqual(stamp(b'code', ['1', '3']), key)
+        self.assertNotEqual(stamp(b'edited', ['1', '2']), key)
+        saved = library_digest()
+        try:
+            _library_digest = b'aoclib changed'
+            self.assertNotEqual(stamp(b'code', ['1', '2']), key)
+        finally:
+            _library_digest = saved
+
+    def test_cached_parse(self):
+        directory = tempfile.mkdtemp()
+        path = pathlib.Path(directory) / 'day.pickle'
+        calls = []
+
+        def parse(data):
+            calls.append(data)
+            return ([int(line) for line in data],)
+
+        try:
+            self.assertEqual(cached_parse(parse, ['1', '2'], path, b'code'), ([1, 2],))
+            self.assertEqual(cached_parse(parse, ['1', '2'], path, b'code'), ([1, 2],))
+            self.assertEqual(len(calls), 1)
+            _memory.clear()
+            cached_parse(parse, ['1', '2'], path, b'code')
+            self.assertEqual(len(calls), 1)
+            cached_parse(parse, ['1', '2'], path, b'edited')
+            self.assertEqual(len(calls), 2)
+        finally:
+            _memory.pop(path, None)
+            shutil.rmtree(directory)
+
+
+def library_digest():
+    """Hash of the aoclib sources; a fix in here may change any answer."""
+    global _library_digest
+    if _library_digest is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for path in sorted(pathlib.Path(__file__).parent.glob('*.py')):
+            digest.update(path.read_bytes())
+        _library_digest = digest.digest()
+    return _library_digest
+
+
+def stamp(code_digest, data):
+    """Hash of the parser's code digest, the aoclib sources and the input lines."""
+    digest = hashlib.blake2b(code_digest, digest_size=16)
+    digest.update(library_digest())
+    for line in data:
+        digest.update(line.encode())
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def cached_parse(parse, data, path, code_digest):
+    """Return parse(data), from the cache at path when the stamp still matches.
+    """
+    if not ENABLED:
+        return parse(list(data))
+
+    key = stamp(code_digest, data)
+    payload = _read(path, key)
+    if payload is not None:
+        return pickle.loads(payload)
+
+    arguments = parse(list(data))
+    try:
+        payload = pickle.dumps(arguments, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return arguments
+    _write(path, key, payload)
+    return arguments
+
+
+def _read(path, key):
+    cached = _memory.get(path)
+    if cached is None:
+        try:
+            with open(path, mode='rb') as fp:
+                cached = (fp.readline().strip().decode(), fp.read())
+        except FileNotFoundError:
+            return None
+        _memory[path] = cached
+    if cached[0] != key:
+        return None
+    return cached[1]
+
+
+def _write(path, key, payload):
+    _memory[path] = (key, payload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Worker processes may write the same day at once; whole files only.
+    partial = path.with_name(f'{path.name}.{os.getpid()}')
+    with open(partial, mode='wb') as fp:
+        fp.write(key.encode() + b'\n')
+        fp.write(payload)
+    os.replace(partial, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
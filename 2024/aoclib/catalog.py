@@ -0,0 +1,205 @@
+"""Find the solution modules for every year and load them in-process.
+"""
+import contextlib
+import hashlib
+import importlib.util
+import os
+import pathlib
+import re
+import sys
+import tempfile
+
+from aoclib import cache, stream
+
+
+# The repository root, one level above the year directories.
+ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
+
+# Per-user state; timings, history and caches all live here.
+STATE_DIR = ROOT / '.doit'
+PARSED_DIR = STATE_DIR / 'parsed'
+
+# 2022 onwards: day01.py.  2020 and 2021: aoc01.py.
+SOLUTION_PATTERN = re.compile(r'^(?:day|aoc)(\d{2})\.py$')
+
+PARTS = (1, 2)
+
+
+class Solution:
+    """One day's solution module, loaded on first use.
+    """
+    def __init__(self, year, day, path):
+        self.year = year
+        self.day = day
+        self.path = path
+        self._module = None
+        self._code_digest = None
+
+    def __str__(self):
+        return f'{self.year} day {self.day:02}'
+
+    def __repr__(self):
+        return f'Solution({self.year}, {self.day}, {self.path.name})'
+
+    @property
+    def key(self):
+        return (self.year, self.day)
+
+    @property
+    def directory(self):
+        return self.path.parent
+
+    @property
+    def input_path(self):
+        # Every year named its input a little differently.
+        stem = self.path.stem
+        candidates = [
+            f'{stem}-input.txt',  # 2023 - 2025
+            f'{stem}input.txt',  # 2022
+            f'{self.day:02}.txt',  # 2020, 2021
+        ]
+        for name in candidates:
+            path = self.directory / name
+            if path.exists():
+                return path
+        return None
+
+    @property
+    def module(self):
+        if self._module is None:
+            self._module = self._load()
+        return self._module
+
+    def parts(self):
+        """Return {part number: callable} for the parts this module defines.
+        """
+        found = {}
+        for part in PARTS:
+            function = getattr(self.module, f'part_{part}', None)
+            if callable(function):
+                found[part] = function
+        return found
+
+    def load_data(self, input_path=None):
+        """Read the input lines, honoring the module's own loader if it has one.
+
+        input_path reads another input file instead of the day's own.  The
+        loaders all open their input by a fixed relative name, so they are run
+        from a scratch directory where that name points at input_path.
+        """
+        module = self.module
+        if input_path is not None:
+            return self._load_other(input_path)
+
+        if hasattr(module, 'load_data'):
+            with year_context(self.year):
+                return module.load_data()
+
+        with open(self.input_path) as fp:
+            return [line.strip() for line in fp]
+
+    def _load_other(self, input_path):
+        name = self.input_path.name if self.input_path else f'{self.path.stem}-input.txt'
+        with tempfile.TemporaryDirectory() as scratch, year_context(self.year):
+            os.symlink(os.path.abspath(input_path), os.path.join(scratch, name))
+            with contextlib.chdir(scratch):
+                if hasattr(self.module, 'load_data'):
+                    return self.module.load_data()
+                with open(name) as fp:
+                    return [line.strip() for line in fp]
+
+    def arguments(self, data, use_cache=True):
+        """Build the positional arguments for a part from the input lines.
+
+        Called once per part; parts are free to mutate what they are given.
+        use_cache=False parses without touching the parse cache, for inputs that
+        aren't the day's real one.
+        """
+        parse = getattr(self.module, 'parse', None)
+        if isinstance(data, stream.Lines):
+            # Streamed input is read lazily by each part, never copied or cached.
+            return parse(data) if parse else (data,)
+        if parse is None:
+            return (list(data),)
+        if not (use_cache and getattr(self.module, 'PARSE_CACHE', True)):
+            return parse(list(data))
+        path = PARSED_DIR / f'{self.year}-{self.path.stem}.pickle'
+        return cache.cached_parse(parse, data, path, self.code_digest)
+
+    @property
+    def code_digest(self):
+        """Hash of this module's source and its year's helper modules.
+        """
+        if self._code_digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            helpers = [
+                path for path in sorted(self.directory.glob('*.py'))
+                if not SOLUTION_PATTERN.match(path.name)
+            ]
+            for path in [self.path] + helpers:
+                digest.update(path.read_bytes())
+            self._code_digest = digest.digest()
+        return self._code_digest
+
+    def _load(self):
+        name = f'_aoc_{self.year}_{self.path.stem}'
+        spec = importlib.util.spec_from_file_location(name, self.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        with year_context(self.year):
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+        return module
+
+
+@contextlib.contextmanager
+def year_context(year):
+    """Make the year directory look like the script's own directory.
+
+    Each year has its own helper modules (`aoc`, `utils`) under the same names,
+    so helpers imported for another year are dropped before this year's
+    modules import theirs.
+    """
+    directory = ROOT / str(year)
+    for path in directory.glob('*.py'):
+        if SOLUTION_PATTERN.match(path.name):
+            continue
+        loaded = sys.modules.get(path.stem)
+        loaded_file = getattr(loaded, '__file__', None)
+        if loaded_file and pathlib.Path(loaded_file).resolve().parent != directory:
+            del sys.modules[path.stem]
+
+    sys.path.insert(0, str(directory))
+    try:
+        with contextlib.chdir(directory):
+            yield directory
+    finally:
+        sys.path.remove(str(directory))
+
+
+def discover(root=ROOT, years=None):
+    """Return every Solution under root, ordered by year then day.
+    """
+    solutions = []
+    for year_dir in sorted(root.iterdir()):
+        if not (year_dir.is_dir() and year_dir.name.isdigit()):
+            continue
+        year = int(year_dir.name)
+        if years and year not in years:
+            continue
+        for path in sorted(year_dir.glob('*.py')):
+            match = SOLUTION_PATTERN.match(path.name)
+            # day00 is the 2022 template, not a puzzle.
+            if match and int(match.group(1)):
+                solutions.append(Solution(year, int(match.group(1)), path))
+    return solutions
+
+
+def find(year, day, root=ROOT):
+    for solution in discover(root, years=[year]):
+        if solution.day == day:
+            return solution
+    raise LookupError(f'No solution for {year} day {day:02}')
@@ -0,0 +1,141 @@
+"""Save a long solve's loop state now and then, and pick it up again later.
+
+    from aoclib import checkpoint
+
+    state = checkpoint.load('bfs')
+    if state is not None:
+        count, seen, frontier = state
+    ...
+    while frontier:
+        if checkpoint.due('bfs'):
+            checkpoint.save('bfs', (count, seen, frontier))
+
+due() is true at most every INTERVAL seconds, and only while the runner has a
+part going, so the check costs next to nothing and a plain ./dayNN.py run never
+writes anything.  load() returns None unless the run was started with
+`doit run --resume`.
+
+Checkpoints are zlib-compressed pickles under .doit/checkpoints/, one directory
+per part.  Each is stamped with the day's code and input, so an edited solver
+never resumes from state an older version wrote.  A part that finishes cleanly
+removes its checkpoints.
+
+Keys can be anything with a stable repr(): a name, or a (name, machine) tuple
+when a part runs one search per item.
+"""
+import contextlib
+import hashlib
+import os
+import pickle
+import shutil
+import time
+import unittest
+import zlib
+
+from aoclib.catalog import STATE_DIR
+
+
+CHECKPOINT_DIR = STATE_DIR / 'checkpoints'
+
+# Seconds between saves of the same key.
+INTERVAL = float(os.environ.get('AOC_CHECKPOINT_INTERVAL', '30'))
+
+
+class _Scope:
+    def __init__(self, directory, stamp, resume):
+        self.directory = directory
+        self.stamp = stamp
+        self.resume = resume
+        # {key: time.monotonic() of the last save}
+        self.saved = {}
+
+
+# The running part's scope, set by the runner.
+_scope = None
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_round_trip(self):
+        import tempfile
+        directory = tempfile.mkdtemp()
+        try:
+            self.assertFalse(due('bfs'))
+            with scope(directory, 'v1'):
+                self.assertTrue(due('bfs'))
+                save('bfs', {'frontier': [(1, 2)], 'count': 3})
+                self.assertFalse(due('bfs'))
+                # Not resuming: nothing comes back.
+                self.assertIsNone(load('bfs'))
+            with scope(directory, 'v1', resume=True):
+                self.assertEqual(load('bfs'), {'frontier': [(1, 2)], 'count': 3})
+                self.assertIsNone(load(('bfs', 2)))
+            with scope(directory, 'v2', resume=True):
+                self.assertIsNone(load('bfs'))
+            clear(directory)
+            self.assertFalse(os.path.exists(directory))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def scope(directory, stamp, resume=False):
+    """Direct saves and loads to directory while a part runs."""
+    global _scope
+    previous = _scope
+    _scope = _Scope(directory, stamp, resume)
+    try:
+        yield
+    finally:
+        _scope = previous
+
+
+def due(key):
+    """True when key hasn't been saved for INTERVAL seconds."""
+    if _scope is None:
+        return False
+    last = _scope.saved.get(key)
+    return last is None or time.monotonic() - last >= INTERVAL
+
+
+def save(key, state):
+    if _scope is None:
+        return
+    _scope.saved[key] = time.monotonic()
+    os.makedirs(_scope.directory, exist_ok=True)
+    path = _path(key)
+    payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    partial = f'{path}.{os.getpid()}'
+    with open(partial, mode='wb') as fp:
+        fp.write(_scope.stamp.encode() + b'\n')
+        fp.write(payload)
+    os.replace(partial, path)
+
+
+def load(key):
+    """The last state saved for key, when resuming and still stamped for this code."""
+    if _scope is None or not _scope.resume:
+        return None
+    try:
+        with open(_path(key), mode='rb') as fp:
+            stamp = fp.readline().strip().decode()
+            payload = fp.read()
+    except FileNotFoundError:
+        return None
+    if stamp != _scope.stamp:
+        return None
+    # Saving again right away would only write back what was just read.
+    _scope.saved[key] = time.monotonic()
+    return pickle.loads(zlib.decompress(payload))
+
+
+def clear(directory):
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _path(key):
+    name = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    return os.path.join(_scope.directory, f'{name}.pickle.z')
+
+
+if __name__ == '__main__':
+    unittest.main()
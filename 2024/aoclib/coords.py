@@ -0,0 +1,163 @@
+"""One small coordinate type for every year, instead of a Point/Coord/Cell per day.
+
+Coord is (row, col) with __slots__, so it carries no __dict__, and it hashes
+like the (row, col) tuple.  Coords never change; arithmetic hands back new ones:
+
+    from aoclib.coords import Coord, RIGHT, CLOCKWISE
+
+    position = Coord(3, 4)
+    position + RIGHT            # Coord(3, 5)
+    RIGHT.turn_right()          # DOWN
+    for neighbor in position.neighbors():
+        ...
+
+Rows grow downward, as when reading the input, so UP is Coord(-1, 0).  Days
+that count y upward can still map their own letters onto the four directions.
+
+For grids of known width, pack() turns a Coord into the flat int index that
+aoclib.grid uses (row * width + col), and Coord.unpack() goes back.  Ints
+are cheaper still as set members and dict keys in the hottest loops.
+"""
+import unittest
+
+
+class TestCoord(unittest.TestCase):
+    def test_arithmetic(self):
+        position = Coord(3, 4)
+        self.assertEqual(position + RIGHT, Coord(3, 5))
+        self.assertEqual(position - Coord(1, 1), Coord(2, 3))
+        self.assertEqual(2 * DOWN, Coord(2, 0))
+        self.assertEqual(-UP, DOWN)
+        self.assertEqual(Coord(-5, 3).sign(), Coord(-1, 1))
+        self.assertEqual(position.manhattan(ORIGIN), 7)
+        self.assertEqual(position.chebyshev(ORIGIN), 4)
+        row, col = position
+        self.assertEqual((row, col), (3, 4))
+
+    def test_hashing(self):
+        self.assertEqual(len({Coord(1, 2), Coord(1, 2), Coord(2, 1)}), 2)
+        self.assertEqual(hash(Coord(1, 2)), hash((1, 2)))
+        self.assertNotEqual(Coord(1, 2), (1, 2))
+        self.assertFalse(hasattr(Coord(1, 2), '__dict__'))
+
+    def test_directions(self):
+        for direction, following in zip(CLOCKWISE, CLOCKWISE[1:] + CLOCKWISE[:1]):
+            self.assertEqual(direction.turn_right(), following)
+            self.assertEqual(following.turn_left(), direction)
+        self.assertEqual(Coord(0, 0).neighbors(), [UP, LEFT, RIGHT, DOWN])
+        self.assertEqual(len(Coord(5, 5).neighbors(ALL)), 8)
+
+    def test_packing(self):
+        self.assertEqual(Coord(2, 3).pack(10), 23)
+        self.assertEqual(Coord.unpack(23, 10), Coord(2, 3))
+
+
+class Coord:
+    __slots__ = ('row', 'col')
+
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+
+    def __repr__(self):
+        return f'Coord({self.row}, {self.col})'
+
+    def __eq__(self, other):
+        if other.__class__ is not Coord:
+            return NotImplemented
+        return self.row == other.row and self.col == other.col
+
+    def __lt__(self, other):
+        return (self.row, self.col) < (other.row, other.col)
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+    def __iter__(self):
+        # row, col = coord
+        yield self.row
+        yield self.col
+
+    def __add__(self, other):
+        return Coord(self.row + other.row, self.col + other.col)
+
+    def __sub__(self, other):
+        return Coord(self.row - other.row, self.col - other.col)
+
+    def __neg__(self):
+        return Coord(-self.row, -self.col)
+
+    def __mul__(self, factor):
+        return Coord(self.row * factor, self.col * factor)
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        return Coord, (self.row, self.col)
+
+    # -------------------------------------------------------------------------
+    # Distances and neighbors
+    # -------------------------------------------------------------------------
+    def manhattan(self, other):
+        return abs(self.row - other.row) + abs(self.col - other.col)
+
+    def chebyshev(self, other):
+        """Moves apart for a king: diagonal steps count as one."""
+        return max(abs(self.row - other.row), abs(self.col - other.col))
+
+    def sign(self):
+        """The step, each axis -1, 0 or 1, that heads in this direction."""
+        return Coord((self.row > 0) - (self.row < 0), (self.col > 0) - (self.col < 0))
+
+    def neighbors(self, deltas=None):
+        deltas = ORTHOGONAL if deltas is None else deltas
+        return [Coord(self.row + delta.row, self.col + delta.col) for delta in deltas]
+
+    def in_bounds(self, height, width):
+        return 0 <= self.row < height and 0 <= self.col < width
+
+    # -------------------------------------------------------------------------
+    # Directions
+    # -------------------------------------------------------------------------
+    def turn_right(self):
+        return Coord(self.col, -self.row)
+
+    def turn_left(self):
+        return Coord(-self.col, self.row)
+
+    # -------------------------------------------------------------------------
+    # Packed ints
+    # -------------------------------------------------------------------------
+    def pack(self, width):
+        return self.row * width + self.col
+
+    @classmethod
+    def unpack(cls, index, width):
+        return cls(*divmod(index, width))
+
+
+ORIGIN = Coord(0, 0)
+UP = Coord(-1, 0)
+DOWN = Coord(1, 0)
+LEFT = Coord(0, -1)
+RIGHT = Coord(0, 1)
+UP_LEFT = UP + LEFT
+UP_RIGHT = UP + RIGHT
+DOWN_LEFT = DOWN + LEFT
+DOWN_RIGHT = DOWN + RIGHT
+
+# Reading order, like aoclib.grid's tables.
+ORTHOGONAL = (UP, LEFT, RIGHT, DOWN)
+DIAGONAL = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+ALL = (UP_LEFT, UP, UP_RIGHT, LEFT, RIGHT, DOWN_LEFT, DOWN, DOWN_RIGHT)
+
+# Each entry is a right turn from the one before.
+CLOCKWISE = (UP, RIGHT, DOWN, LEFT)
+
+# How puzzles spell the directions.
+ARROWS = {'^': UP, '>': RIGHT, 'v': DOWN, '<': LEFT}
+LETTERS = {'U': UP, 'R': RIGHT, 'D': DOWN, 'L': LEFT}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Named work counters for search and simulation loops.
+
+Wall time moves with the machine; the number of heap pops or states explored
+doesn't.  Counting the work makes two versions of an algorithm comparable:
+
+    from aoclib import counters
+
+    if counters.ENABLED:
+        counters.add('states', len(seen))
+        counters.observe('frontier', len(queue))
+
+Like aoclib.trace, the `if` is what makes it free when counting is off.  In a
+tight loop it's cheaper still to count something you already have, such as
+len(seen) once at the end, than to add one per iteration.
+
+add() keeps a running total; observe() keeps a histogram of the values seen.
+The runner resets both before each part and reports them next to its time.
+Turn counting on with `doit run --count`, or AOC_COUNTERS=1 when running a
+script directly.
+"""
+import collections
+import os
+import statistics
+import unittest
+
+
+ENABLED = False
+
+_totals = collections.Counter()
+# {name: Counter({value: times seen})}
+_histograms = collections.defaultdict(collections.Counter)
+
+
+class TestCounters(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = ENABLED
+        enable()
+        reset()
+
+    def tearDown(self):
+        reset()
+        enable(self.was_enabled)
+
+    def test_counts(self):
+        add('pops')
+        add('pops', 4)
+        for value in (3, 1, 3, 8):
+            observe('depth', value)
+        self.assertEqual(snapshot(), {'pops': 5, 'depth': Histogram({1: 1, 3: 2, 8: 1})})
+        self.assertEqual(format_value(snapshot()['depth']), 'n=4 min=1 median=3 max=8')
+        reset()
+        self.assertEqual(snapshot(), {})
+
+
+class Histogram(collections.Counter):
+    """{value: times seen} with the usual summary numbers."""
+
+    @property
+    def count(self):
+        return self.total()
+
+    def median(self):
+        return statistics.median_low(sorted(self.elements()))
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+def add(name, amount=1):
+    _totals[name] += amount
+
+
+def observe(name, value):
+    _histograms[name][value] += 1
+
+
+def reset():
+    _totals.clear()
+    _histograms.clear()
+
+
+def snapshot():
+    """Return {name: total or Histogram}, detached from the live counters.
+    """
+    counts = dict(_totals)
+    for name, histogram in _histograms.items():
+        counts[name] = Histogram(histogram)
+    return counts
+
+
+def format_value(value):
+    if isinstance(value, Histogram):
+        return f'n={value.count} min={min(value)} median={value.median()} max={max(value)}'
+    return f'{value:,}' if isinstance(value, int) else str(value)
+
+
+enable(os.environ.get('AOC_COUNTERS', '0') != '0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""Directed graph over interned names, stored as compressed sparse rows.
+
+Graph days were dicts of lists keyed on node names, so every step of a walk
+hashed a string.  Graph gives each name a dense int id, in the order names are
+first seen, and keeps adjacency in two flat arrays:
+
+    targets[offsets[node]:offsets[node + 1]]    the nodes node points at
+
+with the same pair (reverse_offsets, sources) for the edges coming in.
+Edges keep their input order, so a node's first successor is its first edge.
+
+    graph = Graph.from_adjacency({'you': ['bbb', 'ccc'], 'bbb': ['out']})
+    you = graph.id('you')
+    for node in graph.successors(you):
+        ...
+    graph.count_paths(you, graph.id('out'))
+
+Work in ids and translate with graph.id() / graph.name() at the edges of a
+solution.  In the hottest loops read offsets and targets directly.
+"""
+import array
+import itertools
+import unittest
+
+
+class TestGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph.from_adjacency({
+            'svr': ['aaa', 'bbb'],
+            'aaa': ['fft'],
+            'bbb': ['fft', 'out'],
+            'fft': ['out'],
+        })
+
+    def test_interning(self):
+        graph = self.graph
+        self.assertEqual(len(graph), 5)
+        self.assertEqual(graph.edge_count, 6)
+        self.assertEqual(graph.name(graph.id('fft')), 'fft')
+        self.assertEqual(graph.names, ['svr', 'aaa', 'bbb', 'fft', 'out'])
+        self.assertIn('out', graph)
+        self.assertNotIn('zzz', graph)
+
+    def test_adjacency(self):
+        graph = self.graph
+        svr, aaa, bbb, fft, out = range(5)
+        self.assertEqual(list(graph.successors(bbb)), [fft, out])
+        self.assertEqual(list(graph.predecessors(fft)), [aaa, bbb])
+        self.assertEqual(graph.out_degree(out), 0)
+        self.assertEqual(graph.in_degree(out), 2)
+
+    def test_order_and_paths(self):
+        graph = self.graph
+        order = list(graph.topological_order())
+        for source, target in graph.edges():
+            self.assertLess(order.index(source), order.index(target))
+        self.assertEqual(graph.count_paths(graph.id('svr'), graph.id('out')), 3)
+        self.assertEqual(graph.count_paths(graph.id('fft'), graph.id('svr')), 0)
+
+        reached = graph.reachable(graph.id('aaa'))
+        self.assertEqual([graph.name(node) for node in range(len(graph)) if reached[node]], ['aaa', 'fft', 'out'])
+        back = graph.reachable(graph.id('fft'), reverse=True)
+        self.assertEqual(back.count(1), 4)
+
+    def test_cycle(self):
+        with self.assertRaises(ValueError):
+            Graph([('a', 'b'), ('b', 'a')]).topological_order()
+
+
+class Graph:
+    def __init__(self, edges=(), nodes=()):
+        """Build from (source, target) name pairs; nodes adds names with no edges.
+        """
+        self.ids = {}
+        self.names = []
+        for name in nodes:
+            self._intern(name)
+        pairs = [(self._intern(source), self._intern(target)) for source, target in edges]
+
+        count = len(self.names)
+        self.offsets, self.targets = _compress(count, pairs)
+        self.reverse_offsets, self.sources = _compress(count, [(target, source) for source, target in pairs])
+        self._order = None
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """Build from {name: [target names]}; every key becomes a node."""
+        edges = [(source, target) for source, targets in adjacency.items() for target in targets]
+        return cls(edges, nodes=adjacency)
+
+    def _intern(self, name):
+        node = self.ids.get(name)
+        if node is None:
+            node = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return node
+
+    def __repr__(self):
+        return f'Graph({len(self)} nodes, {self.edge_count} edges)'
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def id(self, name):
+        return self.ids[name]
+
+    def name(self, node):
+        return self.names[node]
+
+    # -------------------------------------------------------------------------
+    # Adjacency
+    # -------------------------------------------------------------------------
+    def successors(self, node):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def predecessors(self, node):
+        return self.sources[self.reverse_offsets[node]:self.reverse_offsets[node + 1]]
+
+    def out_degree(self, node):
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def in_degree(self, node):
+        return self.reverse_offsets[node + 1] - self.reverse_offsets[node]
+
+    def edges(self):
+        """(source, target) id pairs, grouped by source."""
+        offsets, targets = self.offsets, self.targets
+        for source in range(len(self.names)):
+            for index in range(offsets[source], offsets[source + 1]):
+                yield source, targets[index]
+
+    # -------------------------------------------------------------------------
+    # Walks
+    # -------------------------------------------------------------------------
+    def topological_order(self):
+        """Node ids with every edge pointing forward; ValueError if there's a cycle.
+        """
+        if self._order is not None:
+            return self._order
+        offsets, targets = self.offsets, self.targets
+        remaining = array.array('I', (self.in_degree(node) for node in range(len(self.names))))
+        ready = [node for node in range(len(self.names)) if not remaining[node]]
+        order = array.array('I')
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for index in range(offsets[node], offsets[node + 1]):
+                target = targets[index]
+                remaining[target] -= 1
+                if not remaining[target]:
+                    ready.append(target)
+        if len(order) != len(self.names):
+            raise ValueError(f'Graph has a cycle through {len(self.names) - len(order)} nodes')
+        self._order = order
+        return order
+
+    def reachable(self, start, reverse=False):
+        """A bytearray with 1 for every node reachable from start, start included.
+
+        reverse=True follows edges backwards: everything that can reach start.
+        """
+        if reverse:
+            offsets, targets = self.reverse_offsets, self.sources
+        else:
+            offsets, targets = self.offsets, self.targets
+        seen = bytearray(len(self.names))
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for index in range(offsets[node], offsets[node + 1]):
+                target = targets[index]
+                if not seen[target]:
+                    seen[target] = 1
+                    stack.append(target)
+        return seen
+
+    def count_paths(self, start, end):
+        """Number of distinct paths from start to end.  The graph must be acyclic.
+        """
+        order = self.topological_order()
+        reverse_offsets, sources = self.reverse_offsets, self.sources
+        paths = [0] * len(self.names)
+        paths[start] = 1
+        # Everything before start in the order has no path from it.
+        for node in itertools.islice(order, order.index(start) + 1, None):
+            paths[node] = sum(
+                paths[sources[index]]
+                for index in range(reverse_offsets[node], reverse_offsets[node + 1])
+            )
+            if node == end:
+                break
+        return paths[end]
+
+
+def _compress(count, pairs):
+    """(offsets, targets) arrays for (source, target) pairs, stable by source."""
+    degree = [0] * (count + 1)
+    for source, _ in pairs:
+        degree[source + 1] += 1
+    offsets = array.array('I', itertools.accumulate(degree))
+    targets = array.array('I', bytes(offsets.itemsize * len(pairs)))
+    position = offsets[:-1]
+    for source, target in pairs:
+        targets[position[source]] = target
+        position[source] += 1
+    return offsets, targets
+
+
+if __name__ == '__main__':
+    unittest.main()
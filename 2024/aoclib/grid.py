@@ -0,0 +1,214 @@
+"""Compact rectangular grid stored row-major in one flat array.
+
+Most puzzle grids were a list of lists of Cell objects plus a dict keyed on
+(row, col), with a neighbor list hung off every cell.  This keeps one byte per
+cell (for the default typecode) and works in flat indexes:
+
+    index = row * width + col
+
+so neighbors are a few additions and comparisons instead of dict lookups.
+
+    grid = Grid.from_lines(data)                # characters, stored as bytes
+    grid = Grid.from_lines(data, digits=True)   # '0'..'9' stored as 0..9
+    grid[row, col] = ord('#')
+    for index in grid.neighbors(grid.index(row, col)):
+        ...
+
+NumPy is optional; to_numpy() hands back a zero-copy (height, width) view when
+it is installed.
+
+cells may also be a memoryview with the typecode as its format, such as a
+shared-memory buffer; see aoclib.shared.
+"""
+import array
+import operator
+import unittest
+
+
+class TestGrid(unittest.TestCase):
+    def test_from_lines(self):
+        grid = Grid.from_lines(['ab.', '#.c'])
+        self.assertEqual((grid.width, grid.height), (3, 2))
+        self.assertEqual(grid[1, 0], ord('#'))
+        self.assertEqual(grid.coord(5), (1, 2))
+        self.assertEqual(str(grid), 'ab.\n#.c')
+
+        digits = Grid.from_lines(['123', '456'], digits=True)
+        self.assertEqual(list(digits.row(1)), [4, 5, 6])
+        self.assertEqual(list(digits.column(2)), [3, 6])
+
+    def test_neighbors(self):
+        grid = Grid(4, 3)
+        # Corner, edge, middle.
+        self.assertEqual(grid.neighbors(0), [1, 4, 5])
+        self.assertEqual(len(grid.neighbors(1)), 5)
+        self.assertEqual(grid.neighbors(5), [0, 1, 2, 4, 6, 8, 9, 10])
+        self.assertEqual(grid.neighbors(5, ORTHOGONAL), [1, 4, 6, 9])
+        # No wrapping across rows.
+        self.assertEqual(grid.neighbors(3, ORTHOGONAL), [2, 7])
+
+    def test_updates(self):
+        grid = Grid(3, 3)
+        grid[1, 1] = 7
+        copy = grid.copy()
+        grid[4] = 8
+        self.assertEqual(copy[1, 1], 7)
+        self.assertEqual(grid.find(8), 4)
+        self.assertEqual(grid.count(0), 8)
+
+    def test_memoryview(self):
+        grid = Grid.from_lines(['ab.', '#.c'])
+        view = Grid(3, 2, memoryview(bytearray(grid.cells)))
+        self.assertEqual(view, grid)
+        self.assertEqual(view.find(ord('#')), 3)
+        self.assertEqual(view.count(ord('.')), 2)
+        self.assertEqual(str(view), 'ab.\n#.c')
+        self.assertEqual(view.copy().cells, grid.cells)
+
+
+# (row delta, col delta), reading order.
+ORTHOGONAL = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class Grid:
+    def __init__(self, width, height, cells=None, typecode='B', fill=0):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        if cells is None:
+            cells = array.array(typecode, [fill]) * self.size
+        elif not isinstance(cells, (array.array, memoryview)):
+            cells = array.array(typecode, cells)
+        if len(cells) != self.size:
+            raise ValueError(f'Expected {self.size} cells for {width}x{height}, got {len(cells)}')
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines, digits=False):
+        """Build from equal-length text rows.
+
+        Characters are stored as their byte values; with digits=True each cell
+        holds the digit's integer value instead.
+        """
+        lines = [line for line in lines if line]
+        height = len(lines)
+        width = len(lines[0]) if lines else 0
+        raw = ''.join(lines).encode('ascii')
+        if digits:
+            raw = raw.translate(_DIGITS)
+        return cls(width, height, array.array('B', raw))
+
+    def __repr__(self):
+        return f'Grid({self.width}x{self.height}, {self.typecode!r})'
+
+    def __str__(self):
+        # Only meaningful for character grids.
+        return '\n'.join(bytes(self.row(row)).decode('ascii') for row in range(self.height))
+
+    def __len__(self):
+        return self.size
+
+    def __eq__(self, other):
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    @property
+    def typecode(self):
+        cells = self.cells
+        return cells.format if isinstance(cells, memoryview) else cells.typecode
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            row, col = key
+            return self.cells[row * self.width + col]
+        return self.cells[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple):
+            row, col = key
+            self.cells[row * self.width + col] = value
+        else:
+            self.cells[key] = value
+
+    # -------------------------------------------------------------------------
+    # Coordinates
+    # -------------------------------------------------------------------------
+    def index(self, row, col):
+        return row * self.width + col
+
+    def coord(self, index):
+        """(row, col) for a flat index."""
+        return divmod(index, self.width)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def get(self, row, col, default=None):
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.cells[row * self.width + col]
+        return default
+
+    def neighbors(self, index, deltas=ALL):
+        """Flat indexes of the in-bounds neighbors of index.
+        """
+        width = self.width
+        row, col = divmod(index, width)
+        found = []
+        for row_delta, col_delta in deltas:
+            r = row + row_delta
+            c = col + col_delta
+            if 0 <= r < self.height and 0 <= c < width:
+                found.append(r * width + c)
+        return found
+
+    # -------------------------------------------------------------------------
+    # Rows, columns and whole-grid helpers
+    # -------------------------------------------------------------------------
+    def row(self, row):
+        start = row * self.width
+        return self.cells[start:start + self.width]
+
+    def column(self, col):
+        return self.cells[col::self.width]
+
+    def rows(self):
+        for row in range(self.height):
+            yield self.row(row)
+
+    def find(self, value):
+        """Flat index of the first cell equal to value, or -1."""
+        try:
+            return operator.indexOf(self.cells, value)
+        except ValueError:
+            return -1
+
+    def find_all(self, value):
+        return [index for index, cell in enumerate(self.cells) if cell == value]
+
+    def count(self, value):
+        return operator.countOf(self.cells, value)
+
+    def fill(self, value):
+        self.cells[:] = array.array(self.typecode, [value]) * self.size
+
+    def copy(self):
+        return Grid(self.width, self.height, array.array(self.typecode, self.cells))
+
+    def to_numpy(self):
+        """A (height, width) NumPy view sharing this grid's memory, or None without NumPy.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return None
+        return numpy.frombuffer(self.cells, dtype=self.typecode).reshape(self.height, self.width)
+
+
+_DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
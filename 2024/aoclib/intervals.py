@@ -0,0 +1,195 @@
+"""Sorted set of integer intervals.
+
+Intervals are half-open, (start, stop) like range(): (3, 6) covers 3, 4 and 5.
+Inputs that give inclusive ends, like '3-5', need a +1 on the way in.
+
+The set keeps its intervals merged and sorted in two parallel lists, so
+membership is one bisect and building from n intervals is a sort and one pass.
+
+    fresh = IntervalSet([(3, 6), (10, 15), (12, 19)])
+    17 in fresh             # True
+    fresh.size              # 12
+    list(fresh.gaps(0, 20)) # [(0, 3), (6, 10), (19, 20)]
+"""
+import bisect
+import unittest
+
+
+class TestIntervalSet(unittest.TestCase):
+    def test_merge(self):
+        spans = IntervalSet([(16, 21), (3, 6), (12, 19), (10, 15)])
+        self.assertEqual(list(spans), [(3, 6), (10, 21)])
+        self.assertEqual(spans.size, 14)
+        # Touching intervals merge too.
+        self.assertEqual(list(IntervalSet([(1, 3), (3, 5)])), [(1, 5)])
+
+    def test_contains(self):
+        spans = IntervalSet([(3, 6), (10, 21)])
+        self.assertEqual([n for n in range(0, 12) if n in spans], [3, 4, 5, 10, 11])
+        self.assertNotIn(21, spans)
+
+    def test_add_remove(self):
+        spans = IntervalSet()
+        spans.add(10, 20)
+        spans.add(0, 5)
+        spans.add(4, 11)
+        self.assertEqual(list(spans), [(0, 20)])
+        spans.remove(5, 8)
+        spans.remove(19, 30)
+        self.assertEqual(list(spans), [(0, 5), (8, 19)])
+
+    def test_set_operations(self):
+        a = IntervalSet([(0, 10), (20, 30)])
+        b = IntervalSet([(5, 25)])
+        self.assertEqual(list(a | b), [(0, 30)])
+        self.assertEqual(list(a & b), [(5, 10), (20, 25)])
+        self.assertEqual(list(a - b), [(0, 5), (25, 30)])
+        self.assertEqual(list(b - a), [(10, 20)])
+        self.assertEqual(list(a.gaps()), [(10, 20)])
+        self.assertEqual(list(a.gaps(-5, 35)), [(-5, 0), (10, 20), (30, 35)])
+
+
+class IntervalSet:
+    def __init__(self, intervals=()):
+        self.starts = []
+        self.stops = []
+        for start, stop in sorted(intervals):
+            if start >= stop:
+                continue
+            if self.stops and start <= self.stops[-1]:
+                if stop > self.stops[-1]:
+                    self.stops[-1] = stop
+            else:
+                self.starts.append(start)
+                self.stops.append(stop)
+
+    @classmethod
+    def _from_sorted(cls, starts, stops):
+        spans = cls()
+        spans.starts = starts
+        spans.stops = stops
+        return spans
+
+    def __repr__(self):
+        return f'IntervalSet({list(self)})'
+
+    def __iter__(self):
+        return zip(self.starts, self.stops)
+
+    def __len__(self):
+        """Number of disjoint intervals, not the number of covered values."""
+        return len(self.starts)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __contains__(self, value):
+        index = bisect.bisect_right(self.starts, value) - 1
+        return index >= 0 and value < self.stops[index]
+
+    def copy(self):
+        return self._from_sorted(list(self.starts), list(self.stops))
+
+    @property
+    def size(self):
+        """How many values are covered."""
+        return sum(self.stops) - sum(self.starts)
+
+    # -------------------------------------------------------------------------
+    # In-place updates
+    # -------------------------------------------------------------------------
+    def add(self, start, stop):
+        if start >= stop:
+            return
+        # Every interval touching [start, stop) is replaced by their union.
+        low = bisect.bisect_left(self.stops, start)
+        high = bisect.bisect_right(self.starts, stop)
+        if low < high:
+            start = min(start, self.starts[low])
+            stop = max(stop, self.stops[high - 1])
+        self.starts[low:high] = [start]
+        self.stops[low:high] = [stop]
+
+    def remove(self, start, stop):
+        if start >= stop:
+            return
+        low = bisect.bisect_right(self.stops, start)
+        high = bisect.bisect_left(self.starts, stop)
+        if low >= high:
+            return
+        starts = []
+        stops = []
+        # Keep whatever sticks out either side of the removed interval.
+        if self.starts[low] < start:
+            starts.append(self.starts[low])
+            stops.append(start)
+        if self.stops[high - 1] > stop:
+            starts.append(stop)
+            stops.append(self.stops[high - 1])
+        self.starts[low:high] = starts
+        self.stops[low:high] = stops
+
+    # -------------------------------------------------------------------------
+    # Set operations
+    # -------------------------------------------------------------------------
+    def union(self, other):
+        return IntervalSet(list(self) + list(other))
+
+    def intersection(self, other):
+        starts = []
+        stops = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            stop = min(self.stops[i], other.stops[j])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            if self.stops[i] < other.stops[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_sorted(starts, stops)
+
+    def difference(self, other):
+        if not self:
+            return IntervalSet()
+        return self.intersection(other.complement(self.starts[0], self.stops[-1]))
+
+    def complement(self, start, stop):
+        """What [start, stop) has that this set does not."""
+        return IntervalSet(self.gaps(start, stop))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def gaps(self, start=None, stop=None):
+        """Yield the uncovered (start, stop) intervals.
+
+        Without bounds only the gaps between intervals are yielded.
+        """
+        if start is None:
+            start = self.starts[0] if self.starts else 0
+        if stop is None:
+            stop = self.stops[-1] if self.stops else start
+
+        position = start
+        # Skip the intervals that end before start.
+        for index in range(bisect.bisect_right(self.stops, start), len(self.starts)):
+            if self.starts[index] >= stop:
+                break
+            if self.starts[index] > position:
+                yield (position, self.starts[index])
+            position = max(position, self.stops[index])
+        if position < stop:
+            yield (position, stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Defer heavy imports until the module is first used.
+
+shapely, pulp and numpy each take around 100 ms to import.  A day that only
+needs one of them in part 2, or in a branch that rarely runs, shouldn't pay
+for it up front:
+
+    from aoclib import lazy
+
+    shapely = lazy.module('shapely')
+
+    shapely.Polygon(points)   # the real import happens here
+
+A missing package still fails at the lazy.module() line, like a plain import
+would; only running the module's code is put off.  `doit startup` shows what
+each day spends importing.
+"""
+import importlib.util
+import sys
+import unittest
+
+
+class TestLazy(unittest.TestCase):
+    def test_module(self):
+        name = 'colorsys'
+        loaded = sys.modules.pop(name, None)
+        try:
+            colorsys = module(name)
+            self.assertIs(sys.modules[name], colorsys)
+            self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+            # Already imported modules come back as they are.
+            self.assertIs(module('unittest'), unittest)
+        finally:
+            sys.modules.pop(name, None)
+            if loaded is not None:
+                sys.modules[name] = loaded
+
+    def test_missing(self):
+        with self.assertRaises(ModuleNotFoundError):
+            module('no_such_module_anywhere')
+
+
+def module(name):
+    """Return the module called name, executed on first attribute access.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+
+    # Finding a submodule imports its parent package for real.
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    lazy_module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = lazy_module
+    loader.exec_module(lazy_module)
+    return lazy_module
+
+
+if __name__ == '__main__':
+    unittest.main()
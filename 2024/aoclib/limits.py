@@ -0,0 +1,141 @@
+"""Time and memory budgets for a part, so one runaway search can't stall a run.
+
+The runner wraps each part call in limited(seconds, memory_mb):
+
+    Time    On the main thread a SIGALRM timer raises PartTimeout wherever the
+            part happens to be, between two bytecodes.  Long calls into C
+            (a solver, a huge sort) only notice once they return.
+    Memory  The address-space rlimit is lowered to what the process has now
+            plus the budget, so an allocation past it raises MemoryError.  It
+            counts reserved address space, not resident memory, so leave some
+            headroom.
+
+Solutions can also check in themselves, which is the only way a deadline is
+noticed off the main thread (doit serve's tests, say):
+
+    from aoclib import limits
+
+    while queue:
+        limits.check()
+
+A day can set its own budget with `TIME_LIMIT = 120`, or per part with
+`TIME_LIMIT = {2: 120}`; the runner's limit applies otherwise.
+"""
+import contextlib
+import resource
+import signal
+import threading
+import time
+import unittest
+
+
+# time.monotonic() after which check() raises, or None.
+DEADLINE = None
+
+
+class PartTimeout(Exception):
+    pass
+
+
+class TestLimits(unittest.TestCase):
+    def test_timeout(self):
+        with self.assertRaises(PartTimeout):
+            with limited(seconds=0.05):
+                while True:
+                    pass
+        self.assertIsNone(DEADLINE)
+
+    def test_check(self):
+        with limited(seconds=60):
+            check()
+        with self.assertRaises(PartTimeout):
+            with limited(seconds=0.01):
+                time.sleep(0.02)
+                check()
+
+    def test_memory(self):
+        with self.assertRaises(MemoryError):
+            with limited(memory_mb=32):
+                bytearray(256 * 2 ** 20)
+        # The old limit is back.
+        bytearray(256 * 2 ** 20)
+
+    def test_part_limit(self):
+        class Module:
+            TIME_LIMIT = {2: 5}
+        self.assertEqual(part_limit(Module, 2, 10), 5)
+        self.assertEqual(part_limit(Module, 1, 10), 10)
+        self.assertEqual(part_limit(object(), 1, None), None)
+
+
+def check():
+    """Raise PartTimeout once the running part is past its deadline."""
+    if DEADLINE is not None and time.monotonic() > DEADLINE:
+        raise PartTimeout('Time budget exceeded')
+
+
+def part_limit(module, part, default):
+    """The time limit for one part: the module's TIME_LIMIT if it has one."""
+    limit = getattr(module, 'TIME_LIMIT', None)
+    if isinstance(limit, dict):
+        limit = limit.get(part)
+    return default if limit is None else limit
+
+
+@contextlib.contextmanager
+def limited(seconds=None, memory_mb=None):
+    """Raise PartTimeout after seconds, MemoryError past memory_mb more memory.
+    """
+    global DEADLINE
+    stack = contextlib.ExitStack()
+    with stack:
+        if seconds is not None:
+            DEADLINE = time.monotonic() + seconds
+            stack.callback(_clear_deadline)
+            if threading.current_thread() is threading.main_thread():
+                stack.enter_context(_alarm(seconds))
+        if memory_mb is not None:
+            stack.enter_context(_address_space_limit(memory_mb))
+        yield
+
+
+def _clear_deadline():
+    global DEADLINE
+    DEADLINE = None
+
+
+def _raise_timeout(signum, frame):
+    raise PartTimeout('Time budget exceeded')
+
+
+@contextlib.contextmanager
+def _alarm(seconds):
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _address_space():
+    with open('/proc/self/statm') as fp:
+        return int(fp.read().split()[0]) * resource.getpagesize()
+
+
+@contextlib.contextmanager
+def _address_space_limit(memory_mb):
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = _address_space() + int(memory_mb * 2 ** 20)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+if __name__ == '__main__':
+    unittest.main()
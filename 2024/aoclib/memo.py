@@ -0,0 +1,290 @@
+"""Memoize recursive solvers, with hit/miss counts the runner can report.
+
+    from aoclib import memo
+
+    @memo.memoize
+    def ways(row, col):
+        ...
+
+    @memo.memoize(maxsize=100_000)          # least recently used go first
+    @memo.memoize(max_bytes=256 * 2 ** 20)  # bounded by (shallow) size instead
+    @memo.memoize(key=lambda bag, bags: bag)
+
+Arguments must be hashable unless key= picks out what is.  On a method the
+instance is the first argument, like any other.
+
+Each memo counts hits, misses and evictions under its function's name.  The
+runner empties every cache and zeroes the counts before each part, so one
+input's answers never leak into the next, and with `doit run --count` the
+counts show up with the part's other counters ('traverse.hits', ...).
+
+Recursion deeper than the interpreter's limit needs the solver written as a
+generator: each recursive call becomes `value = yield (args...)`, and the memo
+runs it on an explicit stack instead of Python's:
+
+    @memo.memoize
+    def depth(node):
+        if node == 0:
+            return 0
+        return (yield (node - 1,)) + 1
+
+    depth(1_000_000)
+"""
+import collections
+import inspect
+import sys
+import types
+import unittest
+import weakref
+
+from aoclib import counters
+
+
+class Stats:
+    __slots__ = ('hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return f'Stats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})'
+
+
+# {name: Stats}, kept here so a memo that was local to a part still reports.
+_stats = collections.defaultdict(Stats)
+# Every live Memo, for reset().
+_memos = weakref.WeakSet()
+
+
+class TestMemo(unittest.TestCase):
+    def setUp(self):
+        reset()
+
+    def test_unbounded(self):
+        calls = []
+
+        @memoize
+        def fib(n):
+            calls.append(n)
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(30), 832040)
+        self.assertEqual(len(calls), 31)
+        self.assertEqual((fib.stats.hits, fib.stats.misses), (28, 31))
+
+    def test_lru(self):
+        @memoize(maxsize=2)
+        def square(n):
+            return n * n
+
+        for n in (1, 2, 1, 3, 2):
+            square(n)
+        # 3 pushed out 2, not the more recently used 1.
+        self.assertEqual(list(square.cache), [(3,), (2,)])
+        self.assertEqual((square.stats.hits, square.stats.evictions), (1, 2))
+
+    def test_max_bytes(self):
+        @memoize(max_bytes=3 * 1000)
+        def block(n):
+            return bytes(900)
+
+        for n in range(5):
+            block(n)
+        self.assertLessEqual(block.size, 3 * 1000)
+        self.assertLess(len(block.cache), 5)
+        self.assertEqual(block.stats.evictions, 5 - len(block.cache))
+
+    def test_key_and_methods(self):
+        class Bag:
+            def __init__(self, inner):
+                self.inner = inner
+
+            @memoize(key=lambda bag, bags: bag)
+            def total(self, bags):
+                return sum(1 + bag.total(bags) for bag in self.inner)
+
+        leaf = Bag([])
+        middle = Bag([leaf, leaf])
+        self.assertEqual(Bag([middle, middle]).total({}), 6)
+        self.assertEqual(Bag.total.stats.hits, 2)
+
+    def test_explicit_stack(self):
+        @memoize
+        def depth(node):
+            if node == 0:
+                return 0
+            return (yield (node - 1,)) + 1
+
+        deep = sys.getrecursionlimit() * 10
+        self.assertEqual(depth(deep), deep)
+        self.assertEqual(depth(deep // 2), deep // 2)
+        self.assertEqual(depth.stats.hits, 1)
+
+        @memoize
+        def forever(node):
+            return (yield (node,))
+
+        with self.assertRaises(RecursionError):
+            forever(1)
+
+    def test_reset_and_report(self):
+        @memoize
+        def double(n):
+            return 2 * n
+
+        double(1)
+        double(1)
+        was_enabled = counters.ENABLED
+        counters.enable()
+        counters.reset()
+        try:
+            report()
+            self.assertEqual(counters.snapshot()[f'{double.name}.hits'], 1)
+        finally:
+            counters.reset()
+            counters.enable(was_enabled)
+        reset()
+        self.assertEqual(len(double.cache), 0)
+        self.assertEqual(double.stats.hits, 0)
+
+
+class Memo:
+    def __init__(self, function, maxsize=None, max_bytes=None, key=None, name=None):
+        self.function = function
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.key = key
+        self.name = name or function.__qualname__.replace('.<locals>', '')
+        self.stats = _stats[self.name]
+        self.bounded = maxsize is not None or max_bytes is not None
+        self.cache = collections.OrderedDict() if self.bounded else {}
+        # Shallow bytes held, tracked only for max_bytes.
+        self.size = 0
+        self.stacked = inspect.isgeneratorfunction(function)
+        # Keys a stacked call is still working out; seeing one again is a cycle.
+        self.pending = set()
+        self.__wrapped__ = function
+        self.__doc__ = function.__doc__
+        self.__name__ = function.__name__
+        self.__qualname__ = function.__qualname__
+        _memos.add(self)
+
+    def __repr__(self):
+        return f'Memo({self.name}, {len(self.cache)} cached, {self.stats})'
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, *args):
+        key = self.key(*args) if self.key is not None else args
+        cache = self.cache
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            self.stats.hits += 1
+            if self.bounded:
+                cache.move_to_end(key)
+            return value
+        self.stats.misses += 1
+        if self.stacked:
+            return self._run_stack(key, args)
+        value = self.function(*args)
+        self._store(key, value)
+        return value
+
+    def clear(self):
+        self.cache.clear()
+        self.pending.clear()
+        self.size = 0
+
+    def _store(self, key, value):
+        cache = self.cache
+        cache[key] = value
+        if not self.bounded:
+            return
+        if self.max_bytes is not None:
+            self.size += _sizeof(key, value)
+        while cache and (
+            (self.maxsize is not None and len(cache) > self.maxsize)
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            old_key, old_value = cache.popitem(last=False)
+            self.stats.evictions += 1
+            if self.max_bytes is not None:
+                self.size -= _sizeof(old_key, old_value)
+
+    def _run_stack(self, key, args):
+        # Drive generator solvers: each yield is a recursive call's arguments,
+        # answered from the cache or by pushing another generator.
+        cache, stats, pending = self.cache, self.stats, self.pending
+        stack = [(key, self.function(*args))]
+        pending.add(key)
+        value = None
+        try:
+            while stack:
+                key, generator = stack[-1]
+                try:
+                    args = generator.send(value)
+                except StopIteration as stop:
+                    stack.pop()
+                    pending.discard(key)
+                    value = stop.value
+                    self._store(key, value)
+                    continue
+                key = self.key(*args) if self.key is not None else args
+                if key in cache:
+                    stats.hits += 1
+                    value = cache[key]
+                    if self.bounded:
+                        cache.move_to_end(key)
+                    continue
+                if key in pending:
+                    raise RecursionError(f'{self.name}{args} depends on itself')
+                stats.misses += 1
+                pending.add(key)
+                stack.append((key, self.function(*args)))
+                value = None
+        finally:
+            for key, generator in stack:
+                pending.discard(key)
+                generator.close()
+        return value
+
+
+def memoize(function=None, *, maxsize=None, max_bytes=None, key=None, name=None):
+    """Decorate with or without arguments; see the module docstring."""
+    def decorate(function):
+        return Memo(function, maxsize=maxsize, max_bytes=max_bytes, key=key, name=name)
+    if function is not None:
+        return decorate(function)
+    return decorate
+
+
+def reset():
+    """Empty every cache and zero the counts; the runner calls this per part."""
+    for memo in list(_memos):
+        memo.clear()
+    for stats in _stats.values():
+        stats.hits = stats.misses = stats.evictions = 0
+
+
+def report():
+    """Add each memo's counts to aoclib.counters."""
+    for name, stats in _stats.items():
+        if stats.hits or stats.misses:
+            counters.add(f'{name}.hits', stats.hits)
+            counters.add(f'{name}.misses', stats.misses)
+            if stats.evictions:
+                counters.add(f'{name}.evictions', stats.evictions)
+
+
+def _sizeof(key, value):
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
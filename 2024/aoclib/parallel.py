@@ -0,0 +1,124 @@
+"""Fan whole days out over a process pool.
+
+Days are independent, so each one runs in a worker process from start to
+finish: import, load, parse and both parts.  The slowest days are submitted
+first so they overlap with the many quick ones instead of trailing at the end.
+
+Parts whose code and input haven't changed since their last clean run aren't
+run at all; their stored answers are reported instead (see aoclib.answers).
+"""
+import concurrent.futures
+import json
+import os
+import traceback
+
+from aoclib import answers
+from aoclib.catalog import PARTS, STATE_DIR, find
+from aoclib.runner import ERROR, MISSING, PartResult, run_parts
+
+
+TIMINGS_PATH = STATE_DIR / 'timings.json'
+
+
+def load_timings(path=TIMINGS_PATH):
+    """Return {(year, day): seconds} from the last recorded run.
+    """
+    try:
+        with open(path) as fp:
+            raw = json.load(fp)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    timings = {}
+    for key, seconds in raw.items():
+        year, day = key.split('-')
+        timings[(int(year), int(day))] = seconds
+    return timings
+
+
+def save_timings(timings, path=TIMINGS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = {f'{year}-{day:02}': seconds for (year, day), seconds in sorted(timings.items())}
+    with open(path, mode='w') as fp:
+        json.dump(raw, fp, indent=2)
+
+
+def schedule(solutions, timings):
+    """Longest expected first.  Days never timed go to the front, they may be slow.
+    """
+    def expected(solution):
+        return timings.get(solution.key, float('inf'))
+    return sorted(solutions, key=expected, reverse=True)
+
+
+def _run_day(year, day, parts, quiet, budget):
+    # Runs in the worker; only picklable things cross the process boundary.
+    return run_parts(find(year, day), parts, quiet=quiet, **budget)
+
+
+def run_catalog(solutions, jobs=1, quiet=True, force=False, time_limit=None, memory_limit=None, resume=False):
+    """Run every solution, yielding each day's list of PartResults as it finishes.
+
+    jobs=1 runs in this process, jobs=0 uses every core.  Timings for days that
+    ran cleanly are recorded for the next run's schedule.  Parts with a stored
+    answer for the same code and input come back cached, unless force.
+    time_limit, memory_limit and resume are passed on to run_parts.
+    """
+    budget = {'time_limit': time_limit, 'memory_limit': memory_limit, 'resume': resume}
+    timings = load_timings()
+    jobs = jobs or os.cpu_count()
+    store = answers.AnswerStore()
+
+    # {(year, day): (stamp, {part: cached PartResult})}
+    known = {}
+    pending = []
+    for solution in solutions:
+        stamp = answers.stamp(solution)
+        cached = {} if force or stamp is None else store.lookup(solution.year, solution.day, stamp)
+        known[solution.key] = (stamp, cached)
+        if len(cached) == len(PARTS):
+            yield [cached[part] for part in PARTS]
+        else:
+            pending.append(solution)
+
+    # Serial runs keep catalog order, it reads better.
+    ordered = schedule(pending, timings) if jobs > 1 else pending
+
+    def wanted(solution):
+        return [part for part in PARTS if part not in known[solution.key][1]]
+
+    def record(results):
+        year, day = results[0].year, results[0].day
+        stamp, cached = known[(year, day)]
+        results = sorted(results + list(cached.values()), key=lambda result: result.part)
+        if all(result.ok or result.status == MISSING for result in results):
+            timings[(year, day)] = sum(result.parse_seconds + result.seconds for result in results)
+        if stamp is not None:
+            store.record(results, stamp)
+        return results
+
+    try:
+        if jobs == 1:
+            for solution in ordered:
+                yield record(run_parts(solution, wanted(solution), quiet=quiet, **budget))
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(_run_day, solution.year, solution.day, wanted(solution), quiet, budget): solution
+                for solution in ordered
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception:
+                    # The worker itself died, e.g. a solution killed the process.
+                    solution = futures[future]
+                    error = traceback.format_exc()
+                    results = [
+                        PartResult(solution.year, solution.day, part, status=ERROR, error=error)
+                        for part in wanted(solution)
+                    ]
+                yield record(results)
+    finally:
+        save_timings(timings)
+        store.close()
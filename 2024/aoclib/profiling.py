@@ -0,0 +1,273 @@
+"""Profile one part without editing the solution.
+
+A part is run three times, each on freshly parsed arguments, so the tools don't
+skew each other:
+
+    cProfile      call counts and time per function, saved as pstats.
+    stack samples the whole call stack every millisecond or so, saved as
+                  collapsed stacks ("a;b;c 12" per line) for flamegraph.pl,
+                  speedscope or inferno.  A quick part is run again until
+                  there are MIN_SAMPLES samples or SAMPLE_SECONDS have gone;
+                  with fewer samples than that no .collapsed file is written.
+    tracemalloc   peak traced memory and the lines holding the most memory
+                  as it neared the peak.  A part too quick to catch on the
+                  way up reports what was still allocated after it returned.
+
+Files land in .doit/profile/ as <year>-<stem>-part<N>.pstats, .collapsed and
+.alloc.txt.  The pstats file opens with `python -m pstats` or snakeviz.
+"""
+import collections
+import contextlib
+import cProfile
+import dataclasses
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+import unittest
+
+from aoclib import memo
+from aoclib.catalog import STATE_DIR, year_context
+
+
+PROFILE_DIR = STATE_DIR / 'profile'
+
+# Seconds between stack samples.  The sampler needs the GIL to look, so a hot
+# loop that never releases it is sampled about every sys.getswitchinterval().
+SAMPLE_INTERVAL = 0.001
+
+# Fewer samples than this say more about luck than about the part.
+MIN_SAMPLES = 50
+# How long to keep re-running a quick part for samples.
+SAMPLE_SECONDS = 2.0
+
+# Take another allocation snapshot once traced memory grows by this factor.
+SNAPSHOT_GROWTH = 1.1
+
+
+class TestSampler(unittest.TestCase):
+    def test_collapsed(self):
+        def busy():
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                pass
+
+        sampler = StackSampler(interval=0.001)
+        sampler.call(busy)
+        self.assertTrue(sampler.stacks)
+        stack, count = sampler.stacks.most_common(1)[0]
+        self.assertIn('.busy (', stack.split(';')[-1])
+        # Nothing from after the call returned.
+        self.assertFalse(any('threading' in stack for stack in sampler.stacks))
+        self.assertIn(f'{stack} {count}', sampler.collapsed().splitlines())
+
+
+class StackSampler:
+    """Count the call stacks seen under one function call.
+
+    Stacks are rooted at the called function; the frames of whoever called
+    it are left out.
+    """
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = collections.Counter()
+        self.samples = 0
+
+    def call(self, function, *args):
+        target = threading.get_ident()
+        # The frame of this call marks the bottom of every stack.
+        base = sys._getframe()
+        done = threading.Event()
+
+        def sample():
+            while not done.wait(self.interval):
+                frame = sys._current_frames().get(target)
+                stack = []
+                while frame is not None and frame is not base:
+                    stack.append(_label(frame.f_code))
+                    frame = frame.f_back
+                # Once done, the stack is this function's own cleanup.
+                if frame is base and stack and not done.is_set():
+                    self.stacks[';'.join(reversed(stack))] += 1
+                    self.samples += 1
+
+        sampler = threading.Thread(target=sample, name='aoc-sampler', daemon=True)
+        # A busy part holds the GIL for a whole switch interval at a time,
+        # which would cap the sample rate well below the interval asked for.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval))
+        sampler.start()
+        try:
+            return function(*args)
+        finally:
+            done.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in sorted(self.stacks.items()))
+
+
+def _label(code):
+    # Semicolons split frames in the collapsed format, keep them out of names.
+    name = code.co_qualname.replace(';', ':')
+    return f'{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})'
+
+
+def _short_path(filename):
+    for marker in ('/site-packages/', '/lib/python'):
+        if marker in filename:
+            return filename.rsplit(marker, 1)[1]
+    return filename.replace(f'{STATE_DIR.parent}/', '')
+
+
+@dataclasses.dataclass
+class ProfileResult:
+    year: int
+    day: int
+    part: int
+    seconds: float
+    stats: pstats.Stats
+    # {kind: path} of what was written.
+    files: dict
+    samples: int = 0
+    # Times the part was run to collect the samples.
+    sample_runs: int = 0
+    peak_bytes: int = 0
+    allocations: list = dataclasses.field(default_factory=list)
+    # Traced bytes when the allocation snapshot was taken; None when it was
+    # taken after the part returned.
+    snapshot_bytes: int = None
+
+
+def profile_part(solution, part, out_dir=PROFILE_DIR, stacks=True, memory=True, top=15):
+    """Profile one part, write the reports under out_dir and return a summary.
+
+    parse() runs outside the profilers; only the part call is measured.
+    Whatever the solution prints is discarded.
+    """
+    function = solution.parts()[part]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f'{solution.year}-{solution.path.stem}-part{part}'
+    files = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = solution.load_data()
+        with year_context(solution.year):
+            profiler = cProfile.Profile()
+            arguments = solution.arguments(data)
+            start = time.perf_counter()
+            profiler.runcall(function, *arguments)
+            seconds = time.perf_counter() - start
+            files['pstats'] = stem.with_suffix('.pstats')
+            profiler.dump_stats(files['pstats'])
+            stats = pstats.Stats(profiler, stream=io.StringIO())
+
+            result = ProfileResult(solution.year, solution.day, part, seconds, stats, files)
+
+            if stacks:
+                sampler = StackSampler()
+                deadline = time.perf_counter() + SAMPLE_SECONDS
+                while sampler.samples < MIN_SAMPLES and time.perf_counter() < deadline:
+                    arguments = solution.arguments(data)
+                    memo.reset()
+                    sampler.call(function, *arguments)
+                    result.sample_runs += 1
+                result.samples = sampler.samples
+                if sampler.samples >= MIN_SAMPLES:
+                    files['collapsed'] = stem.with_suffix('.collapsed')
+                    files['collapsed'].write_text(sampler.collapsed())
+
+            if memory:
+                arguments = solution.arguments(data)
+                memo.reset()
+                watcher = _PeakSnapshots()
+                tracemalloc.start()
+                try:
+                    watcher.call(function, *arguments)
+                    _, result.peak_bytes = tracemalloc.get_traced_memory()
+                    if watcher.snapshot is None:
+                        watcher.snapshot = tracemalloc.take_snapshot()
+                    else:
+                        result.snapshot_bytes = watcher.snapshot_bytes
+                finally:
+                    tracemalloc.stop()
+                snapshot = watcher.snapshot.filter_traces([
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, threading.__file__),
+                    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                    tracemalloc.Filter(False, __file__),
+                ])
+                result.allocations = snapshot.statistics('lineno')[:top]
+                files['alloc'] = stem.with_suffix('.alloc.txt')
+                files['alloc'].write_text(_allocation_report(result))
+
+    return result
+
+
+class _PeakSnapshots:
+    """Snapshot tracemalloc's traces each time a call's memory climbs higher.
+
+    The last snapshot is the one nearest the peak.  Snapshots copy every trace,
+    so one is only taken after SNAPSHOT_GROWTH more memory.
+    """
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_bytes = 0
+
+    def call(self, function, *args):
+        done = threading.Event()
+        start, _ = tracemalloc.get_traced_memory()
+
+        def watch():
+            while not done.wait(self.interval):
+                current, _ = tracemalloc.get_traced_memory()
+                if current - start > max(self.snapshot_bytes - start, 0) * SNAPSHOT_GROWTH:
+                    self.snapshot = tracemalloc.take_snapshot()
+                    self.snapshot_bytes = current
+
+        watcher = threading.Thread(target=watch, name='aoc-alloc-watcher', daemon=True)
+        watcher.start()
+        try:
+            return function(*args)
+        finally:
+            done.set()
+            watcher.join()
+
+
+def _allocation_report(result):
+    if result.snapshot_bytes is None:
+        heading = 'still allocated after the part returned (it was too quick to catch nearer the peak)'
+    else:
+        heading = f'allocated at {result.snapshot_bytes / 1024:.1f} KiB traced, the nearest snapshot to the peak'
+    lines = [f'peak {result.peak_bytes / 1024:.1f} KiB traced', heading, '']
+    for stat in result.allocations:
+        frame = stat.traceback[0]
+        lines.append(
+            f'{stat.size / 1024:>10.1f} KiB {stat.count:>9} blocks  '
+            f'{_short_path(frame.filename)}:{frame.lineno}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def top_functions(stats, sort='tottime', limit=15):
+    """Return [(label, calls, tottime, cumtime)] for the costliest functions.
+    """
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        if filename == '~':
+            # Builtins: name is already '<built-in method ...>'.
+            label = name
+        else:
+            label = f'{name} ({_short_path(filename)}:{line})'
+        rows.append((label, calls, tottime, cumtime))
+    column = {'tottime': 2, 'cumtime': 3, 'calls': 1}[sort]
+    rows.sort(key=lambda row: row[column], reverse=True)
+    return rows[:limit]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Run a solution's parts in-process and time them.
+"""
+import contextlib
+import dataclasses
+import io
+import time
+import traceback
+
+from aoclib import checkpoint, counters, limits, memo
+from aoclib.catalog import year_context
+
+
+OK = 'ok'
+ERROR = 'error'
+MISSING = 'missing'
+# Over the part's time or memory budget, see aoclib.limits.
+TIMEOUT = 'timeout'
+OOM = 'oom'
+
+
+@dataclasses.dataclass
+class PartResult:
+    year: int
+    day: int
+    part: int
+    status: str = OK
+    answer: object = None
+    # Wall time of the part call alone, monotonic clock.
+    seconds: float = 0.0
+    # Wall time spent in the module's parse() hook for this part.
+    parse_seconds: float = 0.0
+    # Wall time importing the solution module here; 0 if it was already loaded.
+    import_seconds: float = 0.0
+    error: str = None
+    # {name: total or Histogram} from aoclib.counters, when counting is on.
+    counters: dict = None
+    # Answer taken from aoclib.answers instead of running the part.
+    cached: bool = False
+
+    @property
+    def ok(self):
+        return self.status == OK
+
+
+def run_parts(solution, parts=None, quiet=False, input_path=None, time_limit=None, memory_limit=None,
+              resume=False):
+    """Run the requested parts (default: all defined) of one solution.
+
+    The input is read once; parse() runs once per part since parts are allowed
+    to mutate their arguments.  With quiet, anything the solution prints is
+    discarded.  input_path runs on that file instead of the day's own input,
+    without the parse cache.
+
+    time_limit (seconds) and memory_limit (MB) budget each part call; a part
+    over budget is reported as TIMEOUT or OOM and the next one still runs.
+    With resume, parts that use aoclib.checkpoint pick up where they stopped.
+    """
+    year, day = solution.key
+    wanted = parts or (1, 2)
+    output = io.StringIO() if quiet else None
+
+    try:
+        with _redirect(output):
+            start = time.perf_counter()
+            available = solution.parts()
+            import_seconds = time.perf_counter() - start
+            data = solution.load_data(input_path)
+    except (Exception, SystemExit):
+        return [
+            PartResult(year, day, part, status=ERROR, error=traceback.format_exc())
+            for part in wanted
+        ]
+
+    results = []
+    for part in wanted:
+        function = available.get(part)
+        if function is None:
+            results.append(PartResult(year, day, part, status=MISSING))
+            continue
+        seconds = limits.part_limit(solution.module, part, time_limit)
+        result = _run_part(
+            solution, part, function, data, output, use_cache=input_path is None,
+            time_limit=seconds, memory_limit=memory_limit, resume=resume,
+        )
+        result.import_seconds = import_seconds
+        results.append(result)
+    return results
+
+
+def _run_part(solution, part, function, data, output, use_cache=True, time_limit=None, memory_limit=None,
+              resume=False):
+    year, day = solution.key
+    result = PartResult(year, day, part)
+    with year_context(year), _redirect(output):
+        try:
+            start = time.perf_counter()
+            arguments = solution.arguments(data, use_cache=use_cache)
+            result.parse_seconds = time.perf_counter() - start
+
+            # Nothing memoized for another part or input carries over.
+            memo.reset()
+            if counters.ENABLED:
+                # Only the part's own work, not parse() or the last part.
+                counters.reset()
+            # Checkpoints belong to the day's own input, not to batch inputs.
+            saves = _checkpoint_scope(solution, part, resume) if use_cache else contextlib.nullcontext()
+            start = time.perf_counter()
+            try:
+                with saves, limits.limited(time_limit, memory_limit):
+                    result.answer = function(*arguments)
+            finally:
+                result.seconds = time.perf_counter() - start
+                if counters.ENABLED:
+                    # Partial counts too, for a part that ran out of budget.
+                    memo.report()
+                    result.counters = counters.snapshot()
+        except limits.PartTimeout:
+            result.status = TIMEOUT
+            result.error = traceback.format_exc()
+        except MemoryError:
+            result.status = OOM
+            result.error = traceback.format_exc()
+        except (Exception, SystemExit):
+            # SystemExit too: a few old solutions exit() on bad input.
+            result.status = ERROR
+            result.error = traceback.format_exc()
+    if result.ok and use_cache:
+        checkpoint.clear(_checkpoint_directory(solution, part))
+    return result
+
+
+def _checkpoint_directory(solution, part):
+    return checkpoint.CHECKPOINT_DIR / f'{solution.year}-{solution.path.stem}-part{part}'
+
+
+def _checkpoint_scope(solution, part, resume):
+    # aoclib.answers imports this module.
+    from aoclib import answers
+
+    stamp = answers.stamp(solution) or solution.code_digest.hex()
+    return checkpoint.scope(_checkpoint_directory(solution, part), stamp, resume)
+
+
+def _redirect(output):
+    if output is None:
+        return contextlib.nullcontext()
+    return contextlib.redirect_stdout(output)
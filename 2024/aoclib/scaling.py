@@ -0,0 +1,102 @@
+"""Run a part over synthetic inputs of growing size and fit how it scales.
+
+A module opts in with a generator hook:
+
+    generate(size, rng)   Return input lines for a puzzle of the given size,
+                          drawing randomness only from rng (a random.Random).
+    SCALE_SIZES           Optional default sizes for `doit scale`.
+
+What "size" means is up to the day: points, grid side, caves, operands.  The
+fitted exponent is the slope of log(time) against log(size), so 1 is linear
+and 2 quadratic.  Exponential growth shows up as local exponents that keep
+climbing from one size to the next.
+"""
+import contextlib
+import dataclasses
+import io
+import math
+import random
+import time
+import unittest
+
+from aoclib import memo, trace
+from aoclib.catalog import year_context
+
+
+DEFAULT_SIZES = (100, 200, 400, 800)
+
+
+class TestFit(unittest.TestCase):
+    def test_fit_exponent(self):
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_exponent(sizes, [n * 0.001 for n in sizes]), 1.0)
+        self.assertAlmostEqual(fit_exponent(sizes, [n * n * 0.001 for n in sizes]), 2.0)
+        self.assertIsNone(fit_exponent([10], [1.0]))
+
+
+@dataclasses.dataclass
+class ScalePoint:
+    size: int
+    seconds: float
+    lines: int
+
+
+def fit_exponent(sizes, seconds):
+    """Least-squares slope of log(seconds) over log(size), or None with too few points.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def local_exponent(previous, point):
+    if previous.seconds <= 0 or point.seconds <= 0 or previous.size == point.size:
+        return None
+    return math.log(point.seconds / previous.seconds) / math.log(point.size / previous.size)
+
+
+def default_sizes(solution):
+    return tuple(getattr(solution.module, 'SCALE_SIZES', DEFAULT_SIZES))
+
+
+def measure(solution, part, size, seed=0, repeat=1, warmup=0):
+    """Best-of-repeat time for one part on a generated input of this size.
+
+    The input is generated once per size from its own seeded rng, so a given
+    (seed, size) is always the same input.  Parsing isn't timed and skips the
+    parse cache.  Memos are emptied before each run, as the runner does.
+    Solution output and trace messages are discarded.
+    """
+    generate = getattr(solution.module, 'generate', None)
+    if generate is None:
+        raise LookupError(f'{solution} has no generate(size, rng) hook')
+    function = solution.parts()[part]
+
+    level = trace.level()
+    trace.configure('off')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), year_context(solution.year):
+            data = generate(size, random.Random(f'{seed}-{size}'))
+            samples = []
+            for i in range(warmup + repeat):
+                arguments = solution.arguments(data, use_cache=False)
+                # As the runner does, so a memoized part is timed cold each time.
+                memo.reset()
+                start = time.perf_counter()
+                function(*arguments)
+                elapsed = time.perf_counter() - start
+                if i >= warmup:
+                    samples.append(elapsed)
+    finally:
+        trace.configure(level)
+    return ScalePoint(size, min(samples), len(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""Keep solutions loaded between runs: `doit serve` and `doit run --remote`.
+
+Running ./dayNN.py over and over pays for the interpreter, the imports and the
+parse every time.  The server keeps all of that in one long-lived process and
+takes run requests on a Unix socket in .doit/:
+
+    doit serve &
+    doit run 2025 8 --remote
+
+A second `doit serve` refuses to start while the first still answers; a socket
+left behind by one that died is cleared away.
+
+Before each run the solution module and its year's helper modules are checked
+by mtime; an edited one is loaded again, everything else stays warm.  Parsed
+inputs stay in the parse cache's memory layer (see aoclib.cache).
+
+Requests are handled one at a time since solutions chdir into their year.  A
+request is one JSON line; the reply is a pickled dict, so only talk to a
+server you started yourself.
+"""
+import contextlib
+import io
+import json
+import os
+import pickle
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from aoclib import counters, trace
+from aoclib.catalog import SOLUTION_PATTERN, STATE_DIR, find
+from aoclib.runner import run_parts
+
+
+SOCKET_PATH = STATE_DIR / 'serve.sock'
+
+
+class TestServer(unittest.TestCase):
+    def test_ping_and_stop(self):
+        path = os.path.join(tempfile.mkdtemp(), 'test.sock')
+        server = Server(path)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            self.assertEqual(request({'command': 'ping'}, path)['loaded'], 0)
+            self.assertIn('error', request({'command': 'nonsense'}, path))
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+            # A second server leaves the live one's socket alone.
+            with self.assertRaises(RuntimeError):
+                Server(path)
+            self.assertIn('pid', request({'command': 'ping'}, path))
+            # An answer that can't be pickled comes back as an error.
+            server.run = lambda *args, **kwargs: {'results': [lambda: None]}
+            reply = request({'command': 'run', 'year': 2025, 'day': 1}, path)
+            self.assertIn('pickle', reply['error'])
+        finally:
+            request({'command': 'stop'}, path)
+            thread.join(timeout=5)
+            server.server_close()
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(path))
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path=SOCKET_PATH):
+        self.path = os.fspath(path)
+        if os.path.exists(self.path):
+            try:
+                reply = request({'command': 'ping'}, self.path)
+            except ConnectionError:
+                # Left behind by a server that didn't shut down cleanly.
+                os.remove(self.path)
+            else:
+                raise RuntimeError(f'doit serve is already running on {self.path} (pid {reply.get("pid")})')
+        # {(year, day): (Solution, {path: mtime})}
+        self.solutions = {}
+        # Replies are pickles, so the socket is only ever ours: create it
+        # owner-only rather than tightening it after bind.
+        umask = os.umask(0o177)
+        try:
+            super().__init__(self.path, Handler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+    def solution(self, year, day):
+        """The loaded Solution for a day, loaded again if its code changed."""
+        loaded = self.solutions.get((year, day))
+        if loaded is not None:
+            solution, mtimes = loaded
+            if _mtimes(solution) == mtimes:
+                return solution
+            _forget_helpers(solution)
+
+        solution = find(year, day)
+        self.solutions[(year, day)] = (solution, _mtimes(solution))
+        return solution
+
+    def run(self, year, day, parts=None, quiet=False, trace_level=None, count=False, jobs=None, **budget):
+        solution = self.solution(year, day)
+        output = io.StringIO()
+        trace_output = io.StringIO()
+        level = trace.level()
+        was_counting = counters.ENABLED
+        was_jobs = os.environ.pop('AOC_JOBS', None)
+        if jobs is not None:
+            os.environ['AOC_JOBS'] = jobs
+        # Kept apart from what the part prints, which quiet drops: the client
+        # writes it to stderr, where a local run's trace goes.
+        trace.set_stream(trace_output)
+        try:
+            if trace_level:
+                trace.configure(trace_level)
+            counters.enable(count)
+            with contextlib.redirect_stdout(output):
+                results = run_parts(solution, parts, quiet=quiet, **budget)
+        finally:
+            os.environ.pop('AOC_JOBS', None)
+            if was_jobs is not None:
+                os.environ['AOC_JOBS'] = was_jobs
+            counters.enable(was_counting)
+            trace.configure(level)
+            trace.set_stream(None)
+        return {'results': results, 'output': output.getvalue(), 'trace': trace_output.getvalue()}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        start = time.perf_counter()
+        try:
+            message = json.loads(self.rfile.readline())
+            reply = self.dispatch(message)
+            reply['server_seconds'] = time.perf_counter() - start
+            # Inside the try: an answer that won't pickle is an error reply,
+            # not a dropped connection.
+            data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            reply = {'error': f'{type(e).__name__}: {e}', 'server_seconds': time.perf_counter() - start}
+            data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        self.wfile.write(data)
+
+    def dispatch(self, message):
+        command = message.get('command')
+        if command == 'run':
+            return self.server.run(
+                message['year'], message['day'], message.get('parts'),
+                quiet=message.get('quiet', False),
+                trace_level=message.get('trace'),
+                count=message.get('count', False),
+                jobs=message.get('jobs'),
+                time_limit=message.get('time_limit'),
+                memory_limit=message.get('memory_limit'),
+                resume=message.get('resume', False),
+            )
+        if command == 'ping':
+            return {'loaded': len(self.server.solutions), 'pid': os.getpid()}
+        if command == 'stop':
+            # shutdown() waits for serve_forever to return, which waits for us.
+            threading.Thread(target=self.server.shutdown).start()
+            return {}
+        raise ValueError(f'Unknown command {command!r}')
+
+
+def _helper_paths(solution):
+    return [
+        path for path in sorted(solution.directory.glob('*.py'))
+        if not SOLUTION_PATTERN.match(path.name)
+    ]
+
+
+def _mtimes(solution):
+    return {
+        path: path.stat().st_mtime_ns
+        for path in [solution.path] + _helper_paths(solution)
+    }
+
+
+def _forget_helpers(solution):
+    # Helpers are shared by a year's days; drop them so the next import reads
+    # the file again.  Unchanged ones are cheap to import.
+    for path in _helper_paths(solution):
+        sys.modules.pop(path.stem, None)
+
+
+def serve(path=SOCKET_PATH, ready=None):
+    """Serve until stopped; ready(path) is called once the socket is bound.
+
+    Raises RuntimeError if another server is already listening on path.
+    """
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with Server(path) as server:
+        if ready is not None:
+            ready(path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(message, path=SOCKET_PATH):
+    """Send one request and return the server's reply dict.
+
+    Raises ConnectionError when no server is listening at path, or it hangs up
+    without a reply.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(os.fspath(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise ConnectionError(f'No doit serve listening on {path}') from None
+        client.sendall(json.dumps(message).encode() + b'\n')
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := client.recv(65536):
+            chunks.append(chunk)
+    if not chunks:
+        raise ConnectionError(f'doit serve on {path} closed the connection without replying')
+    return pickle.loads(b''.join(chunks))
+
+
+if __name__ == '__main__':
+    unittest.main()
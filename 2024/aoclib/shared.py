@@ -0,0 +1,160 @@
+"""Hand a Grid to process-pool workers through shared memory instead of pickles.
+
+Submitting a task that takes the grid pickles the whole map into every task.
+share() copies the cells into a multiprocessing.shared_memory block once and
+gives back a handle of a few fields (block name, width, height, typecode);
+tasks take the handle, and each worker attaches to the block without copying:
+
+    with shared.share(grid) as handle:
+        with ProcessPoolExecutor() as executor:
+            total = sum(executor.map(check, itertools.repeat(handle), chunks))
+
+    def check(handle, chunk):
+        with shared.attach(handle) as grid:
+            ...
+
+Workers should treat the grid as read-only; writes land in the one block every
+worker sees.  The block is unlinked when the share() block exits.
+
+fan_out() does all of that for a list of tasks, and only when asked: it runs in
+the calling process unless `doit run --jobs N` (or AOC_JOBS) wants a pool.
+
+    results = shared.fan_out(check, grid, [(chunk,) for chunk in chunks])
+"""
+import contextlib
+import dataclasses
+import multiprocessing
+import os
+import unittest
+from multiprocessing import shared_memory
+
+from aoclib import limits
+from aoclib.grid import Grid
+
+
+@dataclasses.dataclass(frozen=True)
+class GridHandle:
+    # What a worker needs to find and shape the block.
+    name: str
+    width: int
+    height: int
+    typecode: str = 'B'
+
+
+class TestShared(unittest.TestCase):
+    def test_share_and_attach(self):
+        import concurrent.futures
+        grid = Grid.from_lines(['#..', '.#.'])
+        with share(grid) as handle:
+            self.assertEqual((handle.width, handle.height), (3, 2))
+            with attach(handle) as attached:
+                self.assertEqual(attached, grid)
+                self.assertEqual(attached.find(ord('#')), 0)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+                counts = list(executor.map(_count, [handle] * 2, [ord('#'), ord('.')]))
+            self.assertEqual(counts, [2, 4])
+
+    def test_fan_out(self):
+        import concurrent.futures
+        grid = Grid.from_lines(['#..', '.#.'])
+        tasks = [(ord('#'),), (ord('.'),), (ord('x'),)]
+        self.assertEqual(fan_out(_count_cells, grid, tasks, jobs=1), [2, 4, 0])
+        self.assertEqual(fan_out(_count_cells, grid, tasks, jobs=2), [2, 4, 0])
+        self.assertNotIn(os.getpid(), fan_out(_pid, grid, [()] * 2, jobs=2))
+        # Already in a worker: no pool of its own.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            worker = executor.submit(os.getpid).result()
+            nested = executor.submit(fan_out, _pid, grid, [()] * 2, 2).result()
+        self.assertEqual(nested, [worker, worker])
+
+    def test_wide_typecode(self):
+        grid = Grid(2, 2, [0, 70000, 1, 2], typecode='I')
+        with share(grid) as handle:
+            with attach(handle) as attached:
+                self.assertEqual(attached[0, 1], 70000)
+                self.assertEqual(attached.typecode, 'I')
+
+
+def _count(handle, value):
+    with attach(handle) as grid:
+        return grid.count(value)
+
+
+def _count_cells(grid, value):
+    return grid.count(value)
+
+
+def _pid(grid):
+    return os.getpid()
+
+
+@contextlib.contextmanager
+def share(grid):
+    """Copy grid into a new shared-memory block and yield its GridHandle."""
+    size = max(len(grid.cells) * grid.cells.itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        view = block.buf.cast(grid.typecode)
+        try:
+            view[:grid.size] = grid.cells
+        finally:
+            view.release()
+        yield GridHandle(block.name, grid.width, grid.height, grid.typecode)
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextlib.contextmanager
+def attach(handle):
+    """Yield a Grid whose cells are the shared block itself, no copy made."""
+    block = shared_memory.SharedMemory(name=handle.name)
+    view = block.buf.cast(handle.typecode)
+    cells = view[:handle.width * handle.height]
+    try:
+        yield Grid(handle.width, handle.height, cells)
+    finally:
+        # Every view onto the buffer has to go before the block can close.
+        cells.release()
+        view.release()
+        block.close()
+
+
+def fan_out(function, grid, tasks, jobs=None):
+    """[function(grid, *task) for task in tasks], over a process pool if asked.
+
+    jobs defaults to AOC_JOBS, else 1, which runs here; 0 means one per core.
+    Inside a worker process it always runs here, since pools don't nest.  Pool
+    workers get the grid from shared memory, so function has to be defined at
+    module level.  The part's time limit is checked while waiting; workers
+    inherit any memory limit, each on its own.
+    """
+    if jobs is None:
+        jobs = int(os.environ.get('AOC_JOBS', 1))
+    jobs = min(jobs or os.cpu_count(), len(tasks))
+    if jobs <= 1 or multiprocessing.parent_process() is not None:
+        results = []
+        for task in tasks:
+            limits.check()
+            results.append(function(grid, *task))
+        return results
+
+    with share(grid) as handle:
+        # Leaving the pool terminates the workers rather than waiting for
+        # them, so a time limit stops the whole search.
+        with multiprocessing.Pool(jobs) as pool:
+            result = pool.starmap_async(_attached, [(function, handle, task) for task in tasks])
+            while not result.ready():
+                result.wait(0.05)
+                limits.check()
+            return result.get()
+
+
+def _attached(function, handle, task):
+    # Runs in a pool worker.
+    with attach(handle) as grid:
+        return function(grid, *task)
+
+
+if __name__ == '__main__':
+    unittest.main()
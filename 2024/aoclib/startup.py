@@ -0,0 +1,125 @@
+"""What a day pays to import before its parts run.
+
+Each day is loaded in a fresh interpreter under `python -X importtime`, so
+nothing another day already imported hides the cost.  The aoclib runtime is
+imported before the clock starts; what's left is the solution module, its
+year's helpers and whatever they pull in.
+
+A module over its budget is usually importing something heavy at the top that
+only one code path needs; see aoclib.lazy.  The default budget can be raised
+per day with a module-level `STARTUP_BUDGET = 0.3` (seconds).
+"""
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+DEFAULT_BUDGET = 0.1
+
+_MARKER = '-- aoclib.startup --'
+
+# Runs in the child: load the day and report how long it took and its budget.
+_PROBE = f'''
+import json, sys, time
+from aoclib.catalog import find
+solution = find({{year}}, {{day}})
+sys.stderr.write({_MARKER!r} + '\\n')
+start = time.perf_counter()
+module = solution.module
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, getattr(module, 'STARTUP_BUDGET', None)]))
+'''
+
+
+class TestParse(unittest.TestCase):
+    def test_parse_importtime(self):
+        stderr = '\n'.join([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       100 |        100 | aoclib',
+            _MARKER,
+            'import time:       500 |        500 |     numpy.core',
+            'import time:      2000 |       2500 |   numpy',
+            'import time:        10 |         10 | json',
+        ])
+        imports = parse_importtime(stderr)
+        self.assertEqual([entry.name for entry in imports], ['numpy.core', 'numpy', 'json'])
+        self.assertEqual([entry.depth for entry in imports], [2, 1, 0])
+        self.assertAlmostEqual(imports[1].cumulative, 0.0025)
+
+
+@dataclasses.dataclass
+class ImportTime:
+    name: str
+    # Seconds in this module's own body, and including what it imported.
+    own: float
+    cumulative: float
+    # 0 for modules the solution (or its helpers) imported directly.
+    depth: int
+
+
+@dataclasses.dataclass
+class StartupResult:
+    year: int
+    day: int
+    seconds: float
+    budget: float
+    imports: list
+
+    @property
+    def over_budget(self):
+        return self.seconds > self.budget
+
+    def heaviest(self, limit=5):
+        """The direct imports that cost the most, cumulative."""
+        direct = [entry for entry in self.imports if entry.depth == 0]
+        return sorted(direct, key=lambda entry: entry.cumulative, reverse=True)[:limit]
+
+
+def budget(module):
+    return getattr(module, 'STARTUP_BUDGET', None) or DEFAULT_BUDGET
+
+
+def parse_importtime(stderr):
+    """Return the ImportTimes logged after the probe's marker line.
+    """
+    imports = []
+    lines = iter(stderr.splitlines())
+    for line in lines:
+        if line == _MARKER:
+            break
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        # One space after the bar, then two per level of nesting.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(ImportTime(
+            name.strip(), int(fields[0]) / 1e6, int(fields[1]) / 1e6, depth,
+        ))
+    return imports
+
+
+def measure_startup(year, day):
+    """Import one day in a fresh interpreter and return its StartupResult.
+    """
+    env = dict(os.environ, AOC_TRACE='off')
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE.format(year=year, day=day)],
+        capture_output=True, text=True, env=env,
+    )
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    seconds, day_budget = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupResult(
+        year, day, seconds, day_budget or DEFAULT_BUDGET, parse_importtime(completed.stderr),
+    )
+
+
+if __name__ == '__main__':
+    unittest.main()
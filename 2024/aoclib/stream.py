@@ -0,0 +1,89 @@
+"""Read an input file a line at a time instead of all at once.
+
+    def load_data():
+        stem = pathlib.Path(__file__).stem
+        return stream.Lines(f'{stem}-input.txt')
+
+Lines is re-iterable: every loop opens the file again and reads it lazily, so
+each part can walk the input once in constant memory however big it is.  The
+runner hands it to parse() and the parts as-is, without copying it into a list
+or through the parse cache.
+
+Solutions that index into their input (data[0], data.index('')) still want
+the usual list from load_data().
+"""
+import mmap
+import os
+import unittest
+
+
+class TestLines(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        fd, self.path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, mode='w') as fp:
+            fp.write(' a 1\nb 2 \n\nc 3')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_lines(self):
+        for use_mmap in (False, True):
+            lines = Lines(self.path, use_mmap=use_mmap)
+            self.assertEqual(list(lines), ['a 1', 'b 2', '', 'c 3'])
+            # Again, from the top.
+            self.assertEqual(next(iter(lines)), 'a 1')
+
+            raw = Lines(self.path, strip=False, use_mmap=use_mmap)
+            self.assertEqual(list(raw), [' a 1', 'b 2 ', '', 'c 3'])
+
+    def test_empty(self):
+        with open(self.path, mode='w'):
+            pass
+        self.assertEqual(list(Lines(self.path)), [])
+        self.assertEqual(list(Lines(self.path, use_mmap=True)), [])
+
+
+class Lines:
+    """Lazy, re-iterable lines of a text file.
+
+    strip=True strips surrounding whitespace like the templates always have;
+    strip=False only drops the line ending.  use_mmap maps the file instead of
+    reading it through a buffer, which lets the OS page it in and out.
+    """
+    def __init__(self, path, strip=True, use_mmap=False, encoding='utf-8'):
+        # Absolute and resolved: parts may run from another directory, and
+        # the runner may hand the loader a symlink that won't outlive it.
+        self.path = os.path.realpath(path)
+        self.strip = strip
+        self.use_mmap = use_mmap
+        self.encoding = encoding
+
+    def __repr__(self):
+        return f'Lines({self.path!r})'
+
+    def __iter__(self):
+        if self.use_mmap:
+            lines = self._mapped()
+        else:
+            lines = self._buffered()
+        if self.strip:
+            return (line.strip() for line in lines)
+        return (line.rstrip('\r\n') for line in lines)
+
+    def _buffered(self):
+        with open(self.path, encoding=self.encoding) as fp:
+            yield from fp
+
+    def _mapped(self):
+        with open(self.path, mode='rb') as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                # mmap refuses empty files.
+                return
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b''):
+                    yield line.decode(self.encoding)
+
+
+if __name__ == '__main__':
+    unittest.main()
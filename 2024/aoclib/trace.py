@@ -0,0 +1,107 @@
+"""Gated debug output for solution hot loops.
+
+Plain print() in a BFS or range-mapping loop costs the f-string formatting on
+every iteration even when nobody reads it.  This module keeps that cost at a
+single attribute check:
+
+    from aoclib import trace
+
+    if trace.DEBUG:
+        trace.debug('State: {} after {} presses.', visual(state), count)
+
+The `if` is the part that makes it free; nothing inside it is evaluated when the
+level is off.  Without the guard the message is still formatted lazily, but the
+arguments are evaluated by the call.
+
+The level comes from AOC_TRACE in the environment when running a script
+directly, or from `doit run --trace LEVEL`, and is off otherwise.
+"""
+import logging
+import os
+import sys
+
+
+TRACE_LEVEL = 5
+logging.addLevelName(TRACE_LEVEL, 'TRACE')
+
+LEVELS = {
+    'off': logging.CRITICAL + 1,
+    'info': logging.INFO,
+    'debug': logging.DEBUG,
+    'trace': TRACE_LEVEL,
+}
+
+log = logging.getLogger('aoc.trace')
+log.propagate = False
+_handler = logging.StreamHandler(sys.stderr)
+_handler.setFormatter(logging.Formatter('%(message)s'))
+log.addHandler(_handler)
+
+# Guards for call sites, refreshed by configure().
+INFO = False
+DEBUG = False
+TRACE = False
+
+
+class _Message:
+    """Format with str.format only if a handler actually emits the record.
+    """
+    __slots__ = ('template', 'args')
+
+    def __init__(self, template, args):
+        self.template = template
+        self.args = args
+
+    def __str__(self):
+        if self.args:
+            return self.template.format(*self.args)
+        return self.template
+
+
+def configure(level):
+    """Set the level by name: off, info, debug or trace.
+    """
+    global INFO, DEBUG, TRACE
+    try:
+        number = LEVELS[level.lower()]
+    except KeyError:
+        raise ValueError(f'Unknown trace level {level!r}, expected one of {", ".join(LEVELS)}') from None
+    log.setLevel(number)
+    INFO = number <= logging.INFO
+    DEBUG = number <= logging.DEBUG
+    TRACE = number <= TRACE_LEVEL
+
+
+def level():
+    for name, number in LEVELS.items():
+        if log.level == number:
+            return name
+    return logging.getLevelName(log.level).lower()
+
+
+def set_stream(stream):
+    """Send trace output to stream instead of stderr; None puts it back."""
+    _handler.setStream(sys.stderr if stream is None else stream)
+
+
+def info(template, *args):
+    if INFO:
+        log.info(_Message(template, args))
+
+
+def debug(template, *args):
+    if DEBUG:
+        log.debug(_Message(template, args))
+
+
+def trace(template, *args):
+    if TRACE:
+        log.log(TRACE_LEVEL, _Message(template, args))
+
+
+# Off unless asked for.  A typo in AOC_TRACE shouldn't break every import.
+try:
+    configure(os.environ.get('AOC_TRACE', 'off'))
+except ValueError as e:
+    print(f'Ignoring AOC_TRACE: {e}', file=sys.stderr)
+    configure('off')
@@ -0,0 +1,72 @@
+"""Disjoint-set union over the integers 0..n-1.
+
+Union by size keeps the trees shallow and find() halves the path as it walks,
+so a long run of unions and finds costs close to constant time each.  Callers
+with other kinds of items keep their own item -> index mapping.
+
+    circuits = DisjointSet(len(points))
+    circuits.union(i, j)     # True if i and j were in different sets
+    circuits.count           # number of disjoint sets left
+"""
+import unittest
+
+
+class TestDisjointSet(unittest.TestCase):
+    def test_union(self):
+        sets = DisjointSet(6)
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(2, 3))
+        self.assertTrue(sets.union(1, 3))
+        self.assertFalse(sets.union(0, 2))
+        self.assertEqual(sets.count, 3)
+        self.assertTrue(sets.connected(0, 3))
+        self.assertFalse(sets.connected(0, 4))
+        self.assertEqual(sets.size(2), 4)
+        self.assertEqual(sorted(sets.set_sizes(), reverse=True), [4, 1, 1])
+
+
+class DisjointSet:
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.sizes = [1] * size
+        # Number of disjoint sets.
+        self.count = size
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            # Path halving: point at the grandparent on the way up.
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        """Join the sets holding a and b.  False if they were already one set.
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.sizes[a] += self.sizes[b]
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def size(self, item):
+        """Size of the set holding item."""
+        return self.sizes[self.find(item)]
+
+    def set_sizes(self):
+        return [self.sizes[item] for item, parent in enumerate(self.parent) if item == parent]
+
+
+if __name__ == '__main__':
+    unittest.main()
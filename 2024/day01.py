@@ -34,6 +34,7 @@ def part_1(left_list, right_list):
         delta += abs(left - right)
 
     p(f'Total difference: {delta}')
+    return delta
 
 
 def part_2(left_list, right_list):
@@ -49,9 +50,10 @@ def part_2(left_list, right_list):
         delta += product
 
     print(f'Total difference: {delta}')
+    return delta
 
 
-def main(_input):
+def parse(_input):
     left_list = []
     right_list = []
 
@@ -60,6 +62,12 @@ def main(_input):
         left_list.append(int(left))
         right_list.append(int(right))
 
+    return left_list, right_list
+
+
+def main(_input):
+    left_list, right_list = parse(_input)
+
     # part_1(left_list, right_list)
     part_2(left_list, right_list)
 
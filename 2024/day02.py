@@ -7,6 +7,8 @@ import math
 import operator
 import pathlib
 
+from aoclib import stream, trace
+
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
@@ -15,9 +17,8 @@ def load_data():
     stem = pathlib.Path(__file__).stem
     # Name your input file after this file.
     # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
-    return data
+    # Reports are checked one at a time, the file is read lazily.
+    return stream.Lines(f'{stem}-input.txt')
 
 
 def p(message):
@@ -58,6 +59,7 @@ def part_1(data):
             safe_report_count += 1
 
     p(f'Safe reports: {safe_report_count}')
+    return safe_report_count
 
 def part_2(data):
     p('== Part 2 ==')
@@ -69,12 +71,12 @@ def part_2(data):
         # Make two-tuples
         tuples = zip(report, report[1:])
         deltas = list(itertools.starmap(operator.sub, tuples))
-        p(f'Report: {report}')
-        p(f'Deltas: {deltas}')
+        trace.debug('Report: {}', report)
+        trace.debug('Deltas: {}', deltas)
 
         # Allow for 1 unsafe level.
         SAFE_LEVEL = len(deltas) - 1
-        p(f'Safe level: {SAFE_LEVEL}')
+        trace.debug('Safe level: {}', SAFE_LEVEL)
 
         is_positive = bool(deltas[0] > 0)
         if is_positive:
@@ -83,7 +85,7 @@ def part_2(data):
                 if delta in (1, 2, 3):
                     safe_count += 1
 
-            p(f'Safe count: {safe_count}')
+            trace.debug('Safe count: {}', safe_count)
             if safe_count >= SAFE_LEVEL:
                 safe_report_count += 1
 
@@ -93,18 +95,26 @@ def part_2(data):
                 if delta in (-1, -2, -3):
                     safe_count += 1
 
-            p(f'Safe count: {safe_count}')
+            trace.debug('Safe count: {}', safe_count)
             if safe_count >= SAFE_LEVEL:
                 safe_report_count += 1
 
     p(f'Safe reports: {safe_report_count}')
+    return safe_report_count
+
+
+def parse(_data):
+    # A generator, so streamed input is only ever one report at a time.
+    reports = (
+        [int(x) for x in report.split()]
+        for report in _data
+        if report
+    )
+    return (reports,)
 
 
 def main(_data):
-    reports = []
-    for report in _data:
-        levels = [int(x) for x in report.split()]
-        reports.append(levels)
+    reports, = parse(_data)
 
     # part_1(reports)
     part_2(reports)
@@ -6,6 +6,8 @@ import math
 import pathlib
 import re
 
+from aoclib import stream, trace
+
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
@@ -14,9 +16,8 @@ def load_data():
     stem = pathlib.Path(__file__).stem
     # Name your input file after this file.
     # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
-    return data
+    # Each part scans line by line, so the input is never held in memory.
+    return stream.Lines(f'{stem}-input.txt')
 
 
 def p(message):
@@ -37,10 +38,12 @@ def part_1(data):
             x = int(x)
             y = int(y)
             xy = x * y
-            print(f'{x} * {y} = {xy}')
+            if trace.DEBUG:
+                trace.debug('{} * {} = {}', x, y, xy)
             sum += xy
 
     print(f'Sum: {sum}')
+    return sum
 
 
 def part_2(data):
@@ -60,12 +63,13 @@ def part_2(data):
         found = pattern.findall(row)
 
         for mul, x, y, do, dont in found:
-            print(mul, x, y, do, dont)
+            trace.trace('{} {} {} {} {}', mul, x, y, do, dont)
             if mul and enabled:
                 x = int(x)
                 y = int(y)
                 xy = x * y
-                print(f'{x} * {y} = {xy}')
+                if trace.DEBUG:
+                    trace.debug('{} * {} = {}', x, y, xy)
                 sum += xy
             elif do:
                 enabled = True
@@ -73,6 +77,7 @@ def part_2(data):
                 enabled = False
 
     print(sum)
+    return sum
 
 def main(data):
     # part_1(data)
@@ -6,6 +6,9 @@ import math
 import pathlib
 import re
 
+from aoclib import coords
+from aoclib.coords import Coord
+
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
@@ -24,42 +27,17 @@ def p(message):
     log.debug(message)
 
 
-class Coord:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.letter = ''
-
-    def __repr__(self):
-        return f'({self.x}, {self.y})'
-
-    def get(self, direction):
-        if direction == 'up':
-            return Coord(self.x, self.y - 1)
-
-        elif direction == 'down':
-            return Coord(self.x, self.y + 1)
-
-        elif direction == 'left':
-            return Coord(self.x - 1, self.y)
-
-        elif direction == 'right':
-            return Coord(self.x + 1, self.y)
-
-        elif direction == 'up_right':
-            return Coord(self.x + 1, self.y - 1)
-
-        elif direction == 'up_left':
-            return Coord(self.x - 1, self.y - 1)
-
-        elif direction == 'down_right':
-            return Coord(self.x + 1, self.y + 1)
-
-        elif direction == 'down_left':
-            return Coord(self.x - 1, self.y + 1)
-
-        else:
-            raise ValueError(f'Invalid direction: {direction}')
+# Steps for the directions the search reads in.
+DIRECTIONS = {
+    'up': coords.UP,
+    'down': coords.DOWN,
+    'left': coords.LEFT,
+    'right': coords.RIGHT,
+    'up_right': coords.UP_RIGHT,
+    'up_left': coords.UP_LEFT,
+    'down_right': coords.DOWN_RIGHT,
+    'down_left': coords.DOWN_LEFT,
+}
 
 
 class RegexPuzzle:
@@ -125,28 +103,16 @@ class Puzzle:
         return f'Puzzle: {self.size}x{self.size}'
 
     def get_word(self, coord, direction, length):
-        def is_valid(coord):
-            # coord must be within the bounds of the puzzle.
-            return (
-                0 <= coord.x < self.size
-                and
-                0 <= coord.y < self.size
-            )
-
         if direction not in ('up_right', 'right', 'down_right', 'down'):
             raise ValueError(f'Invalid direction: {direction}')
 
-        coords = [coord]
-        while len(coords) < length:
-            coords.append(coords[-1].get(direction))
-
-        # print(f'  Direction: {direction}, Coords: {coords}, Length: {length}')
-
-        letters = [
-            self.rows[coord.y][coord.x]
-            for coord in coords
-            if is_valid(coord)
-        ]
+        step = DIRECTIONS[direction]
+        letters = []
+        for i in range(length):
+            # Letters off the puzzle are left out, so the word comes up short.
+            if coord.in_bounds(self.size, self.size):
+                letters.append(self.rows[coord.row][coord.col])
+            coord = coord + step
 
         return ''.join(letters)
 
@@ -169,7 +135,7 @@ class Puzzle:
     def coords(self):
         for y in range(self.size):
             for x in range(self.size):
-                yield Coord(x, y)
+                yield Coord(y, x)
 
 
 def part_1(rows):
@@ -202,13 +168,14 @@ class Puzzle2:
     def coords(self):
         for y in range(self.size):
             for x in range(self.size):
-                yield Coord(x, y)
+                yield Coord(y, x)
 
     def match(self, coord):
         # forward
         try:
-            tl = [self.rows[coord.y][coord.x], self.rows[coord.y + 1][coord.x + 1], self.rows[coord.y + 2][coord.x + 2]]
-            br = [self.rows[coord.y + 2][coord.x], self.rows[coord.y + 1][coord.x + 1], self.rows[coord.y][coord.x + 2]]
+            row, col = coord
+            tl = [self.rows[row][col], self.rows[row + 1][col + 1], self.rows[row + 2][col + 2]]
+            br = [self.rows[row + 2][col], self.rows[row + 1][col + 1], self.rows[row][col + 2]]
         except IndexError:
             # off the grid
             return False
@@ -44,6 +44,7 @@ def part_1(rules, manuals):
     answer = sum(middle_pages)
     print(f'{len(middle_pages)} valid manuals')
     print(f'Answer: {answer}')
+    return answer
 
 
 def part_2(rules, manuals):
@@ -79,6 +80,7 @@ def part_2(rules, manuals):
         print('-'*80)
 
     print(f'Answer: {sum(middle_pages)}')
+    return sum(middle_pages)
 
 
 class Rule:
@@ -197,8 +199,7 @@ class Manual:
         print(f'  ...pages: {self.pages}')
 
 
-def main(data):
-    # Prepare the data.
+def parse(data):
     rules = []
     manuals = []
     for row in data:
@@ -211,6 +212,13 @@ def main(data):
         else:
             manuals.append(Manual(row))
 
+    return rules, manuals
+
+
+def main(data):
+    # Prepare the data.
+    rules, manuals = parse(data)
+
     # part_1(rules, manuals)
     part_2(rules, manuals)
 
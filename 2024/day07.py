@@ -39,6 +39,7 @@ def part_1(data):
             answer += test.value
 
     print(f'Answer: {answer}')
+    return answer
 
 
 def part_2(data):
@@ -51,6 +52,7 @@ def part_2(data):
             answer += test.value
 
     print(f'Answer: {answer}')
+    return answer
 
 
 class Test:
@@ -97,11 +99,36 @@ class Test:
 
 
 
-def main(data):
+def parse(data):
     test_data = [
         Test(row)
         for row in data
     ]
+    return (test_data,)
+
+
+# Sizes for `doit scale`, in operands per equation.
+SCALE_SIZES = (4, 6, 8, 10)
+
+
+def generate(size, rng):
+    """Forty equations with size operands each, every other one solvable."""
+    lines = []
+    for i in range(40):
+        numbers = [rng.randint(1, 999) for _ in range(size)]
+        if i % 2:
+            value = numbers[0]
+            for number in numbers[1:]:
+                value = rng.choice([ADD, MUL, CONCAT])(value, number)
+        else:
+            # Almost never reachable, so every combination gets tried.
+            value = rng.randint(1, 10 ** (2 * size))
+        lines.append(f'{value}: {" ".join(map(str, numbers))}')
+    return lines
+
+
+def main(data):
+    test_data, = parse(data)
 
     # part_1(test_data)
     part_2(test_data)
@@ -311,8 +311,12 @@ class AntennaMap:
         print(f'Answer: {len(normalized)}')
 
 
+def parse(data):
+    return (AntennaMap(data),)
+
+
 def main(data):
-    antenna_map = AntennaMap(data)
+    antenna_map, = parse(data)
     # part_1(antenna_map)
     antenna_map.part_2()
 
@@ -1,5 +1,12 @@
+import os
+import pathlib
+import time
+
 import click
 
+import aoclib
+from aoclib import counters, trace
+
 
 @click.group()
 def cli():
@@ -10,8 +17,444 @@ def cli():
 def hello():
     click.echo('Hello, World!')
 
+
+def set_trace_level(ctx, param, value):
+    if value is not None:
+        trace.configure(value)
+        # Worker processes read it from the environment.
+        os.environ['AOC_TRACE'] = value
+    return value
+
+
+trace_option = click.option(
+    '--trace', type=click.Choice(list(trace.LEVELS), case_sensitive=False),
+    callback=set_trace_level, expose_value=False,
+    help='Debug output level for solutions using aoclib.trace.',
+)
+
+
+def enable_counters(ctx, param, value):
+    if value:
+        counters.enable()
+        os.environ['AOC_COUNTERS'] = '1'
+    return value
+
+
+def set_jobs(ctx, param, value):
+    if value is not None:
+        # aoclib.shared.fan_out reads it, here or in `doit serve`.
+        os.environ['AOC_JOBS'] = str(value)
+    return value
+
+
+jobs_option = click.option(
+    '--jobs', '-j', type=click.IntRange(min=0), callback=set_jobs, expose_value=False,
+    help='Worker processes for parts that fan out with aoclib.shared, 0 for one per core.  [default: 1]',
+)
+
+
+def budget_options(command):
+    command = click.option('--time-limit', '-T', type=click.FloatRange(min=0, min_open=True),
+                           help='Seconds each part may run before it is stopped as TIMEOUT.')(command)
+    command = click.option('--memory-limit', '-M', type=click.IntRange(min=1),
+                           help='MB each part may allocate before it is stopped as OOM.')(command)
+    command = click.option('--resume', is_flag=True,
+                           help='Continue parts from their last aoclib.checkpoint save.')(command)
+    return command
+
+
+count_option = click.option(
+    '--count', is_flag=True, callback=enable_counters, expose_value=False,
+    help='Report the work counters solutions keep with aoclib.counters.',
+)
+
+
+def echo_result(result, full_traceback=True):
+    label = f'{result.year} day {result.day:02} part {result.part}'
+    if result.ok:
+        answer = '' if result.answer is None else result.answer
+        if result.cached:
+            click.echo(f'{label}  {"unchanged":>13}  {answer}')
+        else:
+            click.echo(f'{label}  {result.seconds * 1000:>10.1f} ms  {answer}')
+        for name, value in sorted((result.counters or {}).items()):
+            click.echo(f'    {name:<24} {counters.format_value(value)}')
+    elif result.status in (aoclib.runner.TIMEOUT, aoclib.runner.OOM):
+        click.echo(f'{label}  {result.status.upper():>13}  after {result.seconds:.1f} s')
+        for name, value in sorted((result.counters or {}).items()):
+            click.echo(f'    {name:<24} {counters.format_value(value)}')
+    else:
+        click.echo(f'{label}  {result.status.upper():>13}')
+        if result.error and full_traceback:
+            click.echo(result.error, err=True)
+        elif result.error:
+            click.echo(f'    {result.error.splitlines()[-1]}', err=True)
+
+
 @cli.command
+@click.argument('year', type=int)
+@click.argument('day', type=int)
+@click.argument('part', type=click.IntRange(1, 2), required=False)
+@click.option('--quiet', '-q', is_flag=True, help='Hide what the solution prints.')
+@click.option('--remote', is_flag=True, help='Run in the warm `doit serve` process instead.')
+@budget_options
+@jobs_option
+@trace_option
+@count_option
+def run(year, day, part, quiet, remote, time_limit, memory_limit, resume):
+    """Run one day, or one part of it."""
+    parts = [part] if part else None
+    if remote:
+        run_remote(year, day, parts, quiet, time_limit=time_limit, memory_limit=memory_limit, resume=resume)
+        return
+
+    try:
+        solution = aoclib.find(year, day)
+    except LookupError as e:
+        raise click.ClickException(str(e))
+
+    results = aoclib.run_parts(
+        solution, parts, quiet=quiet, time_limit=time_limit, memory_limit=memory_limit, resume=resume,
+    )
+    for result in results:
+        echo_result(result)
+
+    from aoclib import startup
+
+    seconds = results[0].import_seconds
+    budget = startup.budget(solution.module) if seconds else None
+    if budget and seconds > budget:
+        click.echo(
+            f'{solution} took {seconds * 1000:.0f} ms to import, over its {budget * 1000:.0f} ms budget;'
+            f' see `doit startup {year} {day}`.',
+            err=True,
+        )
+
+
+def run_remote(year, day, parts, quiet, time_limit=None, memory_limit=None, resume=False):
+    from aoclib import server
+
+    message = {
+        'command': 'run', 'year': year, 'day': day, 'parts': parts, 'quiet': quiet,
+        'trace': trace.level(), 'count': counters.ENABLED, 'jobs': os.environ.get('AOC_JOBS'),
+        'time_limit': time_limit, 'memory_limit': memory_limit, 'resume': resume,
+    }
+    try:
+        reply = server.request(message)
+    except ConnectionError as e:
+        raise click.ClickException(f'{e}; start one with `doit serve`.')
+    if 'error' in reply:
+        raise click.ClickException(reply['error'])
+
+    click.echo(reply['output'], nl=False)
+    click.echo(reply['trace'], nl=False, err=True)
+    for result in reply['results']:
+        echo_result(result)
+
+
+@cli.command()
+@click.option('--stop', is_flag=True, help='Stop the running server.')
+def serve(stop):
+    """Keep solutions and parsed inputs warm for `doit run --remote`."""
+    from aoclib import server
+
+    if stop:
+        try:
+            server.request({'command': 'stop'})
+        except ConnectionError as e:
+            raise click.ClickException(str(e))
+        return
+
+    def ready(path):
+        click.echo(f'Listening on {path}, Ctrl-C or `doit serve --stop` to stop.')
+
+    try:
+        server.serve(ready=ready)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+
+@cli.command('run-all')
+@click.option('--year', '-y', 'years', type=int, multiple=True, help='Limit to a year, repeatable.')
+@click.option('--quiet/--verbose', '-q/-v', default=True, help='Hide what the solutions print.')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=1, show_default=True,
+              help='Worker processes, 0 for one per core.  1 runs in this interpreter.')
+@click.option('--force', '-f', is_flag=True, help='Run parts even if their code and input are unchanged.')
+@budget_options
+@trace_option
+@count_option
+def run_all(years, quiet, jobs, force, time_limit, memory_limit, resume):
+    """Run every discovered solution, slowest days first when parallel."""
+    start = time.perf_counter()
+    results = []
+    # Stored answers have no counters; counting means running.
+    force = force or counters.ENABLED
+    solutions = aoclib.discover(years=years)
+    budget = {'time_limit': time_limit, 'memory_limit': memory_limit, 'resume': resume}
+    for day_results in aoclib.run_catalog(solutions, jobs=jobs, quiet=quiet, force=force, **budget):
+        for result in day_results:
+            if result.status != aoclib.runner.MISSING:
+                echo_result(result, full_traceback=False)
+            results.append(result)
+    wall = time.perf_counter() - start
+
+    total = sum(result.seconds for result in results if not result.cached)
+    cached = sum(result.cached for result in results)
+    stopped = (aoclib.runner.ERROR, aoclib.runner.TIMEOUT, aoclib.runner.OOM)
+    failed = [result for result in results if result.status in stopped]
+    click.echo(
+        f'{len(results)} parts, {cached} unchanged, {len(failed)} failed,'
+        f' {total:.2f} s in parts, {wall:.2f} s wall.'
+    )
+
+
+@cli.command()
+@click.argument('year', type=int)
+@click.argument('day', type=int, required=False)
+@click.argument('part', type=click.IntRange(1, 2), required=False)
+@click.option('--repeat', '-r', type=click.IntRange(min=1), default=5, show_default=True)
+@click.option('--warmup', '-w', type=click.IntRange(min=0), default=1, show_default=True)
+@click.option('--threshold', '-t', type=float, default=0.2, show_default=True,
+              help='Allowed median slowdown versus recent saved runs, 0.2 is 20%.')
+@click.option('--save/--no-save', default=True, show_default=True,
+              help='Record this run in the history; a regressed run is never recorded.')
+@click.option('--accept', is_flag=True,
+              help='Record this run even if it regressed and compare later runs against it.')
+def bench(year, day, part, repeat, warmup, threshold, save, accept):
+    """Benchmark a year, a day or a part; exit 1 on a regression."""
+    from aoclib import bench as benchmark
+
+    solutions = [aoclib.find(year, day)] if day else aoclib.discover(years=[year])
+    history = benchmark.History()
+    regressions = []
+    try:
+        for solution in solutions:
+            try:
+                parts = [part] if part else sorted(solution.parts())
+            except Exception as e:
+                click.echo(f'{solution}  cannot load: {e}', err=True)
+                continue
+
+            for number in parts:
+                label = f'{solution.year} day {solution.day:02} part {number}'
+                try:
+                    result = benchmark.bench_isolated(solution.year, solution.day, number, repeat, warmup)
+                except Exception as e:
+                    click.echo(f'{label}  ERROR {e}', err=True)
+                    continue
+
+                baseline = history.baseline(solution.year, solution.day, number)
+                ratio = benchmark.regression(result, baseline, threshold)
+                line = (
+                    f'{label}  min {result.min * 1000:>9.1f} ms'
+                    f'  median {result.median * 1000:>9.1f} ms'
+                    f'  p95 {result.p95 * 1000:>9.1f} ms'
+                    f'  rss {result.peak_rss_kb / 1024:>7.1f} MB'
+                )
+                if ratio and accept:
+                    line += click.style(f'  accepted x{ratio:.2f}', fg='yellow')
+                elif ratio:
+                    regressions.append(label)
+                    line += click.style(f'  REGRESSION x{ratio:.2f}', fg='red')
+                click.echo(line)
+
+                if accept:
+                    history.accept(result)
+                # A regressed run would drag the baseline towards itself.
+                elif save and not ratio:
+                    history.record(result)
+    finally:
+        history.close()
+
+    if regressions:
+        raise click.ClickException(f'{len(regressions)} regressed: {", ".join(regressions)}')
+
+
+@cli.command()
+@click.argument('year', type=int)
+@click.argument('day', type=int)
+@click.argument('part', type=click.IntRange(1, 2), required=False)
+@click.option('--size', '-n', 'sizes', type=click.IntRange(min=1), multiple=True,
+              help='Input size, repeatable.  Defaults to the module\'s SCALE_SIZES.')
+@click.option('--seed', '-s', type=int, default=0, show_default=True)
+@click.option('--repeat', '-r', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Keep the best of this many runs per size.')
+@click.option('--budget', '-b', type=float, default=30.0, show_default=True,
+              help='Stop growing once one size takes longer than this many seconds.')
+@click.option('--max-exponent', type=float, help='Exit 1 if the fitted exponent is above this.')
+def scale(year, day, part, sizes, seed, repeat, budget, max_exponent):
+    """Time a day on synthetic inputs of growing size and fit the growth exponent."""
+    from aoclib import scaling
+
+    try:
+        solution = aoclib.find(year, day)
+    except LookupError as e:
+        raise click.ClickException(str(e))
+    if not hasattr(solution.module, 'generate'):
+        raise click.ClickException(f'{solution} has no generate(size, rng) hook')
+
+    sizes = sorted(sizes or scaling.default_sizes(solution))
+    parts = [part] if part else sorted(solution.parts())
+    too_steep = []
+    for number in parts:
+        label = f'{solution.year} day {solution.day:02} part {number}'
+        click.echo(label)
+        points = []
+        for size in sizes:
+            # The first call pays for imports and caches; keep it off the clock.
+            warmup = 0 if points else 1
+            point = scaling.measure(solution, number, size, seed=seed, repeat=repeat, warmup=warmup)
+            exponent = scaling.local_exponent(points[-1], point) if points else None
+            points.append(point)
+            local = '' if exponent is None else f'  local n^{exponent:.2f}'
+            click.echo(f'  n={size:<9} {point.lines:>9} lines  {point.seconds * 1000:>10.1f} ms{local}')
+            if point.seconds > budget:
+                click.echo(f'  stopping, over the {budget:g} s budget')
+                break
+
+        fitted = scaling.fit_exponent([p.size for p in points], [p.seconds for p in points])
+        if fitted is None:
+            click.echo('  not enough sizes to fit')
+            continue
+        line = f'  fitted: time ~ n^{fitted:.2f}'
+        if max_exponent is not None and fitted > max_exponent:
+            too_steep.append(label)
+            line += click.style(f'  ABOVE n^{max_exponent:g}', fg='red')
+        click.echo(line)
+
+    if too_steep:
+        raise click.ClickException(f'{len(too_steep)} scale worse than n^{max_exponent:g}: {", ".join(too_steep)}')
+
+
+@cli.command()
+@click.argument('year', type=int)
 @click.argument('day', type=int)
-@click.argument('part', type=int)
-def run(day, part):
-    click.echo(f'Running day {day} part {part}...')
\ No newline at end of file
+@click.argument('part', type=click.IntRange(1, 2))
+@click.option('--sort', type=click.Choice(['tottime', 'cumtime', 'calls']), default='tottime', show_default=True)
+@click.option('--top', '-t', type=click.IntRange(min=1), default=15, show_default=True,
+              help='Rows of functions and allocation sites to show.')
+@click.option('--stacks/--no-stacks', default=True, show_default=True, help='Sample collapsed stacks.')
+@click.option('--memory/--no-memory', default=True, show_default=True, help='Trace allocations.')
+@click.option('--out', '-o', type=click.Path(file_okay=False, path_type=pathlib.Path),
+              help='Directory for the reports, default .doit/profile.')
+@trace_option
+def profile(year, day, part, sort, top, stacks, memory, out):
+    """Profile one part: pstats, collapsed stacks and top allocation sites."""
+    from aoclib import profiling
+
+    try:
+        solution = aoclib.find(year, day)
+    except LookupError as e:
+        raise click.ClickException(str(e))
+    if part not in solution.parts():
+        raise click.ClickException(f'{solution} has no part {part}')
+
+    result = profiling.profile_part(
+        solution, part, out_dir=out or profiling.PROFILE_DIR, stacks=stacks, memory=memory, top=top,
+    )
+    click.echo(f'{solution} part {part}  {result.seconds * 1000:.1f} ms under cProfile')
+    click.echo(f'  {"calls":>10} {"tottime":>9} {"cumtime":>9}  function')
+    for label, calls, tottime, cumtime in profiling.top_functions(result.stats, sort, top):
+        click.echo(f'  {calls:>10} {tottime:>9.3f} {cumtime:>9.3f}  {label}')
+
+    if memory:
+        # The report's first lines say when its allocation sites were taken.
+        for line in result.files['alloc'].read_text().splitlines():
+            if line:
+                click.echo(f'  {line}')
+    if stacks:
+        runs = f'over {result.sample_runs} runs' if result.sample_runs > 1 else 'in one run'
+        click.echo(f'  {result.samples} stack samples {runs}')
+        if 'collapsed' not in result.files:
+            click.echo(
+                f'  Too few stack samples for a useful flame graph (want {profiling.MIN_SAMPLES});'
+                ' the part is too quick to sample, see the pstats instead.'
+            )
+
+    for kind, path in result.files.items():
+        click.echo(f'  {kind:<9} {path}')
+
+
+@cli.command()
+@click.argument('year', type=int)
+@click.argument('day', type=int, required=False)
+@click.option('--top', '-t', type=click.IntRange(min=0), default=5, show_default=True,
+              help='Heaviest direct imports to list per day.')
+@click.option('--all', '-a', 'show_all', is_flag=True, help='List imports for days under budget too.')
+def startup(year, day, top, show_all):
+    """Time importing a year or a day in a fresh interpreter; exit 1 over budget."""
+    from aoclib import startup as imports
+
+    solutions = [aoclib.find(year, day)] if day else aoclib.discover(years=[year])
+    over = []
+    for solution in solutions:
+        try:
+            result = imports.measure_startup(solution.year, solution.day)
+        except RuntimeError as e:
+            click.echo(f'{solution}  cannot import: {e}', err=True)
+            continue
+
+        line = f'{solution}  {result.seconds * 1000:>8.1f} ms  budget {result.budget * 1000:.0f} ms'
+        if result.over_budget:
+            over.append(str(solution))
+            line += click.style('  OVER', fg='red')
+        click.echo(line)
+        if result.over_budget or show_all:
+            for entry in result.heaviest(top):
+                click.echo(f'    {entry.cumulative * 1000:>8.1f} ms  {entry.name}')
+
+    if over:
+        raise click.ClickException(f'{len(over)} over their startup budget: {", ".join(over)}')
+
+
+@cli.command()
+@click.argument('year', type=int)
+@click.argument('day', type=int)
+@click.argument('part', type=click.IntRange(1, 2), required=False)
+@click.option('--inputs', '-i', 'directory', required=True,
+              type=click.Path(exists=True, file_okay=False, path_type=pathlib.Path),
+              help='Directory of input files.')
+@click.option('--pattern', '-p', default='*.txt', show_default=True, help='Which files in it to run.')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Worker processes, 0 for one per core.  1 runs in this interpreter.')
+@click.option('--trace', type=click.Choice(list(trace.LEVELS), case_sensitive=False), default='off',
+              show_default=True, callback=set_trace_level, expose_value=False,
+              help='Debug output level for solutions using aoclib.trace.')
+def batch(year, day, part, directory, pattern, jobs):
+    """Run one day over every input file in a directory; exit 1 if any fail."""
+    from aoclib import batch as batches
+
+    try:
+        solution = aoclib.find(year, day)
+    except LookupError as e:
+        raise click.ClickException(str(e))
+    paths = batches.input_files(directory, pattern)
+    if not paths:
+        raise click.ClickException(f'No {pattern} files in {directory}')
+
+    parts = [part] if part else None
+    start = time.perf_counter()
+    finished = sorted(batches.run_batch(solution, paths, parts, jobs=jobs), key=lambda entry: entry.path)
+    wall = time.perf_counter() - start
+
+    width = max(len(entry.path.name) for entry in finished)
+    for entry in finished:
+        cells = []
+        for result in entry.results:
+            if result.ok:
+                answer = '' if result.answer is None else result.answer
+                cells.append(f'{result.seconds * 1000:>9.1f} ms  {str(answer):<16}')
+            elif result.status == aoclib.runner.MISSING:
+                cells.append(f'{"":>12}  {"":<16}')
+            else:
+                cells.append(f'{result.status.upper():>12}  {"":<16}')
+        click.echo(f'{entry.path.name:<{width}}  ' + '  '.join(cells).rstrip())
+
+    failed = [entry for entry in finished if not entry.ok]
+    for entry in failed:
+        for result in entry.results:
+            if result.error:
+                click.echo(f'{entry.path.name} part {result.part}: {result.error.splitlines()[-1]}', err=True)
+    click.echo(f'{len(finished)} inputs, {len(failed)} failed, {wall:.2f} s wall.')
+    if failed:
+        raise click.ClickException(f'{len(failed)} inputs failed')
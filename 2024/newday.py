@@ -4,8 +4,6 @@ import pathlib
 import re
 import sys
 
-import pyperclip
-
 
 # Python solution template.
 PYTHON_TEMPLATE = '''#!/usr/bin/env python3
@@ -23,8 +21,10 @@ def load_data():
     stem = pathlib.Path(__file__).stem
     # Name your input file after this file.
     # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip() for line in fp.readlines()]
+    # Solutions that only walk the input line by line can return
+    # aoclib.stream.Lines(f'{stem}-input.txt') instead and read it lazily.
+    with open(f'{stem}-input.txt') as fp:
+        data = [line.strip() for line in fp]
     return data
 
 
@@ -86,6 +86,11 @@ def main():
     print(f'    Puzzle:  {url}')
     print(f'    Input:   {url}/input')
 
+    # Only needed here, and not installed everywhere the templates are made.
+    try:
+        import pyperclip
+    except ImportError:
+        return
     pyperclip.copy(url)
     print('    URL has been copied to the clipboard.')
 
@@ -4,6 +4,8 @@ setup(
     name='adventofcode',
     version='2024',
     py_modules=['doit'],
+    packages=['aoclib'],
+    install_requires=['click'],
     entry_points={
         'console_scripts': [
             'doit = doit:cli',
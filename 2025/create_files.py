@@ -2,8 +2,6 @@
 
 import pathlib
 
-import pyperclip
-
 
 # Python solution template.
 PYTHON_TEMPLATE = '''#!/usr/bin/env python
@@ -14,7 +12,10 @@ import math
 import pathlib
 
 import rich
-from rich.progress import track
+
+# Uncomment as needed:
+# from aoclib import lazy, stream
+# shapely = lazy.module('shapely')  # heavy packages only a part needs
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -25,8 +26,10 @@ def load_data():
     stem = pathlib.Path(__file__).stem
     # Name your input file after this file.
     # E.g., day00-input.txt
-    with open(f'{stem}-input.txt', mode='r+') as fp:
-        data = [line.strip('\\n') for line in fp.readlines()]
+    # Solutions that only walk the input line by line can return
+    # stream.Lines(f'{stem}-input.txt') instead and read it lazily.
+    with open(f'{stem}-input.txt') as fp:
+        data = [line.strip('\\n') for line in fp]
     return data
 
 
@@ -82,6 +85,11 @@ def create_day(day):
     print(f'    Puzzle:  {url}')
     print(f'    Input:   {url}/input')
 
+    # Only needed here, and not installed everywhere the templates are made.
+    try:
+        import pyperclip
+    except ImportError:
+        return
     pyperclip.copy(url)
     print('    URL has been copied to the clipboard.')
 
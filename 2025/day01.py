@@ -180,6 +180,7 @@ def part_1(data):
             # p('Dial is at zero!')
 
     print(f'Dial hit zero {zeros} times.')
+    return zeros
 
 
 def part_2(data):
@@ -190,6 +191,7 @@ def part_2(data):
         dial.turn_dial(direction, ticks)
 
     print(f'Dial hit zero {dial.zeros} times.')
+    return dial.zeros
 
 
 def part_2_naive(data):
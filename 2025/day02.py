@@ -96,6 +96,7 @@ def part_1(ranges):
 
     print('Repeats: ', all_repeats)
     print('Sum: ', sum(all_repeats))
+    return sum(all_repeats)
 
 
 def part_2(ranges):
@@ -107,17 +108,22 @@ def part_2(ranges):
 
     print('Repeats: ', all_repeats)
     print('Sum: ', sum(all_repeats))
+    return sum(all_repeats)
+
+
+def parse(data):
+    ranges = [Range(r) for r in data[0].split(',')]
+    return (ranges,)
 
 
 def main(data):
-    data = data[0]
     _data = (
         '11-22,95-115,998-1012,1188511880-1188511890,'
         '222220-222224,1698522-1698528,446443-446449,'
         '38593856-38593862,565653-565659,'
         '824824821-824824827,2121212118-2121212124'
     )
-    ranges = [Range(r) for r in data.split(',')]
+    ranges, = parse(data)
     # part_1(ranges)
     part_2(ranges)
 
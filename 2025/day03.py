@@ -78,6 +78,7 @@ def part_1(batteries):
 
     total_joltage = sum(bank_joltages)
     print(f'Total joltage: {total_joltage}')
+    return total_joltage
 
 
 def part_2(batteries):
@@ -114,6 +115,15 @@ def part_2(batteries):
     total = sum(max_joltages)
     print(f'Total joltage: {total}')
     # print('Correct? ' + str(total == 3121910778619))
+    return total
+
+
+def parse(data):
+    batteries = []
+    for row in data:
+        bank = [Battery(int(n), i) for i, n in enumerate(row)]
+        batteries.append(bank)
+    return (batteries,)
 
 
 def main(data):
@@ -123,10 +133,7 @@ def main(data):
         '234234234234278',
         '818181911112111',
     ]
-    batteries = []
-    for row in data:
-        bank = [Battery(int(n), i) for i, n in enumerate(row)]
-        batteries.append(bank)
+    batteries, = parse(data)
 
     # part_1(batteries)
     part_2(batteries)
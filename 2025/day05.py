@@ -7,7 +7,8 @@ import pathlib
 
 
 import rich
-from rich.progress import track
+
+from aoclib.intervals import IntervalSet
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
@@ -26,46 +27,29 @@ def p(message):
     log.debug(message)
 
 
-def part_1(spans, skus):
+def part_1(fresh, skus):
     rich.print('[bold red]== Part 1 ==[/bold red]')
     rich.print('Find skus that are in any range.')
-    fresh = []
-    for sku in track(skus, description="Processing SKUs..."):
-        for span in spans:
-            if span.contains(sku):
-                fresh.append(sku)
-                break
+    # Each lookup is a bisect into the merged spans.
+    fresh_count = sum(1 for sku in skus if sku in fresh)
 
-    rich.print(f'[bold green]Fresh SKUs: {len(fresh)}[/bold green]')
+    rich.print(f'[bold green]Fresh SKUs: {fresh_count}[/bold green]')
+    return fresh_count
 
 
 
-def part_2(spans, skus):
+def part_2(fresh, skus):
     rich.print('[bold red]== Part 2 ==[/bold red]')
     rich.print('Find count of all fresh skus.')
 
-    # sort ranges
-    spans.sort(key=lambda r: r.start)
-
-    merged_spans = []
-    merged_spans.append(spans[0])
-
-    for span in track(spans[1:], description='Merging spans...'):
-        # rich.print(f'Span: {span}')
-        # Check for overlap with previous range.
-        previous_span = merged_spans[-1]
-        if previous_span.end + 1 >= span.start:  # Add 1 to allow touching ranges.
-            # rich.print(f' Overlaps with previous span: {previous_span}')
-            previous_span.merge(span)
-        else:
-            merged_spans.append(span)
-
+    # The interval set merged overlapping and touching spans when it was built.
     # rich.print('[bold blue]Merged Spans:[/bold blue]')
-    # for span in merged_spans:
-    #     rich.print(f'  {span}')
+    # for start, stop in fresh:
+    #     rich.print(f'  {start}-{stop - 1}')
 
-    sku_count = sum(span.size for span in merged_spans)
+    sku_count = fresh.size
     rich.print(f'[bold green]Total fresh SKUs: {sku_count}[/bold green]')
+    return sku_count
 
 
 class Span:
@@ -83,15 +67,29 @@ class Span:
     def contains(self, value):
         return self.start <= value <= self.end
 
-    def merge(self, other):
-        self.start = min(self.start, other.start)
-        self.end = max(self.end, other.end)
-
     @property
     def size(self):
         return self.end - self.start + 1
 
 
+def parse(data):
+    delimit = data.index('')
+
+    spans = [
+        Span(range_str)
+        for range_str in data[:delimit]
+    ]
+
+    # Spans are inclusive, the interval set is half-open.
+    fresh = IntervalSet((span.start, span.end + 1) for span in spans)
+
+    skus = [
+        int(sku)
+        for sku in data[delimit+1:]
+    ]
+    return fresh, skus
+
+
 def main(data):
     _data = [
         '3-5',
@@ -106,19 +104,9 @@ def main(data):
         '17',
         '32',
     ]
-    delimit = data.index('')
-
-    spans = [
-        Span(range_str)
-        for range_str in data[:delimit]
-    ]
-
-    skus = [
-        int(sku)
-        for sku in data[delimit+1:]
-    ]
-    # part_1(spans, skus)
-    part_2(spans, skus)
+    fresh, skus = parse(data)
+    # part_1(fresh, skus)
+    part_2(fresh, skus)
 
 
 if __name__ == '__main__':
@@ -6,7 +6,6 @@ import math
 import pathlib
 
 import rich
-from rich.progress import track
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -32,6 +31,7 @@ def part_1(data):
 
     answer = sum(calc.calculate() for calc in calculators)
     rich.print(f'[bold green]Answer: {answer}[/bold green]')
+    return answer
 
 
 def part_2(data):
@@ -76,6 +76,7 @@ def part_2(data):
     rich.print(f'[bold green]Answer: {answer}[/bold green]')
 
     cephulators[-1].debug()
+    return answer
 
 
 class Cephulator:
@@ -1,13 +1,14 @@
 #!/usr/bin/env python
 
 import collections
-import dataclasses
 import logging
 import math
 import pathlib
 
 import rich
-from rich.progress import track
+
+from aoclib import limits, memo
+from aoclib.coords import Coord
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -50,6 +51,7 @@ def part_1(tree):
         #print(f'    Splits: {split_count}')
 
     rich.print(f'[bold green]Total Splits: {split_count}[/bold green]')
+    return split_count
 
 
 def part_2(tree):
@@ -82,13 +84,18 @@ def part_2(tree):
 
     positions = sum(particle_cols.values())
     rich.print(f'[bold green]Final Multiverses: {positions}[/bold green]')
+    return positions
 
 
 def part_2_traverse(tree):
     rich.print('[bold red]== Part 2 ==[/bold red]')
     rich.print('Single particle traverse the tree, find all ways out.')
 
+    # Exponential in the number of splitters without the memo: every path
+    # below a (row, col) is counted again for each way of reaching it.
+    @memo.memoize
     def traverse(row_idx, particle_col):
+        limits.check()
         # Recursesively traverse the tree.
         # Bottom out, counts as one path.
         if row_idx >= tree.height:
@@ -118,12 +125,7 @@ def part_2_traverse(tree):
 
     total_paths = traverse(2, tree.start.col)
     rich.print(f'[bold green]Total Paths: {total_paths}[/bold green]')
-
-
-@dataclasses.dataclass
-class Coord:
-    row: int
-    col: int
+    return total_paths
 
 
 class Tree:
@@ -135,6 +137,10 @@ class Tree:
         self.start = Coord(0, self.rows[0].index('S'))
 
 
+def parse(data):
+    return (Tree(data),)
+
+
 def main(data):
     _data = [
         '.......S.......',
@@ -154,7 +160,7 @@ def main(data):
         '.^.^.^.^.^...^.',
         '...............',
     ]
-    tree = Tree(data)
+    tree, = parse(data)
     part_1(tree)
     part_2(tree)
 
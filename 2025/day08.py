@@ -1,24 +1,20 @@
 #!/usr/bin/env python
 
 import collections
-import dataclasses
 import itertools
 import logging
 import math
 import pathlib
 
 import rich
-from rich.progress import track
+
+from aoclib import trace
+from aoclib.unionfind import DisjointSet
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 log = logging.getLogger('aoc')
 
-# Null out print for full data set.
-def _print(*args, **kwargs):
-    pass
-print = _print
-
 
 def load_data():
     stem = pathlib.Path(__file__).stem
@@ -29,203 +25,105 @@ def load_data():
     return data
 
 
-def part_1(data):
+def closest_pairs(points):
+    """Yield (squared distance, i, j) for every pair of points, closest first.
+
+    Rather than building and sorting all n^2 pairs, points are bucketed into
+    cubes of side `radius` and only pairs within radius are collected from
+    neighboring cubes and sorted.  When the caller wants more, the radius
+    doubles and the next shell of pairs is collected.  Callers that stop early,
+    like Kruskal once everything is connected, never see the far pairs.
+
+    Squared distances are exact integers and sort the same as the real ones.
+    """
+    n = len(points)
+    if n < 2:
+        return
+    coords = [(p.x, p.y, p.z) for p in points]
+    spans = [max(axis) - min(axis) + 1 for axis in zip(*coords)]
+    # Start where an average cube holds a couple of points.
+    radius = max(1, int((math.prod(spans) * 2 / n) ** (1 / 3)))
+    farthest = sum((span - 1) ** 2 for span in spans)
+    offsets = list(itertools.product((-1, 0, 1), repeat=3))
+
+    reported = -1
+    while True:
+        cubes = collections.defaultdict(list)
+        for i, (x, y, z) in enumerate(coords):
+            cubes[(x // radius, y // radius, z // radius)].append(i)
+
+        limit = radius * radius
+        shell = []
+        for (cx, cy, cz), members in cubes.items():
+            for dx, dy, dz in offsets:
+                others = cubes.get((cx + dx, cy + dy, cz + dz))
+                if not others:
+                    continue
+                for i in members:
+                    x, y, z = coords[i]
+                    for j in others:
+                        if j <= i:
+                            continue
+                        ox, oy, oz = coords[j]
+                        distance = (x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2
+                        if reported < distance <= limit:
+                            shell.append((distance, i, j))
+
+        trace.debug('Radius {}: {} pairs', radius, len(shell))
+        shell.sort()
+        yield from shell
+
+        if limit >= farthest:
+            # No two points in the box are further apart, every pair has been seen.
+            return
+        reported = limit
+        radius *= 2
+
+
+def part_1(points):
     rich.print('[bold red]== Part 1 ==[/bold red]')
     rich.print('Connect first 1000 closest points into circuits.')
 
-    combinations = [Pair(a, b) for a, b in itertools.combinations(data, 2)]
-    print('Total combinations:', len(combinations))
+    circuits = DisjointSet(len(points))
 
-    combinations.sort(key=lambda p: p.distance)
-    # for pair in combinations[:11]:
-    #     print(pair)
+    MAX_CONNECTIONS = 1000
+    # A pair already in the same circuit still counts as a connection.
+    for distance, a, b in itertools.islice(closest_pairs(points), MAX_CONNECTIONS):
+        merged = circuits.union(a, b)
+        if trace.DEBUG:
+            action = 'MERGE' if merged else 'SKIP'
+            trace.debug('  {}: {} <-> {}: {:.3f}', action, points[a], points[b], math.sqrt(distance))
 
-    circuits = []
-    lookup = {}
+    trace.info('Total circuits: {}', circuits.count)
 
-    MAX_CONNECTIONS = 1000
-    connections = 0
-    for i, pair in enumerate(combinations):
-        print(f'Processing pair {i}: {pair}')
-        print(f'  Circuit count: {len(circuits)}')
-        print('  Circuits:')
-        for circuit in circuits:
-            print(f'    {circuit.id}: {circuit.list_points()}')
-
-        print('  Lookups:')
-        for point in lookup:
-            print(f'    Dict: {point} -> Circuit {lookup[point].id}')
-
-        a_circuit = lookup.get(pair.a)
-        b_circuit = lookup.get(pair.b)
-        if a_circuit:
-            print(f'  {pair.a} IN {a_circuit}')
-        if b_circuit:
-            print(f'  {pair.b} IN {b_circuit}')
-
-        if a_circuit and b_circuit:
-            if a_circuit is b_circuit:
-                # Pair exists within same circuit, add it.
-                print(f'  SKIP: {pair} already in {a_circuit}')
-                a_circuit.add_pair(pair)
-                connections += 1
-
-            else:
-                # Pair exsist in two different circuits, merge them.
-                print(f'  MERGE: {pair} circuits {a_circuit.id} and {b_circuit.id}')
-                # Merge circuits, move b into a.
-                print("    Pairs in A:", len(a_circuit.pairs))
-                print("    Pairs in B:", len(b_circuit.pairs))
-                for p in b_circuit.pairs:
-                    # Add into a.
-                    a_circuit.add_pair(p)
-                    # update lookup
-                    lookup[p.a] = a_circuit
-                    lookup[p.b] = a_circuit
-                # Remove b circuit, it exists within a.
-                circuits.remove(b_circuit)
-
-                # Finally, add the new pair.
-                a_circuit.add_pair(pair)
-                print("    Pairs in A after merge:", len(a_circuit.pairs))
-                connections += 1
-
-        elif a_circuit or b_circuit:
-            # Add this pair to an existing circuit.
-            circuit = a_circuit or b_circuit
-            print(f'  JOIN: {pair} to {circuit}')
-            circuit.add_pair(pair)
-            lookup[pair.a] = circuit
-            lookup[pair.b] = circuit
-            connections += 1
-
-        else:
-            # Create a new circuit.
-            circuit = Circuit()
-            print(f'  NEW {pair} to {circuit}')
-            circuit.add_pair(pair)
-            lookup[pair.a] = circuit
-            lookup[pair.b] = circuit
-            circuits.append(circuit)
-            connections += 1
-
-        print(f'  Connections made: {connections}')
-        print()
-        if connections >= MAX_CONNECTIONS:
-            break
-
-    print('Total circuits:', len(circuits))
-
-    for circuit in circuits:
-        print(circuit)
-        print('  Points:')
-        for point in circuit.points:
-            print(f'    {point}')
-        print('  Pairs:')
-        for pair in circuit.pairs:
-            print(f'    {pair}')
-        print()
-
-    sizes = [circuit.size for circuit in circuits]
+    sizes = circuits.set_sizes()
     sizes.sort(reverse=True)
-    print(f'Circuit sizes: {sizes}')
+    trace.info('Circuit sizes: {}', sizes)
     answer = math.prod(sizes[:3])
     rich.print(f'[bold green]Answer: {answer}[/bold green]')
+    return answer
 
 
 def part_2(points):
     rich.print('[bold red]== Part 2 ==[/bold red]')
     rich.print('Connect until there is one circuit.')
 
-    # Keep track of all points.
-    combinations = [Pair(a, b) for a, b in itertools.combinations(points, 2)]
-    print('Total points:', len(points))
-    print('Total combinations:', len(combinations))
-
-    combinations.sort(key=lambda p: p.distance)
-
-    circuits = []
-    lookup = {}
-
-    point_pool = set(points)
-    for i, pair in enumerate(combinations):
-        print(f'Processing pair {i}: {pair}')
-        print(f'  Circuit count: {len(circuits)}')
-        print('  Circuits:')
-        for circuit in circuits:
-            print(f'    {circuit.id}: {circuit.list_points()}')
-
-        print('  Lookups:')
-        for point in lookup:
-            print(f'    Dict: {point} -> Circuit {lookup[point].id}')
-
-        a_circuit = lookup.get(pair.a)
-        b_circuit = lookup.get(pair.b)
-        if a_circuit:
-            print(f'  {pair.a} IN {a_circuit}')
-        if b_circuit:
-            print(f'  {pair.b} IN {b_circuit}')
-
-        if a_circuit and b_circuit:
-            if a_circuit is b_circuit:
-                # Pair exists within same circuit, add it.
-                print(f'  SKIP: {pair} already in {a_circuit}')
-                a_circuit.add_pair(pair)
-
-            else:
-                # Pair exsist in two different circuits, merge them.
-                print(f'  MERGE: {pair} circuits {a_circuit.id} and {b_circuit.id}')
-                # Merge circuits, move b into a.
-                print("    Pairs in A:", len(a_circuit.pairs))
-                print("    Pairs in B:", len(b_circuit.pairs))
-                for p in b_circuit.pairs:
-                    # Add into a.
-                    a_circuit.add_pair(p)
-                    # update lookup
-                    lookup[p.a] = a_circuit
-                    lookup[p.b] = a_circuit
-                # Remove b circuit, it exists within a.
-                circuits.remove(b_circuit)
-
-                # Finally, add the new pair.
-                a_circuit.add_pair(pair)
-                print("    Pairs in A after merge:", len(a_circuit.pairs))
-
-        elif a_circuit or b_circuit:
-            # Add this pair to an existing circuit.
-            circuit = a_circuit or b_circuit
-            print(f'  JOIN: {pair} to {circuit}')
-            circuit.add_pair(pair)
-            lookup[pair.a] = circuit
-            lookup[pair.b] = circuit
-
-        else:
-            # Create a new circuit.
-            circuit = Circuit()
-            print(f'  NEW {pair} to {circuit}')
-            circuit.add_pair(pair)
-            lookup[pair.a] = circuit
-            lookup[pair.b] = circuit
-            circuits.append(circuit)
-
-        # Pair has been connected in some way, remove from point pool.
-        try:
-            point_pool.remove(pair.a)
-        except KeyError:
-            pass
-        try:
-            point_pool.remove(pair.b)
-        except KeyError:
-            pass
-
-        # When the point pool is empty AND the circuit count is 1, we're done.
-        if not point_pool and len(circuits) == 1:
-            print('All points connected into a single circuit.')
+    trace.info('Total points: {}', len(points))
+    circuits = DisjointSet(len(points))
+
+    # Kruskal: take pairs closest first, keep the ones that join two circuits.
+    for distance, a, b in closest_pairs(points):
+        if not circuits.union(a, b):
+            continue
+        trace.debug('  MERGE: {} <-> {}, {} circuits left', points[a], points[b], circuits.count)
+
+        if circuits.count == 1:
+            trace.info('All points connected into a single circuit.')
             # Which means we just connected the last circuit.
             # So we need to print out the a.x and b.x product.
-            answer = pair.a.x * pair.b.x
+            answer = points[a].x * points[b].x
             rich.print(f'[bold green]Answer: {answer}[/bold green]')
-            return
+            return answer
 
 
 class Point:
@@ -239,57 +137,22 @@ class Point:
         return self.__str__()
 
 
-class Pair:
-    def __init__(self, a: Point, b: Point):
-        self.a = a
-        self.b = b
-        self.distance = self._eclidean_distance()
+def parse(data):
+    return ([Point(str) for str in data],)
 
-    def __str__(self):
-        return f'{self.a} <-> {self.b}: {self.distance:.3f}'
-
-    def __repr__(self):
-        return self.__str__()
-
-    def _eclidean_distance(self):
-        return math.sqrt(
-            (self.a.x - self.b.x) ** 2 +
-            (self.a.y - self.b.y) ** 2 +
-            (self.a.z - self.b.z) ** 2
-        )
 
+# Sizes for `doit scale`, in junction boxes.
+SCALE_SIZES = (250, 500, 1000, 2000, 4000)
 
-class Circuit:
-    circuit_counter = 0
-    def __init__(self):
-        self.pairs = []
-        self.id = Circuit.circuit_counter
-        Circuit.circuit_counter += 1
 
-    def __str__(self):
-        return f'Circuit {self.id}: {self.size}'
-
-    def __repr__(self):
-        return self.__str__()
-
-    @property
-    def points(self):
-        points = set()
-        for pair in self.pairs:
-            points.add(pair.a)
-            points.add(pair.b)
-        return list(points)
-
-    @property
-    def size(self):
-        return len(self.points)
-
-    def add_pair(self, pair: Pair):
-        self.pairs.append(pair)
+def generate(size, rng):
+    """size junction boxes scattered through a cube like the real input's."""
+    span = 100_000
+    return [
+        f'{rng.randrange(span)},{rng.randrange(span)},{rng.randrange(span)}'
+        for _ in range(size)
+    ]
 
-    def list_points(self):
-        points = ', '.join(str(p) for p in self.points)
-        return points
 
 def main(data):
     _data = [
@@ -314,7 +177,7 @@ def main(data):
         '984,92,344',
         '425,690,689',
     ]
-    points = [Point(str) for str in data]
+    points, = parse(data)
     # part_1(points)
     part_2(points)
 
@@ -7,10 +7,11 @@ import math
 import pathlib
 
 import rich
-from rich.progress import track
+
+from aoclib import lazy
 
 # Cheating?
-import shapely
+shapely = lazy.module('shapely')
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -37,6 +38,7 @@ def part_1(tiles):
 
     rich.print(f'Found {len(rects)} rectangles.')
     rich.print(f'Largest rectangle: {rects[0]}')
+    return rects[0].area
 
 
 def part_2(tiles):
@@ -56,7 +58,7 @@ def part_2(tiles):
         if polygon.contains(rect.polygon):
             rich.print(f'Found box within polygon with area: {rect.area}')
             # Stop at the first (largest) one.
-            break
+            return rect.area
 
 
 class Rect:
@@ -110,6 +112,33 @@ class Tile:
         return f'{self.color.title()} Tile({self.x}, {self.y})'
 
 
+def parse(data):
+    return ([Tile(s) for s in data],)
+
+
+# Sizes for `doit scale`, in red tiles.
+SCALE_SIZES = (50, 100, 200, 400)
+
+
+def generate(size, rng):
+    """About size red tiles around a stepped histogram.
+
+    A flat bottom edge, then the top walked right to left one column at a
+    time, so every tile shares a row or column with the next like the real
+    input's loop.
+    """
+    columns = max(1, (size - 2) // 2)
+    span = max(100_000, 10 * size)
+    xs = sorted(rng.sample(range(1, span), columns + 1))
+    heights = [rng.randrange(span // 100, span) for _ in range(columns)]
+
+    tiles = [(xs[0], 0), (xs[-1], 0)]
+    for column in range(columns - 1, -1, -1):
+        tiles.append((xs[column + 1], heights[column]))
+        tiles.append((xs[column], heights[column]))
+    return [f'{x},{y}' for x, y in tiles]
+
+
 def main(data):
     _data = [
         '7,1',
@@ -122,7 +151,7 @@ def main(data):
         '7,3',
     ]
 
-    tiles = [Tile(s) for s in data]
+    tiles, = parse(data)
     part_1(tiles)
     part_2(tiles)
 
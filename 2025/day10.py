@@ -6,16 +6,26 @@ import logging
 import math
 import pathlib
 
-import pulp
 import rich
-from rich.progress import track
+
+from aoclib import checkpoint, counters, lazy, limits, trace
+
+
+# Only part_2_solution_2 needs the solver.
+pulp = lazy.module('pulp')
 
 
 logging.basicConfig(level=logging.ERROR, format='%(message)s')
 log = logging.getLogger('aoc')
 
-def noop(*args, **kwargs):
-    pass
+
+def visual(state):
+    return ''.join('#' if s else '.' for s in state)
+
+
+def visual_joltage(state):
+    return ','.join(str(j) for j in state)
+
 
 def load_data():
     stem = pathlib.Path(__file__).stem
@@ -30,13 +40,15 @@ def part_1(machines):
     rich.print('[bold red]== Part 1 ==[/bold red]')
     rich.print('State machine simulation.  Breadth first search.')
 
-    og_print = rich.print
-    answer = 0
-    for machine in machines:
+    # Machines already solved, and their total, if resuming.
+    done, answer = checkpoint.load('machines') or (0, 0)
+    for index, machine in enumerate(machines):
+        if index < done:
+            continue
+        if checkpoint.due('machines'):
+            checkpoint.save('machines', (index, answer))
         rich.print(f'[bold blue]Machine: {machine}[/bold blue]')
-        rich.print = noop
         count = machine.part_1_solution()
-        rich.print = og_print
         if count is None:
             rich.print('  [bold red]No solution found.[/bold red]')
             continue
@@ -45,20 +57,18 @@ def part_1(machines):
         print()
 
     rich.print(f'[bold green]Part 1 Answer[/bold green]: [bold]{answer}[/bold]')
+    return answer
 
 
 def part_2(machines):
     rich.print('[bold red]== Part 2 ==[/bold red]')
     rich.print('Press buttons until final joltages reached.')
 
-    og_print = rich.print
     answer = 0
     for machine in machines:
         rich.print(f'[bold blue]Machine: {machine}[/bold blue]')
 
-        rich.print = noop
         presses = machine.part_2_solution_2()
-        rich.print = og_print
 
         if presses is None:
             rich.print('  [bold red]No solution found.[/bold red]')
@@ -68,6 +78,7 @@ def part_2(machines):
         answer += presses
 
     rich.print(f'[bold green]Part 2 Answer[/bold green]: [bold]{answer}[/bold]')
+    return answer
 
 # Constants / Defines
 ON = True
@@ -140,35 +151,50 @@ class Machine:
             state: 0
         }
         next_states = list(states.items())
+
+        # Each machine's search is saved on its own, at the start of a level.
+        key = ('lights', self.rules)
+        resumed = checkpoint.load(key)
+        if resumed is not None:
+            states, next_states = resumed
+
         while True:
+            if checkpoint.due(key):
+                checkpoint.save(key, (states, next_states))
             # Press buttons until we reach final state.
-            rich.print('Exploring next states:')
-            for state, count in next_states:
-                visual_state = ''.join('#' if s else '.' for s in state)
-                rich.print(f'  State: {visual_state} after {count} presses.')
+            if trace.DEBUG:
+                trace.debug('Exploring next states:')
+                for state, count in next_states:
+                    trace.debug('  State: {} after {} presses.', visual(state), count)
+            if counters.ENABLED:
+                counters.observe('frontier', len(next_states))
             new_states = {}
             for state, count in next_states:
-                visual_state = ''.join('#' if s else '.' for s in state)
-                rich.print(f'At state: {visual_state} after {count} presses.')
+                if trace.TRACE:
+                    trace.trace('At state: {} after {} presses.', visual(state), count)
                 for button in self.buttons:
                     new_state = button.press(state)
-                    rich.print(f'  {button} {visual_state}')
-                    new_visual_state = ''.join('#' if s else '.' for s in new_state)
-                    rich.print(f'    New state: {new_visual_state}')
+                    if trace.TRACE:
+                        trace.trace('  {} {}', button, visual(state))
+                        trace.trace('    New state: {}', visual(new_state))
                     # If we reach final state, return the count + 1.
                     if new_state == self.final_state:
-                        rich.print('    [bold red]FINAL STATE REACHED![/bold red]')
+                        trace.debug('    FINAL STATE REACHED!')
+                        if counters.ENABLED:
+                            counters.add('states', len(states))
                         return count + 1
 
                     if new_state in states:
-                        previous_count = states[new_state]
-                        rich.print(f'    State seen: {new_visual_state} after {previous_count} presses.  Current count: {count + 1}.')
+                        if trace.TRACE:
+                            trace.trace('    State seen: {} after {} presses.  Current count: {}.',
+                                        visual(new_state), states[new_state], count + 1)
                         # The new state is already in the states dict.
                         # No need to add it again.
                         continue
 
                     # We have a new state
-                    rich.print(f'    [bold green]New state discovered: {new_visual_state}[/bold green]')
+                    if trace.TRACE:
+                        trace.trace('    New state discovered: {}', visual(new_state))
                     states[new_state] = count + 1
                     new_states[new_state] = count + 1
                     # Indicate we found new state, and are not looping.
@@ -176,14 +202,15 @@ class Machine:
 
             # If no button presses created new state, we are looping.
             if not new_states:
-                rich.print('After every button press, we found no new states.')
+                trace.debug('After every button press, we found no new states.')
+                if counters.ENABLED:
+                    counters.add('states', len(states))
                 # We looped through all buttons and found no new states.
                 # This means we are done.
                 return
 
             # Prepare the next states to explore.
             next_states = list(new_states.items())
-            rich.print()
 
     def part_2_solution(self):
         # Breadth first, but keep 
@@ -195,33 +222,43 @@ class Machine:
         }
 
         next_states = list(joltages.items())
+
+        key = ('joltages', self.rules)
+        resumed = checkpoint.load(key)
+        if resumed is not None:
+            joltages, next_states = resumed
+
         while True:
+            if checkpoint.due(key):
+                checkpoint.save(key, (joltages, next_states))
             # Press buttons until we reach final state.
-            rich.print('Exploring next states:')
-            for state, count in next_states:
-                visual_state = ','.join(str(j) for j in state)
-                rich.print(f'  State: {visual_state} after {count} presses.')
+            if trace.DEBUG:
+                trace.debug('Exploring next states:')
+                for state, count in next_states:
+                    trace.debug('  State: {} after {} presses.', visual_joltage(state), count)
 
             new_joltages = {}
             for state, count in next_states:
-                visual_state = ','.join(str(j) for j in state)
-                rich.print(f'State: {visual_state}, {count} presses.')
+                # This search rarely finishes; give up when the runner says so.
+                limits.check()
+                if trace.TRACE:
+                    trace.trace('State: {}, {} presses.', visual_joltage(state), count)
 
                 for button in self.buttons:
                     new_joltage = button.jolt(state)
-                    rich.print(f'  {button} {visual_state}')
-
-                    new_visual_state = ','.join(str(j) for j in new_joltage)
-                    rich.print(f'    New state: {new_visual_state}')
+                    if trace.TRACE:
+                        trace.trace('  {} {}', button, visual_joltage(state))
+                        trace.trace('    New state: {}', visual_joltage(new_joltage))
 
                     # If we reach final state, return the count + 1.
                     if new_joltage == self.final_joltages:
-                        rich.print('    [bold red]FINAL JOLTAGE REACHED![/bold red]')
+                        trace.debug('    FINAL JOLTAGE REACHED!')
                         return count + 1
 
                     if new_joltage in joltages:
-                        previous_count = joltages[new_joltage]
-                        rich.print(f'    Joltage seen: {new_visual_state} after {previous_count} presses.  Current count: {count + 1}.')
+                        if trace.TRACE:
+                            trace.trace('    Joltage seen: {} after {} presses.  Current count: {}.',
+                                        visual_joltage(new_joltage), joltages[new_joltage], count + 1)
                         # The new state is already in the states dict.
                         # No need to add it again.
                         continue
@@ -230,40 +267,41 @@ class Machine:
                     discard = False
                     for new_j, final_j in zip(new_joltage, self.final_joltages):
                         if new_j > final_j:
-                            rich.print(f'    [bold yellow]Joltage {new_j} exceeds final {final_j}.  Discarding state {new_visual_state}.[/bold yellow]')
+                            if trace.TRACE:
+                                trace.trace('    Joltage {} exceeds final {}.  Discarding state {}.',
+                                            new_j, final_j, visual_joltage(new_joltage))
                             discard = True
                             break
                     if discard:
                         continue
 
                     # We have a new state, it's legal, add it to the list.
-                    rich.print(f'    [bold green]New state discovered: {new_visual_state}[/bold green]')
+                    if trace.TRACE:
+                        trace.trace('    New state discovered: {}', visual_joltage(new_joltage))
                     joltages[new_joltage] = count + 1
                     new_joltages[new_joltage] = count + 1
                     # Indicate we found new state, and are not looping.
 
             # If no button presses created new state, we are looping.
             if not new_joltages:
-                rich.print('After every button press, we found no new joltage states.')
+                trace.debug('After every button press, we found no new joltage states.')
                 # We looped through all buttons and found no new states.
                 # This means we are done.
                 return
 
             # Prepare the next states to explore.
             next_states = list(new_joltages.items())
-            rich.print()
 
     def part_2_solution_2(self):
         # Use pulp, a linear programming tool.
         # Define buttons as vectors.
         buttons = []
         for button in self.buttons:
-            rich.print(f'Button: {button}')
             adder = [
                 1 if i in button.targets else 0
                 for i in range(len(self.final_joltages))
             ]
-            rich.print(f'Adder: {adder}')
+            trace.debug('Button: {}  Adder: {}', button, adder)
             buttons.append(adder)
 
         # Define the problem.
@@ -295,13 +333,17 @@ class Machine:
         return pulp.value(problem.objective)
 
 
+def parse(data):
+    return ([Machine(manual) for manual in data],)
+
+
 def main(data):
     _data = [
         '[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}',  # 2 preess, 4 5
         '[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}',  # 3 presses: 2 3 4
         '[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}',  # 2 presses: 1 2
     ]
-    machines = [Machine(manual) for manual in data]
+    machines, = parse(data)
     # part_1(machines)
     part_2(machines)
 
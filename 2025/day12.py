@@ -6,7 +6,11 @@ import math
 import pathlib
 
 import rich
-import shapely
+
+from aoclib import lazy
+
+
+shapely = lazy.module('shapely')
 
 
 logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -55,9 +59,10 @@ def part_1(presents, areas):
     rich.print(f'  Definitely fit: {len(definitely_fit)}')
     rich.print(f'  Might fit:      {len(might_fit)}')
     rich.print(f'  Never fit:      {len(never_fit)}')
+    return len(definitely_fit)
 
 
-def part_2(data):
+def part_2(presents, areas):
     rich.print('[bold red]== Part 2 ==[/bold red]')
     rich.print('description')
     pass
@@ -162,6 +167,23 @@ class Area:
         return f'Area({self.width}x{self.height}, presents={self.presents})'
 
 
+def parse(data):
+    # We have 6 presents, so we know where to get data.
+    presents = []
+    for i in range(6):
+        row_start = i * 5
+        present_id = int(data[row_start].strip(':'))
+        layout = data[row_start + 1:row_start + 4]
+        present = Present(present_id, layout)
+        presents.append(present)
+
+    areas = [
+        Area(area_def)
+        for area_def in data[30:]
+    ]
+    return presents, areas
+
+
 def main(data):
     _data = [
         '0:',
@@ -199,20 +221,7 @@ def main(data):
         '12x5: 1 0 1 0 3 2',
     ]
 
-    # We have 6 presents, so we know where to get data.
-    presents = []
-    for i in range(6):
-        row_start = i * 5
-        present_id = int(data[row_start].strip(':'))
-        layout = data[row_start + 1:row_start + 4]
-        present = Present(present_id, layout)
-        presents.append(present)
-
-    areas = [
-        Area(area_def)
-        for area_def in data[30:]
-    ]
-
+    presents, areas = parse(data)
     part_1(presents, areas)
     # part_2(presents, areas)
 